@@ -0,0 +1,264 @@
+"""
+Loan Sales Prediction - Model artifact formats
+
+Models are stored in the most compact format their family supports:
+
+    tree         tree ensembles flattened to memory-mapped node arrays (.tree)
+    xgboost      XGBoost booster in UBJSON (.ubj)
+    lightgbm     LightGBM text model (.txt)
+    catboost     CatBoost binary model (.cbm)
+    linear       coefficient vector + intercept (.npz)
+    kalman       ARIMA/SARIMAX final state + system matrices, forecast
+                 with NumPy (.kalman)
+    statespace   ARIMA/SARIMAX spec, fitted params and data (.npz)
+    hwforecast   Holt-Winters final level/trend/seasonal components,
+                 closed-form forecast (.hw)
+    holtwinters  Holt-Winters spec, fitted params and data (.npz)
+    joblib       other sklearn estimators, arrays memory-mapped (.joblib)
+    pickle       anything else (.pkl)
+
+Libraries are imported inside the loaders, so loading an artifact only
+pulls in its own model family.
+"""
+
+import json
+import pickle
+import re
+from pathlib import Path
+
+import numpy as np
+
+from app import model_store, tree_engine
+from app.kalman_engine import KalmanForecaster
+from app.smoothing_engine import HoltWintersForecaster
+
+FORMAT_SUFFIXES = {
+    'tree': '.tree',
+    'xgboost': '.ubj',
+    'lightgbm': '.txt',
+    'catboost': '.cbm',
+    'linear': '.npz',
+    'kalman': '.kalman',
+    'statespace': '.npz',
+    'hwforecast': '.hw',
+    'holtwinters': '.npz',
+    'joblib': '.joblib',
+    'pickle': '.pkl'
+}
+
+# Formats whose loader imports a model library (pickle and joblib import
+# whatever the stored object's classes need); the rest only read NumPy arrays
+IMPORTING_FORMATS = frozenset({
+    'pickle', 'joblib', 'xgboost', 'lightgbm', 'catboost', 'statespace', 'holtwinters'
+})
+
+LINEAR_MODELS = ('Ridge', 'Lasso', 'ElasticNet', 'LinearRegression')
+
+
+class LinearArtifact:
+    """Linear regression model reduced to its coefficients"""
+
+    def __init__(self, coef, intercept):
+        self.coef_ = np.asarray(coef, dtype=np.float64).reshape(-1)
+        self.intercept_ = float(intercept)
+
+    def predict(self, X):
+        # Same expression as LinearStack, so fused and single predictions agree exactly
+        return (np.asarray(X, dtype=np.float64) * self.coef_).sum(axis=-1) + self.intercept_
+
+
+def candidate_formats(model) -> list:
+    """Artifact formats that can store a trained model, most preferred first"""
+    name = type(model).__name__
+    module = type(model).__module__
+    formats = ['tree'] if tree_engine.supports(model) else []
+
+    if name == 'XGBRegressor':
+        return formats + ['xgboost']
+    if name == 'LGBMRegressor':
+        return formats + ['lightgbm']
+    if name == 'CatBoostRegressor':
+        return formats + ['catboost']
+    if module.startswith('sklearn.linear_model') and name in LINEAR_MODELS:
+        return formats + ['linear']
+    if module.startswith('statsmodels'):
+        model_class = type(getattr(model, 'model', None)).__name__
+        if model_class in ('ARIMA', 'SARIMAX'):
+            return formats + ['kalman', 'statespace']
+        if model_class == 'ExponentialSmoothing':
+            return formats + ['hwforecast', 'holtwinters']
+    if module.startswith('sklearn.'):
+        return formats + ['joblib']
+    return formats + ['pickle']
+
+
+def detect_format(model) -> str:
+    """Preferred artifact format for a trained model ('pickle' if none applies)"""
+    return candidate_formats(model)[0]
+
+
+def save_artifact(model, output_dir: Path, stem: str, fmt: str = None) -> tuple:
+    """Write `model` in `fmt` (default: its preferred format)
+
+    Returns:
+        Tuple (filename, format)
+    """
+    fmt = fmt or detect_format(model)
+    filename = stem + FORMAT_SUFFIXES[fmt]
+    path = Path(output_dir) / filename
+
+    if fmt == 'tree':
+        tree_engine.flatten(model, stem).save(path)
+    elif fmt == 'xgboost':
+        model.save_model(str(path))
+    elif fmt == 'lightgbm':
+        # The training-parameter block is not needed to predict and makes
+        # the file unreadable by older LightGBM releases
+        model_str = re.sub(
+            r'\nparameters:\n.*?\nend of parameters\n', '\n',
+            model.booster_.model_to_string(), flags=re.S
+        )
+        path.write_text(model_str, encoding='utf-8')
+    elif fmt == 'catboost':
+        model.save_model(str(path), format='cbm')
+    elif fmt == 'linear':
+        np.savez(path, coef=np.ravel(model.coef_), intercept=np.float64(model.intercept_))
+    elif fmt == 'kalman':
+        KalmanForecaster.from_results(model).save(path)
+    elif fmt == 'statespace':
+        _save_statespace(model, path)
+    elif fmt == 'hwforecast':
+        HoltWintersForecaster.from_results(model).save(path)
+    elif fmt == 'holtwinters':
+        _save_holtwinters(model, path)
+    elif fmt == 'joblib':
+        model_store.dump_model(model, path)
+    else:
+        with open(path, 'wb') as f:
+            pickle.dump(model, f)
+
+    return filename, fmt
+
+
+def load_artifact(path: Path, fmt: str = 'pickle'):
+    """Load an artifact written by `save_artifact` (or a legacy pickle)"""
+    if fmt == 'pickle':
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+
+    if fmt == 'tree':
+        return tree_engine.TreeEnsemble.load(path)
+
+    if fmt == 'xgboost':
+        from xgboost import XGBRegressor
+        model = XGBRegressor()
+        model.load_model(str(path))
+        return model
+
+    if fmt == 'lightgbm':
+        from lightgbm import Booster
+        return Booster(model_file=str(path))
+
+    if fmt == 'catboost':
+        from catboost import CatBoostRegressor
+        model = CatBoostRegressor()
+        model.load_model(str(path), format='cbm')
+        return model
+
+    if fmt == 'linear':
+        with np.load(path) as data:
+            return LinearArtifact(data['coef'], data['intercept'])
+
+    if fmt == 'kalman':
+        return KalmanForecaster.load(path)
+
+    if fmt == 'statespace':
+        return _load_statespace(path)
+
+    if fmt == 'hwforecast':
+        return HoltWintersForecaster.load(path)
+
+    if fmt == 'holtwinters':
+        return _load_holtwinters(path)
+
+    if fmt == 'joblib':
+        return model_store.load_model(path)
+
+    raise ValueError(f"Unknown artifact format: {fmt}")
+
+
+def _save_statespace(results, path: Path):
+    model = results.model
+    spec = {'class': type(model).__name__, 'kwargs': model._get_init_kwds()}
+    arrays = {
+        'spec': np.array(json.dumps(spec)),
+        'params': np.asarray(results.params, dtype=np.float64),
+        'endog': np.asarray(model.endog, dtype=np.float64).reshape(-1)
+    }
+    if model.exog is not None:
+        arrays['exog'] = np.asarray(model.exog, dtype=np.float64)
+    np.savez(path, **arrays)
+
+
+def _load_statespace(path: Path):
+    with np.load(path) as data:
+        spec = json.loads(str(data['spec']))
+        params = data['params']
+        endog = data['endog']
+        exog = data['exog'] if 'exog' in data.files else None
+
+    if spec['class'] == 'ARIMA':
+        from statsmodels.tsa.arima.model import ARIMA as model_class
+    else:
+        from statsmodels.tsa.statespace.sarimax import SARIMAX as model_class
+
+    # Re-running the Kalman filter with the fitted params restores the state
+    model = model_class(endog, exog=exog, **spec['kwargs'])
+    return model.filter(params)
+
+
+def _save_holtwinters(results, path: Path):
+    model = results.model
+    params = results.params
+    spec = {
+        'trend': model.trend,
+        'damped_trend': bool(model.damped_trend),
+        'seasonal': model.seasonal,
+        'seasonal_periods': model.seasonal_periods,
+        'smoothing': {
+            key: float(params[key])
+            for key in ('smoothing_level', 'smoothing_trend', 'smoothing_seasonal', 'damping_trend')
+            if params.get(key) is not None and not np.isnan(params[key])
+        },
+        'initial_level': float(params['initial_level']),
+        'initial_trend': None if np.isnan(params['initial_trend']) else float(params['initial_trend'])
+    }
+    np.savez(
+        path,
+        spec=np.array(json.dumps(spec)),
+        initial_seasons=np.asarray(params['initial_seasons'], dtype=np.float64),
+        endog=np.asarray(model.endog, dtype=np.float64).reshape(-1)
+    )
+
+
+def _load_holtwinters(path: Path):
+    with np.load(path) as data:
+        spec = json.loads(str(data['spec']))
+        initial_seasons = data['initial_seasons']
+        endog = data['endog']
+
+    from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
+    # Known initial values + fixed smoothing params reproduce the fitted model
+    model = ExponentialSmoothing(
+        endog,
+        trend=spec['trend'],
+        damped_trend=spec['damped_trend'],
+        seasonal=spec['seasonal'],
+        seasonal_periods=spec['seasonal_periods'],
+        initialization_method='known',
+        initial_level=spec['initial_level'],
+        initial_trend=spec['initial_trend'],
+        initial_seasonal=initial_seasons if spec['seasonal'] else None
+    )
+    return model.fit(optimized=False, **spec['smoothing'])
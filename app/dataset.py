@@ -0,0 +1,240 @@
+"""
+Loan Sales Prediction - In-memory dataset snapshot
+"""
+
+import csv
+import hashlib
+import threading
+from pathlib import Path
+
+import numpy as np
+
+TARGET = 'Nağd_pul_kredit_satışı'
+PCA_COLUMNS = ['PC1', 'PC2', 'PC3', 'PC4', 'PC5', 'PC6']
+
+
+def _readonly(array: np.ndarray) -> np.ndarray:
+    array.setflags(write=False)
+    return array
+
+
+def read_columns(path: Path, columns) -> np.ndarray:
+    """Read numeric CSV columns into a float matrix (n_rows, len(columns))
+
+    A plain csv parse instead of pandas keeps pandas out of the serving
+    process; empty cells read as NaN.
+    """
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        positions = [header.index(column) for column in columns]
+        rows = [
+            [float(row[i]) if i < len(row) and row[i].strip() else np.nan for i in positions]
+            for row in reader if row
+        ]
+    return np.array(rows, dtype=np.float64).reshape(-1, len(columns))
+
+
+class DatasetSnapshot:
+    """Immutable, typed view of the prediction-time datasets
+
+    `years`, `quarters` and `sales` cover every row of ml_ready_data.csv
+    (including trailing quarters whose sales are not published yet), while
+    the `hist_*` arrays only hold complete observations. `pca` is the
+    PC1-PC6 matrix from pca_features.csv, row-aligned with ml_ready_data.
+    """
+
+    def __init__(self, version: str, years, quarters, sales, pca):
+        self.version = version
+        self.years = _readonly(np.asarray(years, dtype=np.int64))
+        self.quarters = _readonly(np.asarray(quarters, dtype=np.int64))
+        self.sales = _readonly(np.asarray(sales, dtype=np.float64))
+        self.pca = _readonly(np.asarray(pca, dtype=np.float64))
+
+        complete = ~np.isnan(self.sales)
+        self.hist_years = _readonly(self.years[complete])
+        self.hist_quarters = _readonly(self.quarters[complete])
+        self.hist_sales = _readonly(self.sales[complete])
+
+        # Fitted once per dataset version
+        self.features = FeatureExtrapolator(self.years, self.quarters, self.pca)
+        self.history = SalesIndex(self.hist_years, self.hist_quarters, self.hist_sales)
+
+    @property
+    def n_observations(self) -> int:
+        """Number of complete (Year, Quarter, sales) observations"""
+        return len(self.hist_sales)
+
+    @classmethod
+    def from_files(cls, raw_path: Path, pca_path: Path, version: str):
+        """Parse ml_ready_data.csv and pca_features.csv into a snapshot"""
+        raw = read_columns(raw_path, ['Year', 'Quarter', TARGET])
+        pca = read_columns(pca_path, PCA_COLUMNS)
+
+        # Rows without a Year/Quarter cannot be addressed by any request
+        raw = raw[~np.isnan(raw[:, :2]).any(axis=1)]
+
+        return cls(
+            version=version,
+            years=raw[:, 0],
+            quarters=raw[:, 1],
+            sales=raw[:, 2],
+            pca=pca
+        )
+
+
+class FeatureExtrapolator:
+    """PCA feature rows for any (year, quarter), fitted once per snapshot
+
+    Historical quarters use their actual PCA row. Future quarters start from
+    the base row (second-to-last PCA row), add the per-component linear trend
+    of the last 8 rows times the number of quarters ahead, and add half of
+    the quarter's seasonal deviation from the overall mean. Anything else
+    falls back to the base row.
+    """
+
+    LOOKBACK = 8
+    SEASONAL_WEIGHT = 0.5
+
+    def __init__(self, years, quarters, pca):
+        n_pca = len(pca)
+
+        # -2 because the last row might be incomplete
+        self.last_year = int(years[-2])
+        self.last_quarter = int(quarters[-2])
+        self.base = _readonly(pca[-2].copy())
+
+        # Linear trend (slope) of each component over the recent window
+        recent = pca[-min(self.LOOKBACK, n_pca):]
+        self.slopes = _readonly(np.polyfit(np.arange(len(recent)), recent, 1)[0])
+
+        # Seasonal adjustment per quarter (row 0 unused); quarters with fewer
+        # than two PCA rows get no adjustment
+        overall_mean = pca.mean(axis=0)
+        seasonal = np.zeros((5, pca.shape[1]))
+        for quarter in range(1, 5):
+            rows = np.flatnonzero(quarters == quarter)
+            rows = rows[rows < n_pca]
+            if len(rows) >= 2:
+                seasonal[quarter] = pca[rows].mean(axis=0) - overall_mean
+        self.seasonal = _readonly(seasonal * self.SEASONAL_WEIGHT)
+
+        # First ml_ready_data row per period that also has a PCA row
+        periods = years * 4 + (quarters - 1)
+        unique_periods, first_rows = np.unique(periods, return_index=True)
+        has_pca = first_rows < n_pca
+        self._periods = _readonly(unique_periods[has_pca])
+        self._pca = pca
+        self._rows = _readonly(first_rows[has_pca])
+
+    def rows(self, years, quarters) -> np.ndarray:
+        """Feature matrix (n, 6) for the given periods in one vectorized pass"""
+        years = np.asarray(years, dtype=np.int64).reshape(-1)
+        quarters = np.asarray(quarters, dtype=np.int64).reshape(-1)
+        valid_quarter = (quarters >= 1) & (quarters <= 4)
+
+        quarters_ahead = (years - self.last_year) * 4 + (quarters - self.last_quarter)
+        extrapolated = self.base + self.slopes * quarters_ahead[:, None]
+        extrapolated += self.seasonal[np.where(valid_quarter, quarters, 0)]
+        features = np.where((quarters_ahead > 0)[:, None], extrapolated, self.base)
+
+        # Historical periods use their actual PCA row
+        if len(self._periods):
+            periods = years * 4 + (quarters - 1)
+            position = np.minimum(np.searchsorted(self._periods, periods), len(self._periods) - 1)
+            actual = valid_quarter & (self._periods[position] == periods)
+            features[actual] = self._pca[self._rows[position[actual]]]
+
+        return features
+
+
+class SalesIndex:
+    """Dense (year, quarter) -> sales index over complete observations
+
+    Sales are laid out on a contiguous quarterly grid so lookups for any
+    number of periods are a single fancy-indexing operation. Missing
+    periods (and invalid quarters) read as NaN.
+    """
+
+    def __init__(self, years, quarters, sales):
+        valid = (quarters >= 1) & (quarters <= 4)
+        periods = years[valid] * 4 + (quarters[valid] - 1)
+
+        self.start = int(periods.min()) if len(periods) else 0
+        grid = np.full(int(periods.max()) - self.start + 1 if len(periods) else 0, np.nan)
+        # Assign in reverse so the first row for a duplicated period wins
+        grid[periods[::-1] - self.start] = sales[valid][::-1]
+        self.grid = _readonly(grid)
+
+    def lookup(self, years, quarters) -> np.ndarray:
+        """Sales for each (year, quarter) pair; arrays broadcast together"""
+        years = np.asarray(years, dtype=np.int64)
+        quarters = np.asarray(quarters, dtype=np.int64)
+        offsets = years * 4 + (quarters - 1) - self.start
+        inside = (quarters >= 1) & (quarters <= 4) & (offsets >= 0) & (offsets < len(self.grid))
+        return np.where(inside, self.grid[np.where(inside, offsets, 0)] if len(self.grid) else np.nan, np.nan)
+
+    def same_quarter(self, years, quarters, years_back: int) -> np.ndarray:
+        """Sales for the same quarter in each of the previous `years_back` years
+
+        Returns:
+            Array (n, years_back); column i holds year - (i + 1)
+        """
+        years = np.asarray(years, dtype=np.int64).reshape(-1, 1)
+        quarters = np.asarray(quarters, dtype=np.int64).reshape(-1, 1)
+        return self.lookup(years - np.arange(1, years_back + 1), quarters)
+
+
+class DatasetStore:
+    """Holds the current DatasetSnapshot and swaps it when the files change
+
+    File stats are checked on every access; the content hash is only
+    recomputed when a stat changes, and a new snapshot is only built (and
+    atomically published) when the hash differs from the current version.
+    """
+
+    def __init__(self, data_dir: Path):
+        self.raw_path = data_dir / 'ml_ready_data.csv'
+        self.pca_path = data_dir / 'pca_features.csv'
+        self._snapshot = None
+        self._signature = None
+        self._lock = threading.Lock()
+
+    def _file_signature(self):
+        stats = [path.stat() for path in (self.raw_path, self.pca_path)]
+        return tuple((stat.st_mtime_ns, stat.st_size) for stat in stats)
+
+    def _content_hash(self) -> str:
+        digest = hashlib.sha256()
+        for path in (self.raw_path, self.pca_path):
+            digest.update(path.read_bytes())
+        return digest.hexdigest()[:16]
+
+    def get(self) -> DatasetSnapshot:
+        """Return the current snapshot, reloading it if the files changed"""
+        signature = self._file_signature()
+        snapshot = self._snapshot
+        if snapshot is not None and signature == self._signature:
+            return snapshot
+
+        with self._lock:
+            if self._snapshot is not None and signature == self._signature:
+                return self._snapshot
+
+            version = self._content_hash()
+            if self._snapshot is None or version != self._snapshot.version:
+                self._snapshot = DatasetSnapshot.from_files(self.raw_path, self.pca_path, version)
+            self._signature = signature
+            return self._snapshot
+
+
+def quarter_range(first_year: int, first_quarter: int, last_year: int, last_quarter: int):
+    """Consecutive (year, quarter) periods between two quarters, inclusive
+
+    Returns:
+        Tuple of int64 arrays (years, quarters); empty if `last` precedes `first`
+    """
+    start = first_year * 4 + (first_quarter - 1)
+    stop = last_year * 4 + (last_quarter - 1)
+    periods = np.arange(start, stop + 1, dtype=np.int64)
+    return periods // 4, periods % 4 + 1
@@ -0,0 +1,79 @@
+"""
+Loan Sales Prediction - Prefix-reusing time series forecast memo
+"""
+
+import threading
+
+import numpy as np
+
+
+class ForecastMemo:
+    """Longest forecast trajectory computed so far, per time series model
+
+    A forecast of `steps=N` contains every shorter horizon, so requests up
+    to the memoized length are answered by slicing. Longer requests recompute
+    the trajectory (at least doubling its length to amortize growth, but
+    never past `max_steps`) and replace the entry. Requests longer than
+    `max_steps` are computed without being memoized. Entries carry a token
+    (dataset version and artifact version) and are discarded when it changes.
+    """
+
+    def __init__(self, max_steps: int = 400):
+        self.max_steps = max_steps
+        self.hits = 0
+        self.extensions = 0
+        self.uncached = 0
+        self._entries = {}  # model name -> (token, trajectory)
+        self._lock = threading.Lock()
+
+    def get(self, model_name: str, token, steps: int, compute):
+        """Trajectory of length `steps` for `model_name`
+
+        Args:
+            token: Version of the inputs the trajectory depends on
+            compute: Callable `compute(steps) -> trajectory` used
+                when the memo is missing, stale or too short
+
+        Returns:
+            Read-only float array of length `steps`
+        """
+        with self._lock:
+            entry = self._entries.get(model_name)
+            if entry is not None and entry[0] == token and len(entry[1]) >= steps:
+                self.hits += 1
+                return entry[1][:steps]
+            current = len(entry[1]) if entry is not None and entry[0] == token else 0
+            if steps > self.max_steps:
+                self.uncached += 1
+
+        if steps > self.max_steps:
+            return np.asarray(compute(steps), dtype=np.float64).reshape(-1)
+
+        horizon = min(max(steps, 2 * current), self.max_steps)
+        trajectory = np.asarray(compute(horizon), dtype=np.float64).reshape(-1)
+        trajectory.setflags(write=False)
+
+        with self._lock:
+            self.extensions += 1
+            entry = self._entries.get(model_name)
+            # Keep whichever valid trajectory is longer if another thread raced us
+            if entry is None or entry[0] != token or len(entry[1]) < len(trajectory):
+                self._entries[model_name] = (token, trajectory)
+
+        return trajectory[:steps]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Memoized horizon per model, the step limit, and hit/extension/uncached counts"""
+        with self._lock:
+            return {
+                'models': len(self._entries),
+                'horizons': {name: len(entry[1]) for name, entry in self._entries.items()},
+                'max_steps': self.max_steps,
+                'hits': self.hits,
+                'extensions': self.extensions,
+                'uncached': self.uncached
+            }
@@ -0,0 +1,89 @@
+"""
+Loan Sales Prediction - Precomputed forecast table
+"""
+
+import numpy as np
+
+
+class ForecastTable:
+    """Array-backed table of predictions and scenario bounds
+
+    Rows are models and columns are consecutive quarters starting at
+    (`start_year`, `start_quarter`). A NaN prediction marks a time series
+    forecast that failed for that period. The table is only valid for the
+    dataset version it was computed from.
+    """
+
+    def __init__(self, models, start_year: int, start_quarter: int,
+                 predictions, optimistic, pessimistic, dataset_version: str):
+        self.models = list(models)
+        self.start_year = start_year
+        self.start_quarter = start_quarter
+        self.predictions = np.asarray(predictions, dtype=np.float64)
+        self.optimistic = np.asarray(optimistic, dtype=np.float64)
+        self.pessimistic = np.asarray(pessimistic, dtype=np.float64)
+        self.dataset_version = dataset_version
+
+        self._rows = {name: i for i, name in enumerate(self.models)}
+        self._start = start_year * 4 + (start_quarter - 1)
+
+    @property
+    def n_periods(self) -> int:
+        return self.predictions.shape[1] if self.predictions.ndim == 2 else 0
+
+    @property
+    def end(self):
+        """Last (year, quarter) covered by the table"""
+        last = self._start + self.n_periods - 1
+        return last // 4, last % 4 + 1
+
+    def lookup(self, model_name: str, year: int, quarter: int):
+        """Return (prediction, optimistic, pessimistic) or None if not covered"""
+        row = self._rows.get(model_name)
+        if row is None or not 1 <= quarter <= 4:
+            return None
+
+        column = year * 4 + (quarter - 1) - self._start
+        if not 0 <= column < self.n_periods:
+            return None
+
+        return (
+            float(self.predictions[row, column]),
+            float(self.optimistic[row, column]),
+            float(self.pessimistic[row, column])
+        )
+
+    def lookup_many(self, model_name: str, years, quarters):
+        """Vectorized `lookup` of one model over many periods
+
+        Returns:
+            Tuple (covered, predictions, optimistic, pessimistic): a boolean
+            mask of the periods the table covers and float arrays aligned
+            with `years`/`quarters`, NaN where not covered
+        """
+        years = np.asarray(years, dtype=np.int64).reshape(-1)
+        quarters = np.asarray(quarters, dtype=np.int64).reshape(-1)
+        values = np.full((3, len(years)), np.nan)
+
+        row = self._rows.get(model_name)
+        if row is None:
+            return np.zeros(len(years), dtype=bool), values[0], values[1], values[2]
+
+        columns = years * 4 + (quarters - 1) - self._start
+        covered = (quarters >= 1) & (quarters <= 4) & (columns >= 0) & (columns < self.n_periods)
+        columns = columns[covered]
+        values[0, covered] = self.predictions[row, columns]
+        values[1, covered] = self.optimistic[row, columns]
+        values[2, covered] = self.pessimistic[row, columns]
+        return covered, values[0], values[1], values[2]
+
+    def describe(self) -> dict:
+        """Models, period count, covered range and dataset version of the table"""
+        end_year, end_quarter = self.end
+        return {
+            'models': len(self.models),
+            'periods': self.n_periods,
+            'from': f"{self.start_year}Q{self.start_quarter}",
+            'to': f"{end_year}Q{end_quarter}",
+            'dataset_version': self.dataset_version
+        }
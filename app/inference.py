@@ -0,0 +1,77 @@
+"""
+Loan Sales Prediction - Bounded executor for blocking inference work
+"""
+
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class InferenceOverloaded(Exception):
+    """Raised when every worker is busy and the wait queue is full"""
+
+
+class InferenceTimeout(Exception):
+    """Raised when inference work does not finish within the request timeout"""
+
+
+class InferencePool:
+    """Runs blocking prediction work off the asyncio event loop
+
+    Work is dispatched to a fixed-size thread pool so that unpickling, NumPy
+    and statsmodels calls never block other connections. Admission is
+    bounded: once `workers + queue_limit` jobs are pending new work is
+    rejected. A job that exceeds the timeout is abandoned (cancelled if it
+    has not started yet) and keeps counting against capacity until its
+    thread actually finishes. Jobs run in a copy of the caller's context,
+    so context variables (e.g. request timing) follow them to the thread.
+    Several workers may use the same cached model at once, so work on
+    objects that are not thread-safe must be locked by the caller.
+    """
+
+    def __init__(self, workers: int, queue_limit: int, timeout: float):
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self.timeout = timeout
+        self.pending = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="inference")
+
+    async def run(self, func, *args, timeout: float = None):
+        """Run `func(*args)` on the pool and return its result"""
+        with self._lock:
+            if self.pending >= self.workers + self.queue_limit:
+                self.rejected += 1
+                raise InferenceOverloaded(f"All {self.workers} inference workers are busy")
+            self.pending += 1
+
+        job = self._executor.submit(contextvars.copy_context().run, func, *args)
+        job.add_done_callback(self._release)
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(job), timeout or self.timeout)
+        except asyncio.TimeoutError:
+            job.cancel()
+            with self._lock:
+                self.timeouts += 1
+            raise InferenceTimeout(f"Prediction did not finish within {timeout or self.timeout:g}s")
+
+    def _release(self, job):
+        with self._lock:
+            self.pending -= 1
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict:
+        """Worker count, queue limit, pending jobs, and rejection/timeout counts"""
+        return {
+            'workers': self.workers,
+            'queue_limit': self.queue_limit,
+            'pending': self.pending,
+            'rejected': self.rejected,
+            'timeouts': self.timeouts
+        }
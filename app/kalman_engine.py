@@ -0,0 +1,108 @@
+"""
+Loan Sales Prediction - Pure-NumPy state-space forecasting
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+from app import model_store
+
+# The system matrices the point forecast depends on
+SYSTEM_MATRICES = ('design', 'transition', 'state_intercept')
+
+
+class KalmanForecaster:
+    """Out-of-sample forecasts of a fitted ARIMA/SARIMAX model without statsmodels
+
+    Holds the one-step-ahead predicted state after the last observation plus
+    the time-invariant system matrices. With no more observations the
+    Kalman filter's point forecasts reduce to
+
+        y[h] = d[h] + Z a[h]          a[h+1] = c + T a[h]
+
+    where d[h] is the regression term `exog[h] @ beta` for SARIMAX models
+    fitted with exogenous variables (zero otherwise). `forecast` takes the
+    same arguments as the statsmodels results it replaces.
+    """
+
+    def __init__(self, state, matrices: dict, beta=None):
+        self.state = np.asarray(state, dtype=np.float64)
+        self.design = np.asarray(matrices['design'], dtype=np.float64)
+        self.transition = np.asarray(matrices['transition'], dtype=np.float64)
+        self.state_intercept = np.asarray(matrices['state_intercept'], dtype=np.float64)
+        self.beta = None if beta is None else np.asarray(beta, dtype=np.float64).reshape(-1)
+
+    @classmethod
+    def from_results(cls, results):
+        """Extract the forecaster from fitted statsmodels ARIMA/SARIMAX results
+
+        Raises:
+            ValueError: If the model is not univariate and time-invariant over
+                the forecast horizon (e.g. time trends, time-varying regression)
+        """
+        model = results.model
+        ssm = model.ssm
+        if ssm.k_endog != 1:
+            raise ValueError("Only univariate models are supported")
+        if getattr(model, 'k_trend', 0):
+            raise ValueError("Trend terms vary with time")
+        if getattr(model, 'state_regression', False) or getattr(model, 'time_varying_regression', False):
+            raise ValueError("Regression coefficients in the state vector are not supported")
+
+        matrices = {}
+        for name in SYSTEM_MATRICES:
+            matrix = np.asarray(ssm[name], dtype=np.float64)
+            if matrix.ndim == (2 if name == 'state_intercept' else 3):
+                if matrix.shape[-1] != 1:
+                    raise ValueError(f"Time-varying {name} is not supported")
+                matrix = matrix[..., 0]
+            matrices[name] = matrix
+
+        beta = None
+        if model.k_exog:
+            # With MLE regression the exog term is the observation intercept
+            beta = np.asarray(results.params, dtype=np.float64)[:model.k_exog]
+        elif np.any(np.asarray(ssm['obs_intercept']) != 0):
+            raise ValueError("Observation intercept is not supported")
+
+        return cls(results.predicted_state[:, -1], matrices, beta)
+
+    def forecast(self, steps: int = 1, exog=None) -> np.ndarray:
+        """Point forecasts for the next `steps` periods
+
+        Args:
+            exog: Future exogenous values, shape (steps, k_exog); required
+                when the model was fitted with exog
+        """
+        intercept = self._obs_intercept(steps, exog)
+        predictions = np.empty(steps)
+        state = self.state
+        for h in range(steps):
+            predictions[h] = self.design[0] @ state + intercept[h]
+            state = self.transition @ state + self.state_intercept
+        return predictions
+
+    def _obs_intercept(self, steps: int, exog) -> np.ndarray:
+        if self.beta is None:
+            if exog is not None:
+                raise ValueError("Model was fitted without exog")
+            return np.zeros(steps)
+        if exog is None:
+            raise ValueError("Model was fitted with exog; future exog values are required")
+        exog = np.asarray(exog, dtype=np.float64).reshape(-1, len(self.beta))
+        if len(exog) != steps:
+            raise ValueError(f"Expected {steps} rows of exog, got {len(exog)}")
+        return exog @ self.beta
+
+    def save(self, path: Path):
+        """Write the forecaster with `model_store.save_arrays`"""
+        arrays = {'state': self.state, **{name: getattr(self, name) for name in SYSTEM_MATRICES}}
+        if self.beta is not None:
+            arrays['beta'] = self.beta
+        model_store.save_arrays(path, arrays)
+
+    @classmethod
+    def load(cls, path: Path):
+        _, arrays = model_store.load_arrays(path)
+        return cls(arrays['state'], arrays, arrays.get('beta'))
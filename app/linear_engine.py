@@ -0,0 +1,38 @@
+"""
+Loan Sales Prediction - Fused linear model scoring
+"""
+
+import numpy as np
+
+
+class LinearStack:
+    """Linear models over the same features stacked into one coefficient matrix
+
+    Row i of `coef` and `intercept[i]` belong to model `names[i]`, so scoring
+    every model for every requested row is a single matrix product. It is
+    written as a broadcast multiply + sum over the feature axis (the same
+    expression `LinearArtifact.predict` uses) so stacked and single-model
+    predictions are bit-identical, which BLAS kernels of different shapes
+    do not guarantee.
+    """
+
+    def __init__(self, names: list, coef, intercept):
+        self.names = list(names)
+        self.coef = np.asarray(coef, dtype=np.float64).reshape(len(self.names), -1)
+        self.intercept = np.asarray(intercept, dtype=np.float64).reshape(len(self.names))
+        self.n_features = self.coef.shape[1]
+
+    @classmethod
+    def from_models(cls, names: list, models: list):
+        """Stack fitted linear models (anything with `coef_` and `intercept_`)"""
+        if not models:
+            raise ValueError("No linear models to stack")
+        coef = [np.ravel(model.coef_) for model in models]
+        if len({len(row) for row in coef}) != 1:
+            raise ValueError("Linear models use different feature counts")
+        return cls(names, np.vstack(coef), [float(np.ravel(model.intercept_)[0]) for model in models])
+
+    def predict_all(self, X) -> np.ndarray:
+        """Predictions of every model for every row, shape (n_models, n_rows)"""
+        X = np.asarray(X, dtype=np.float64).reshape(-1, self.n_features)
+        return (self.coef[:, np.newaxis, :] * X).sum(axis=2) + self.intercept[:, np.newaxis]
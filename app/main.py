@@ -2,22 +2,43 @@
 Loan Sales Prediction - FastAPI Application
 """
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Query, Request
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
 from pathlib import Path
+from contextlib import contextmanager, nullcontext
+import asyncio
 import json
-import pickle
-import pandas as pd
 import numpy as np
 from typing import List, Optional
+import os
+import re
 import sys
+import threading
+import time
 
-# Add notebooks directory to path for imports
+# Add project root and notebooks directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
 sys.path.append(str(Path(__file__).parent.parent / "notebooks"))
 
+from app.artifacts import IMPORTING_FORMATS, load_artifact
+from app.dataset import DatasetSnapshot, DatasetStore, quarter_range
+from app.forecast_memo import ForecastMemo
+from app.forecast_table import ForecastTable
+from app.inference import InferenceOverloaded, InferencePool, InferenceTimeout
+from app.kalman_engine import KalmanForecaster
+from app.linear_engine import LinearStack
+from app.metrics import CONTENT_TYPE, MetricsRegistry, RequestMetricsMiddleware, histogram_samples, metric_lines
+from app.model_cache import ModelCache
+from app.registry_views import build_registry_views
+from app.singleflight import SingleFlight
+from app.smoothing_engine import HoltWintersForecaster
+from app.timing import BUCKETS_MS, ServerTimingMiddleware, StageHistograms, model_scope, timed
+from app.tree_engine import TreeEnsemble
+from app.warmup import ModelWarmup
+
 app = FastAPI(title="Loan Sales Prediction API", version="1.0.0")
 
 # Setup templates and static files
@@ -32,16 +53,113 @@ app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
 MODELS_DIR = BASE_DIR / "notebooks" / "prediction" / "models"
 DATA_DIR = BASE_DIR / "notebooks" / "data"
 
+# Runtime configuration (environment overrides)
+MODEL_CACHE_MAX_MB = float(os.environ.get("MODEL_CACHE_MAX_MB", "512"))
+PRECOMPUTE_FORECASTS = os.environ.get("PRECOMPUTE_FORECASTS", "1") == "1"
+FORECAST_TABLE_YEARS = int(os.environ.get("FORECAST_TABLE_YEARS", "5"))
+INFERENCE_WORKERS = int(os.environ.get("INFERENCE_WORKERS", "4"))
+INFERENCE_QUEUE_LIMIT = int(os.environ.get("INFERENCE_QUEUE_LIMIT", "32"))
+REQUEST_TIMEOUT_SECONDS = float(os.environ.get("REQUEST_TIMEOUT_SECONDS", "30"))
+PREDICT_CACHE_TTL_SECONDS = float(os.environ.get("PREDICT_CACHE_TTL_SECONDS", "2"))
+WARMUP_MODELS = os.environ.get("WARMUP_MODELS", "0") == "1"
+WARMUP_WORKERS = int(os.environ.get("WARMUP_WORKERS", str(INFERENCE_WORKERS)))
+FORECAST_MATRIX_MAX_PERIODS = int(os.environ.get("FORECAST_MATRIX_MAX_PERIODS", "200"))
+FORECAST_PATH_MAX_PERIODS = int(os.environ.get("FORECAST_PATH_MAX_PERIODS", "200"))
+BATCH_MAX_ITEMS = int(os.environ.get("BATCH_MAX_ITEMS", "100"))
+BATCH_MAX_PERIODS = int(os.environ.get("BATCH_MAX_PERIODS", "200"))
+TS_FORECAST_MEMO_MAX_STEPS = int(os.environ.get("TS_FORECAST_MEMO_MAX_STEPS", "400"))
+REQUEST_TIMING = os.environ.get("REQUEST_TIMING", "1") == "1"
+
 # Load model registry at startup
 MODEL_REGISTRY = None
 
+# /api/models and /api/stats bodies, serialized once per registry version
+REGISTRY_VIEWS = None
+
+# Loaded models, shared across requests
+MODEL_CACHE = ModelCache(max_bytes=int(MODEL_CACHE_MAX_MB * 1024 * 1024))
+MODEL_LOAD_LOCK = threading.Lock()
+
+# Historical data and PCA features, reloaded only when the files change
+DATASET = DatasetStore(DATA_DIR)
+
+# Models of one artifact format fused into a single engine that scores all
+# of them at once: {format: (artifact key, engine)}
+FUSED_ENGINES = {}
+FUSED_ENGINE_LOCK = threading.Lock()
+FUSED_ENGINE_BUILDERS = {
+    'tree': lambda names, models: TreeEnsemble.concat(models, names=names),
+    'linear': LinearStack.from_models
+}
+
+# statsmodels results objects are not thread-safe: forecasts from one are
+# serialized per model. The NumPy forecasters are read-only and run freely.
+TS_FORECAST_LOCKS = {}
+TS_FORECAST_LOCKS_GUARD = threading.Lock()
+THREAD_SAFE_FORECASTERS = (KalmanForecaster, HoltWintersForecaster)
+
+# Longest forecast trajectory computed so far per time series model
+TS_FORECAST_MEMO = ForecastMemo(max_steps=TS_FORECAST_MEMO_MAX_STEPS)
+
+# Precomputed predictions for every model over the forecast window
+FORECAST_TABLE = None
+FORECAST_TABLE_LOCK = threading.Lock()
+
+# Blocking prediction work runs here, never on the event loop
+INFERENCE_POOL = InferencePool(
+    workers=INFERENCE_WORKERS,
+    queue_limit=INFERENCE_QUEUE_LIMIT,
+    timeout=REQUEST_TIMEOUT_SECONDS
+)
+
+# Identical concurrent /api/predict requests share one computation; successful
+# responses (status, body) are reused for PREDICT_CACHE_TTL_SECONDS
+PREDICT_FLIGHTS = SingleFlight(
+    ttl=PREDICT_CACHE_TTL_SECONDS,
+    cacheable=lambda result: result[0] == 200
+)
+
+# Optional startup warm-up; /api/health reports 503 until it has finished
+WARMUP = ModelWarmup(enabled=WARMUP_MODELS, workers=WARMUP_WORKERS)
+
+# Per-model, per-stage latency histograms (Server-Timing header per response)
+STAGE_HISTOGRAMS = StageHistograms()
+if REQUEST_TIMING:
+    app.add_middleware(ServerTimingMiddleware, histograms=STAGE_HISTOGRAMS)
+
+# Prometheus metrics served at /metrics
+METRICS = MetricsRegistry(prefix="loan_sales_")
+HTTP_REQUESTS = METRICS.counter(
+    "http_requests_total", "HTTP requests by method, route and status code", ("method", "endpoint", "status")
+)
+HTTP_LATENCY = METRICS.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route", ("endpoint",)
+)
+HTTP_IN_FLIGHT = METRICS.gauge("http_requests_in_flight", "HTTP requests currently being served")
+MODEL_PREDICTIONS = METRICS.counter(
+    "model_predictions_total", "Model evaluations by model and endpoint", ("model", "endpoint")
+)
+MODEL_LATENCY = METRICS.histogram(
+    "model_prediction_duration_seconds", "Time spent evaluating one model by endpoint", ("model", "endpoint")
+)
+MODEL_LOAD_SECONDS = METRICS.histogram(
+    "model_load_duration_seconds", "Time to read a model artifact from disk (cache misses)", ("model", "format")
+)
+TS_FORECAST_FAILURES = METRICS.counter(
+    "ts_forecast_failures_total", "Time series forecasts that raised and returned no prediction", ("model",)
+)
+app.add_middleware(
+    RequestMetricsMiddleware, requests=HTTP_REQUESTS, latency=HTTP_LATENCY, in_flight=HTTP_IN_FLIGHT
+)
+
 
 def load_registry():
-    """Load model registry"""
-    global MODEL_REGISTRY
+    """Load model registry and precompute its views"""
+    global MODEL_REGISTRY, REGISTRY_VIEWS
     registry_path = MODELS_DIR / "model_registry.json"
     with open(registry_path, 'r', encoding='utf-8') as f:
         MODEL_REGISTRY = json.load(f)
+    REGISTRY_VIEWS = build_registry_views(MODEL_REGISTRY)
     return MODEL_REGISTRY
 
 
@@ -58,6 +176,11 @@ class ComparisonRequest(BaseModel):
     quarter: int
 
 
+class BatchPredictionRequest(BaseModel):
+    items: List[PredictionRequest]
+    include_historical: bool = False
+
+
 # Load registry on startup
 @app.on_event("startup")
 async def startup_event():
@@ -65,81 +188,54 @@ async def startup_event():
     print("✅ Model registry loaded")
     print(f"📊 Total models: {MODEL_REGISTRY['metadata']['total_models']}")
 
+    data = DATASET.get()
+    print(f"✅ Dataset snapshot loaded (version {data.version}, {data.n_observations} observations)")
 
-# Routes
-@app.get("/", response_class=HTMLResponse)
-async def home(request: Request):
-    """Render home page"""
-    return templates.TemplateResponse("index.html", {"request": request})
-
-
-@app.get("/api/models")
-async def get_models():
-    """Get all available models organized by type"""
-
-    # Organize models by category
-    ml_models = []
-    ts_models = []
+    # Warm every model in the background, then precompute forecasts from the
+    # warm cache; requests fall back to live computation meanwhile
+    model_names = list(MODEL_REGISTRY['ml_models']) + list(MODEL_REGISTRY['ts_models'])
+    if WARMUP.enabled:
+        print(f"🔥 Warming up {len(model_names)} models ({WARMUP.workers} workers)")
+    WARMUP.start(
+        model_names,
+        load=lambda name: load_model(name)[0],
+        score=score_model,
+        on_done=refresh_forecast_table
+    )
 
-    for name, info in MODEL_REGISTRY['ml_models'].items():
-        ml_models.append({
-            'name': name,
-            'type': 'ml',
-            'metrics': info['metrics']
-        })
 
-    for name, info in MODEL_REGISTRY['ts_models'].items():
-        ts_models.append({
-            'name': name,
-            'type': 'timeseries',
-            'metrics': info['metrics']
-        })
+@app.on_event("shutdown")
+async def shutdown_event():
+    INFERENCE_POOL.shutdown()
 
-    # Sort by test_r2
-    ml_models.sort(key=lambda x: x['metrics'].get('test_r2', -999), reverse=True)
-    ts_models.sort(key=lambda x: x['metrics'].get('test_r2', -999), reverse=True)
 
-    # Categorize models
-    recommended = []
-    advanced_ml = []
-    time_series = []
-    experimental = []
+@app.exception_handler(InferenceOverloaded)
+async def inference_overloaded_handler(request: Request, exc: InferenceOverloaded):
+    return JSONResponse({
+        'error': str(exc),
+        'success': False
+    }, status_code=503, headers={'Retry-After': '1'})
 
-    # Top 5 performers
-    all_models = ml_models + ts_models
-    all_models.sort(key=lambda x: x['metrics'].get('test_r2', -999), reverse=True)
 
-    for model in all_models[:5]:
-        if model['metrics'].get('test_r2', -999) > 0.3:
-            recommended.append(model['name'])
+@app.exception_handler(InferenceTimeout)
+async def inference_timeout_handler(request: Request, exc: InferenceTimeout):
+    return JSONResponse({
+        'error': str(exc),
+        'success': False
+    }, status_code=504)
 
-    # Advanced ML (good performance)
-    for model in ml_models:
-        if model['metrics'].get('test_r2', -999) > 0.1 and model['name'] not in recommended:
-            advanced_ml.append(model['name'])
 
-    # Time series
-    for model in ts_models:
-        time_series.append(model['name'])
+# Routes
+@app.get("/", response_class=HTMLResponse)
+async def home(request: Request):
+    """Render home page"""
+    return templates.TemplateResponse("index.html", {"request": request})
 
-    # Experimental (poor performance)
-    for model in ml_models:
-        if model['metrics'].get('test_r2', -999) <= 0.0:
-            experimental.append(model['name'])
 
-    return JSONResponse({
-        'categories': {
-            'recommended': recommended,
-            'advanced_ml': advanced_ml,
-            'time_series': time_series,
-            'experimental': experimental
-        },
-        'models': {
-            'ml': ml_models,
-            'ts': ts_models
-        },
-        'total': len(ml_models) + len(ts_models)
-    })
+@app.get("/api/models")
+async def get_models(request: Request):
+    """Get all available models organized by type"""
+    return registry_view_response(request, 'models')
 
 
 @app.get("/api/model/{model_name}")
@@ -153,6 +249,7 @@ async def get_model_info(model_name: str):
             'name': model_name,
             'type': 'ml',
             'filename': info['filename'],
+            'format': info.get('format', 'pickle'),
             'metrics': info['metrics']
         })
 
@@ -163,50 +260,117 @@ async def get_model_info(model_name: str):
             'name': model_name,
             'type': 'timeseries',
             'filename': info['filename'],
+            'format': info.get('format', 'pickle'),
             'metrics': info['metrics']
         })
 
     return JSONResponse({'error': 'Model not found'}, status_code=404)
 
 
+def artifact_path(info: dict) -> Path:
+    """Path of the artifact a registry entry is served from"""
+    return MODELS_DIR / info.get('artifact', info['filename'])
+
+
+def read_model_artifact(model_path: Path, fmt: str = 'pickle'):
+    """Read a model artifact from disk in its registry format"""
+    # Loading may import the model's library; concurrent first imports of
+    # the same packages from several threads can deadlock, so those loads
+    # are serialized. Array-only formats load in parallel.
+    if fmt not in IMPORTING_FORMATS:
+        return load_artifact(model_path, fmt)
+    with MODEL_LOAD_LOCK:
+        return load_artifact(model_path, fmt)
+
+
+def get_registry_entry(model_name: str) -> dict:
+    """Get the registry entry (filename, type, metrics) for a model"""
+    if model_name in MODEL_REGISTRY['ml_models']:
+        return MODEL_REGISTRY['ml_models'][model_name]
+    if model_name in MODEL_REGISTRY['ts_models']:
+        return MODEL_REGISTRY['ts_models'][model_name]
+    raise ValueError(f"Model {model_name} not found")
+
+
 def load_model(model_name: str):
-    """Load a trained model"""
+    """Load a trained model (served from the in-process cache when warm)"""
     # Get model info
-    if model_name in MODEL_REGISTRY['ml_models']:
-        info = MODEL_REGISTRY['ml_models'][model_name]
-    elif model_name in MODEL_REGISTRY['ts_models']:
-        info = MODEL_REGISTRY['ts_models'][model_name]
-    else:
-        raise ValueError(f"Model {model_name} not found")
+    info = get_registry_entry(model_name)
+
+    # Load model file (native format when the registry records one)
+    fmt = info.get('format', 'pickle')
 
-    # Load model file
-    model_path = MODELS_DIR / info['filename']
-    with open(model_path, 'rb') as f:
-        model = pickle.load(f)
+    def read(path):
+        start = time.perf_counter()
+        model = read_model_artifact(path, fmt)
+        MODEL_LOAD_SECONDS.observe(time.perf_counter() - start, model=model_name, format=fmt)
+        return model
+
+    with timed('load_model', model_name):
+        model = MODEL_CACHE.get(artifact_path(info), read)
 
     return model, info
 
 
-def load_historical_data():
-    """Load historical sales data"""
-    df = pd.read_csv(DATA_DIR / 'ml_ready_data.csv')
-    return df[['Year', 'Quarter', 'Nağd_pul_kredit_satışı']].dropna()
+@contextmanager
+def observe_model(model_name: str, endpoint: str):
+    """Count and time the evaluation of one registered model for /metrics"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        # Unknown names are not recorded, so requests cannot create new series
+        if model_name in MODEL_REGISTRY['ml_models'] or model_name in MODEL_REGISTRY['ts_models']:
+            MODEL_PREDICTIONS.inc(model=model_name, endpoint=endpoint)
+            MODEL_LATENCY.observe(time.perf_counter() - start, model=model_name, endpoint=endpoint)
+
+
+def score_model(model_name: str, model):
+    """Test prediction for the quarter after the last observation (warm-up check)"""
+    info = get_registry_entry(model_name)
+    data = load_historical_data()
+    year, quarter = int(data.hist_years[-1]), int(data.hist_quarters[-1]) + 1
+    if quarter > 4:
+        year, quarter = year + 1, 1
+
+    if info['type'] == 'ml':
+        prediction = model.predict(prepare_ml_features(year, quarter))[0]
+    else:
+        prediction = forecast_ts_trajectory(model, 1, model_name)[-1]
+
+    if not np.isfinite(prediction):
+        raise ValueError(f"Test prediction for {year}Q{quarter} is not finite")
+    return float(prediction)
+
+
+def load_historical_data() -> DatasetSnapshot:
+    """Get the current in-memory dataset snapshot"""
+    return DATASET.get()
 
 
 def get_historical_sales(year: int, quarter: int, years_back: int = 3):
     """Get historical sales for the same quarter from previous years"""
-    df = load_historical_data()
+    with timed('get_historical_sales'):
+        sales = load_historical_data().history.same_quarter([year], [quarter], years_back)
+        return historical_records(year, quarter, sales[0])
+
+
+def get_historical_sales_many(years, quarters, years_back: int = 3):
+    """`get_historical_sales` for many target periods with one index lookup"""
+    sales = load_historical_data().history.same_quarter(years, quarters, years_back)
+    return [historical_records(int(y), int(q), row) for y, q, row in zip(years, quarters, sales)]
 
+
+def historical_records(year: int, quarter: int, sales_by_year):
+    """Format one row of `SalesIndex.same_quarter` output (missing years are skipped)"""
     historical = []
-    for i in range(1, years_back + 1):
-        target_year = year - i
-        row = df[(df['Year'] == target_year) & (df['Quarter'] == quarter)]
-        if not row.empty:
+    for i, sales in enumerate(sales_by_year, start=1):
+        if not np.isnan(sales):
             historical.append({
-                'year': int(target_year),
+                'year': int(year - i),
                 'quarter': int(quarter),
-                'sales': float(row['Nağd_pul_kredit_satışı'].iloc[0]),
-                'sales_formatted': f"{float(row['Nağd_pul_kredit_satışı'].iloc[0]):,.2f}"
+                'sales': float(sales),
+                'sales_formatted': f"{float(sales):,.2f}"
             })
 
     return historical
@@ -225,67 +389,19 @@ def prepare_ml_features(year: int = None, quarter: int = None):
     Note: For historical dates, uses actual features. For future dates,
     extrapolates features based on recent trends and seasonal patterns.
     """
-    df_pca = pd.read_csv(DATA_DIR / 'pca_features.csv')
-    df_orig = pd.read_csv(DATA_DIR / 'ml_ready_data.csv')
-
-    # If year/quarter specified, try to find matching row
-    if year is not None and quarter is not None:
-        matching_rows = df_orig[(df_orig['Year'] == year) & (df_orig['Quarter'] == quarter)]
-
-        if not matching_rows.empty:
-            # Get the index of the matching row
-            idx = matching_rows.index[0]
-            if idx < len(df_pca):
-                # Use features from that specific period
-                features = df_pca[['PC1', 'PC2', 'PC3', 'PC4', 'PC5', 'PC6']].iloc[idx].values
-                return features.reshape(1, -1)
-
-        # For future dates: extrapolate features based on trends
-        # Get last known date
-        last_year = int(df_orig['Year'].iloc[-2])  # -2 because last row might be incomplete
-        last_quarter = int(df_orig['Quarter'].iloc[-2])
-
-        # Calculate quarters difference
-        quarters_ahead = (year - last_year) * 4 + (quarter - last_quarter)
-
-        if quarters_ahead > 0:
-            # Use recent trend (last 8 quarters) to extrapolate
-            lookback = min(8, len(df_pca))
-            recent_features = df_pca[['PC1', 'PC2', 'PC3', 'PC4', 'PC5', 'PC6']].iloc[-lookback:].values
-
-            # Calculate linear trend for each PC
-            trends = []
-            for i in range(6):
-                pc_values = recent_features[:, i]
-                # Simple linear regression slope
-                x = np.arange(len(pc_values))
-                trend = np.polyfit(x, pc_values, 1)[0]  # Get slope
-                trends.append(trend)
-
-            # Get base features from last complete observation
-            base_features = df_pca[['PC1', 'PC2', 'PC3', 'PC4', 'PC5', 'PC6']].iloc[-2].values
-
-            # Extrapolate features
-            extrapolated = base_features + np.array(trends) * quarters_ahead
-
-            # Add seasonal component (quarter-specific adjustment)
-            # Calculate average seasonal pattern for this quarter from historical data
-            quarter_mask = df_orig['Quarter'] == quarter
-            if quarter_mask.sum() > 0:
-                quarter_indices = df_orig[quarter_mask].index
-                # Get valid indices within pca dataframe
-                valid_indices = [i for i in quarter_indices if i < len(df_pca)]
-                if len(valid_indices) >= 2:
-                    quarter_features = df_pca.iloc[valid_indices][['PC1', 'PC2', 'PC3', 'PC4', 'PC5', 'PC6']].values
-                    seasonal_adjustment = quarter_features.mean(axis=0) - df_pca[['PC1', 'PC2', 'PC3', 'PC4', 'PC5', 'PC6']].mean().values
-                    # Apply 50% of seasonal adjustment to avoid over-correction
-                    extrapolated += seasonal_adjustment * 0.5
-
-            return extrapolated.reshape(1, -1)
-
-    # Fallback: Use the most recent known features
-    features = df_pca[['PC1', 'PC2', 'PC3', 'PC4', 'PC5', 'PC6']].iloc[-2].values
-    return features.reshape(1, -1)
+    with timed('prepare_ml_features'):
+        extrapolator = load_historical_data().features
+
+        if year is not None and quarter is not None:
+            return extrapolator.rows([year], [quarter])
+
+        # Fallback: Use the most recent known features
+        return extrapolator.base.reshape(1, -1)
+
+
+def prepare_ml_feature_matrix(years, quarters):
+    """PCA feature rows for many periods at once (see `prepare_ml_features`)"""
+    return load_historical_data().features.rows(years, quarters)
 
 
 def calculate_forecast_steps(target_year: int, target_quarter: int) -> int:
@@ -298,19 +414,15 @@ def calculate_forecast_steps(target_year: int, target_quarter: int) -> int:
     Returns:
         Number of quarters to forecast ahead
     """
-    df = load_historical_data()
-    if df.empty:
-        return 1  # Default to 1 step if no data
-
-    # Get the last complete observation (skip rows with missing sales data)
-    df_complete = df.dropna(subset=['Nağd_pul_kredit_satışı'])
+    data = load_historical_data()
 
-    if df_complete.empty:
-        return 1
+    # Only complete observations count (rows with missing sales are skipped)
+    if data.n_observations == 0:
+        return 1  # Default to 1 step if no data
 
     # Get the last complete observation date
-    last_year = int(df_complete['Year'].iloc[-1])
-    last_quarter = int(df_complete['Quarter'].iloc[-1])
+    last_year = int(data.hist_years[-1])
+    last_quarter = int(data.hist_quarters[-1])
 
     # Calculate quarters difference
     # Each year has 4 quarters
@@ -320,6 +432,67 @@ def calculate_forecast_steps(target_year: int, target_quarter: int) -> int:
     return max(1, quarters_diff)
 
 
+def calculate_forecast_steps_many(years, quarters) -> np.ndarray:
+    """`calculate_forecast_steps` for many target periods with one snapshot lookup"""
+    years = np.asarray(years, dtype=np.int64).reshape(-1)
+    quarters = np.asarray(quarters, dtype=np.int64).reshape(-1)
+    data = load_historical_data()
+    if data.n_observations == 0:
+        return np.ones(len(years), dtype=np.int64)
+
+    last = int(data.hist_years[-1]) * 4 + int(data.hist_quarters[-1])
+    return np.maximum(1, years * 4 + quarters - last)
+
+
+def forecast_ts_trajectory(model, steps: int, model_name: str = ""):
+    """Forecast every quarter from the last observation up to `steps` ahead
+
+    Trajectories up to `TS_FORECAST_MEMO_MAX_STEPS` are memoized per model,
+    so shorter horizons are sliced from the longest forecast computed so far
+    for the current dataset/artifact; longer ones are computed uncached.
+
+    Returns:
+        Float array of length `steps` (the last element is the target period)
+    """
+    if model_name not in MODEL_REGISTRY['ts_models']:
+        return _forecast_ts(model, steps, model_name)
+
+    token = (
+        load_historical_data().version,
+        MODEL_CACHE.signature(artifact_path(MODEL_REGISTRY['ts_models'][model_name]))
+    )
+    return TS_FORECAST_MEMO.get(
+        model_name, token, steps,
+        lambda horizon: _forecast_ts(model, horizon, model_name)
+    )
+
+
+def forecast_lock(model, model_name: str):
+    """Lock held while forecasting from `model` (a no-op for the NumPy forecasters)"""
+    if isinstance(model, THREAD_SAFE_FORECASTERS):
+        return nullcontext()
+    with TS_FORECAST_LOCKS_GUARD:
+        return TS_FORECAST_LOCKS.setdefault(model_name, threading.Lock())
+
+
+def _forecast_ts(model, steps: int, model_name: str):
+    """Run the model's forecast; returns the trajectory as a float array"""
+    # SARIMAX models need exogenous variables (time trend)
+    if 'SARIMAX' in model_name:
+        # Time index continues from the last complete observation
+        last_index = load_historical_data().n_observations
+        # Create exogenous variable (time trend) for future steps
+        exog_future = np.arange(last_index, last_index + steps).reshape(-1, 1)
+        with forecast_lock(model, model_name):
+            forecast = model.forecast(steps=steps, exog=exog_future)
+    else:
+        with forecast_lock(model, model_name):
+            forecast = model.forecast(steps=steps)
+
+    # Handles lists, NumPy arrays, pandas Series and scalar forecasts alike
+    return np.asarray(forecast, dtype=np.float64).reshape(-1)
+
+
 def prepare_ts_forecast(model, target_year: int = None, target_quarter: int = None, model_name: str = ""):
     """Make time series forecast for a specific year/quarter
 
@@ -339,35 +512,104 @@ def prepare_ts_forecast(model, target_year: int = None, target_quarter: int = No
         else:
             steps = 1  # Default: forecast 1 step ahead
 
-        # SARIMAX models need exogenous variables (time trend)
-        if 'SARIMAX' in model_name:
-            # Load historical data to get the time index
-            df = load_historical_data()
-            df_complete = df.dropna(subset=['Nağd_pul_kredit_satışı'])
-            last_index = len(df_complete)
-            # Create exogenous variable (time trend) for future steps
-            exog_future = np.arange(last_index, last_index + steps).reshape(-1, 1)
-            forecast = model.forecast(steps=steps, exog=exog_future)
-        else:
-            forecast = model.forecast(steps=steps)
-
         # Extract the final forecasted value (the target period)
-        if isinstance(forecast, (list, np.ndarray)):
-            return float(forecast[-1])  # Return the last step
-        # Handle pandas Series
-        if hasattr(forecast, 'iloc'):
-            if len(forecast) > 0:
-                return float(forecast.iloc[-1])  # Return the last step
-            return float(forecast.iloc[0])
-        return float(forecast)
+        with timed('prepare_ts_forecast', model_name):
+            return float(forecast_ts_trajectory(model, steps, model_name)[-1])
     except Exception as e:
         # Some models may fail - return None to indicate failure
+        TS_FORECAST_FAILURES.inc(model=model_name)
         print(f"⚠️  Forecast failed for {model_name} (target: {target_year}Q{target_quarter}, steps: {steps if 'steps' in locals() else '?'}): {str(e)}")
         return None
 
 
-def calculate_scenarios(base_prediction: float, model_info: dict):
-    """Calculate optimistic and pessimistic scenarios based on model performance"""
+def forecast_periods(model_name: str, years, quarters):
+    """Predict one model for many (year, quarter) periods in a single pass
+
+    ML models score all feature rows with one `predict` call and time series
+    models run one forecast up to the furthest requested horizon.
+
+    Returns:
+        Float array aligned with `years`/`quarters`; NaN marks periods whose
+        time series forecast failed
+    """
+    model, info = load_model(model_name)
+
+    if info['type'] == 'ml':
+        features = prepare_ml_feature_matrix(years, quarters)
+        with timed('ml_predict', model_name):
+            return np.asarray(model.predict(features), dtype=np.float64)
+
+    if info['type'] == 'timeseries':
+        steps = calculate_forecast_steps_many(years, quarters)
+        if steps.size == 0:
+            return np.empty(0)
+        try:
+            with timed('ts_forecast', model_name):
+                trajectory = forecast_ts_trajectory(model, int(steps.max()), model_name)
+        except Exception as e:
+            TS_FORECAST_FAILURES.inc(model=model_name)
+            print(f"⚠️  Forecast failed for {model_name} (steps: {int(steps.max())}): {str(e)}")
+            return np.full(len(steps), np.nan)
+        return trajectory[steps - 1]
+
+    raise ValueError(f"Unknown model type: {info['type']}")
+
+
+def fused_engine(fmt: str):
+    """Engine scoring every ML model stored in `fmt` at once (None if there are none)
+
+    Built from the cached models and rebuilt when any of their artifacts changes.
+    """
+    names = [name for name, info in MODEL_REGISTRY['ml_models'].items() if info.get('format') == fmt]
+    if not names:
+        return None
+
+    key = tuple(
+        (name, MODEL_CACHE.signature(artifact_path(MODEL_REGISTRY['ml_models'][name])))
+        for name in names
+    )
+    cached = FUSED_ENGINES.get(fmt)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    with FUSED_ENGINE_LOCK:
+        cached = FUSED_ENGINES.get(fmt)
+        if cached is None or cached[0] != key:
+            engine = FUSED_ENGINE_BUILDERS[fmt](names, [load_model(name)[0] for name in names])
+            FUSED_ENGINES[fmt] = cached = (key, engine)
+        return cached[1]
+
+
+def fused_forecasts(model_names, years, quarters) -> dict:
+    """Score the tree and linear models among `model_names` in one pass per engine
+
+    Returns:
+        {model name: float array aligned with `years`/`quarters`} for the
+        models an engine covers; other models (and those of an engine that
+        failed) are left to `forecast_periods`
+    """
+    wanted = set(model_names)
+    results, features = {}, None
+
+    for fmt in FUSED_ENGINE_BUILDERS:
+        try:
+            engine = fused_engine(fmt)
+            if engine is None or not wanted.intersection(engine.names):
+                continue
+            if features is None:
+                features = prepare_ml_feature_matrix(years, quarters)
+            with timed(f'fused_{fmt}'):
+                predictions = engine.predict_all(features)
+        except Exception as e:
+            print(f"⚠️  Fused {fmt} engine failed, scoring its models one by one: {str(e)}")
+            continue
+        results.update({name: predictions[i] for i, name in enumerate(engine.names) if name in wanted})
+
+    return results
+
+
+def scenario_bounds(base_prediction: float, model_info: dict):
+    """Optimistic and pessimistic values around a prediction based on model performance"""
     # Get metrics with safe defaults
     mape = model_info['metrics'].get('test_mape', 15.0)  # Default 15% uncertainty
     mae = model_info['metrics'].get('test_mae', 0)
@@ -394,6 +636,11 @@ def calculate_scenarios(base_prediction: float, model_info: dict):
     if abs(pessimistic - base_prediction) < min_variation:
         pessimistic = base_prediction - min_variation
 
+    return float(optimistic), float(pessimistic)
+
+
+def format_scenarios(base_prediction: float, optimistic: float, pessimistic: float, model_info: dict):
+    """Build the scenarios payload from precomputed bounds"""
     return {
         'optimistic': float(optimistic),
         'optimistic_formatted': f"{optimistic:,.2f}",
@@ -401,33 +648,195 @@ def calculate_scenarios(base_prediction: float, model_info: dict):
         'base_formatted': f"{base_prediction:,.2f}",
         'pessimistic': float(pessimistic),
         'pessimistic_formatted': f"{pessimistic:,.2f}",
-        'uncertainty_mape': float(mape),
-        'uncertainty_mae': float(mae)
+        'uncertainty_mape': float(model_info['metrics'].get('test_mape', 15.0)),
+        'uncertainty_mae': float(model_info['metrics'].get('test_mae', 0))
     }
 
 
+def calculate_scenarios(base_prediction: float, model_info: dict):
+    """Calculate optimistic and pessimistic scenarios based on model performance"""
+    with timed('calculate_scenarios'):
+        optimistic, pessimistic = scenario_bounds(base_prediction, model_info)
+        return format_scenarios(base_prediction, optimistic, pessimistic, model_info)
+
+
+def build_forecast_table(years_ahead: int = None) -> ForecastTable:
+    """Evaluate every registered model over the precomputation window
+
+    The window runs from the first observed year through `years_ahead`
+    years past the last complete observation.
+    """
+    global FORECAST_TABLE
+
+    years_ahead = FORECAST_TABLE_YEARS if years_ahead is None else years_ahead
+    data = load_historical_data()
+    first_year = int(data.hist_years[0])
+    last_year = int(data.hist_years[-1]) + years_ahead
+    years, quarters = quarter_range(first_year, 1, last_year, 4)
+
+    model_names = list(MODEL_REGISTRY['ml_models']) + list(MODEL_REGISTRY['ts_models'])
+    fused = fused_forecasts(model_names, years, quarters)
+
+    names, predictions, optimistic, pessimistic = [], [], [], []
+    for name in model_names:
+        try:
+            values = fused[name] if name in fused else forecast_periods(name, years, quarters)
+        except Exception as e:
+            print(f"⚠️  Skipping {name} in forecast table: {str(e)}")
+            continue
+
+        info = get_registry_entry(name)
+        bounds = np.array([
+            scenario_bounds(v, info) if not np.isnan(v) else (np.nan, np.nan) for v in values
+        ]).reshape(-1, 2)
+        names.append(name)
+        predictions.append(values)
+        optimistic.append(bounds[:, 0])
+        pessimistic.append(bounds[:, 1])
+
+    table = ForecastTable(
+        names, first_year, 1,
+        np.array(predictions).reshape(len(names), len(years)),
+        np.array(optimistic).reshape(len(names), len(years)),
+        np.array(pessimistic).reshape(len(names), len(years)),
+        dataset_version=data.version
+    )
+    FORECAST_TABLE = table
+    print(f"✅ Forecast table ready: {len(names)} models × {table.n_periods} quarters ({first_year}Q1-{last_year}Q4)")
+    return table
+
+
+def refresh_forecast_table():
+    """Rebuild the forecast table in a background thread (one build at a time)"""
+    if not PRECOMPUTE_FORECASTS or not FORECAST_TABLE_LOCK.acquire(blocking=False):
+        return
+
+    def run():
+        try:
+            build_forecast_table()
+        except Exception as e:
+            print(f"⚠️  Forecast table build failed: {str(e)}")
+        finally:
+            FORECAST_TABLE_LOCK.release()
+
+    threading.Thread(target=run, name="forecast-table", daemon=True).start()
+
+
+def current_forecast_table():
+    """The forecast table if it was built from the current dataset, else None
+
+    A table built from an older dataset version is ignored and rebuilt.
+    """
+    table = FORECAST_TABLE
+    if table is None:
+        return None
+    if table.dataset_version != load_historical_data().version:
+        refresh_forecast_table()
+        return None
+    return table
+
+
+def lookup_forecast(model_name: str, year: int, quarter: int):
+    """Precomputed (prediction, optimistic, pessimistic) or None outside the table"""
+    table = current_forecast_table()
+    if table is None:
+        return None
+    return table.lookup(model_name, year, quarter)
+
+
+def table_misses(table, model_names, years, quarters) -> list:
+    """Sorted (year, quarter) periods some of `model_names` need scored live
+
+    Args:
+        table: Forecast table fetched for this request (None: no table)
+    """
+    years = np.asarray(years, dtype=np.int64).reshape(-1)
+    quarters = np.asarray(quarters, dtype=np.int64).reshape(-1)
+    missing = set()
+    for name in model_names:
+        live = np.ones(len(years), dtype=bool) if table is None else ~table.lookup_many(name, years, quarters)[0]
+        missing.update(zip(years[live].tolist(), quarters[live].tolist()))
+    return sorted(missing)
+
+
+def predict_one(model_name: str, year: int, quarter: int, features=None, scored: float = None):
+    """Predict a single (model, year, quarter), preferring the precomputed table
+
+    Args:
+        features: Precomputed `prepare_ml_features(year, quarter)` row, reused
+            when several ML models score the same period
+        scored: Prediction already computed for this period by a fused engine
+
+    Returns:
+        Tuple (prediction, scenarios, info); prediction and scenarios are None
+        when a time series forecast failed
+    """
+    cached = lookup_forecast(model_name, year, quarter)
+    if cached is not None:
+        info = get_registry_entry(model_name)
+        prediction, optimistic, pessimistic = cached
+        if np.isnan(prediction):
+            return None, None, info
+        return prediction, format_scenarios(prediction, optimistic, pessimistic, info), info
+
+    # Outside the table: compute live
+    if scored is not None:
+        info = get_registry_entry(model_name)
+        return scored, calculate_scenarios(scored, info), info
+
+    model, info = load_model(model_name)
+
+    # Make prediction based on model type
+    if info['type'] == 'ml':
+        # ML models use PCA features (pass year/quarter for matching if available)
+        if features is None:
+            features = prepare_ml_features(year=year, quarter=quarter)
+        with timed('ml_predict', model_name):
+            prediction = float(model.predict(features)[0])
+
+    elif info['type'] == 'timeseries':
+        # Time series models forecast ahead to the specific year/quarter
+        prediction = prepare_ts_forecast(
+            model,
+            target_year=year,
+            target_quarter=quarter,
+            model_name=model_name
+        )
+        if prediction is None:
+            return None, None, info
+
+    else:
+        raise ValueError(f"Unknown model type: {info['type']}")
+
+    # Calculate optimistic and pessimistic scenarios
+    return prediction, calculate_scenarios(prediction, info), info
+
+
 @app.post("/api/predict")
 async def predict(request: PredictionRequest):
     """Make prediction for given year, quarter, and model with historical context and scenarios"""
+    status_code, body = await PREDICT_FLIGHTS.run(
+        (request.model, request.year, request.quarter),
+        lambda: predict_payload(request)
+    )
+    # A fresh response per caller; only the rendered body is shared
+    return Response(body, status_code=status_code, media_type='application/json')
 
-    try:
-        # Load model
-        model, info = load_model(request.model)
 
-        # Make prediction based on model type
-        if info['type'] == 'ml':
-            # ML models use PCA features (pass year/quarter for matching if available)
-            features = prepare_ml_features(year=request.year, quarter=request.quarter)
-            prediction = float(model.predict(features)[0])
+async def predict_payload(request: PredictionRequest):
+    """Run /api/predict on the inference pool; returns (status code, JSON body)"""
+    response = await INFERENCE_POOL.run(predict_response, request)
+    return response.status_code, response.body
 
-        elif info['type'] == 'timeseries':
-            # Time series models forecast ahead to the specific year/quarter
-            prediction = prepare_ts_forecast(
-                model,
-                target_year=request.year,
-                target_quarter=request.quarter,
-                model_name=request.model
-            )
+
+def predict_response(request: PredictionRequest):
+    """Blocking body of /api/predict (runs on the inference pool)"""
+    try:
+        if get_registry_entry(request.model)['type'] not in ('ml', 'timeseries'):
+            return JSONResponse({'error': 'Unknown model type'}, status_code=400)
+
+        with model_scope(request.model), observe_model(request.model, 'predict'):
+            prediction, scenarios, info = predict_one(request.model, request.year, request.quarter)
 
             if prediction is None:
                 return JSONResponse({
@@ -435,14 +844,8 @@ async def predict(request: PredictionRequest):
                     'note': 'This model may require exogenous variables or forecast horizon is too long'
                 }, status_code=400)
 
-        else:
-            return JSONResponse({'error': 'Unknown model type'}, status_code=400)
-
-        # Get historical data for context (same quarter, previous years)
-        historical = get_historical_sales(request.year, request.quarter, years_back=5)
-
-        # Calculate optimistic and pessimistic scenarios
-        scenarios = calculate_scenarios(prediction, info)
+            # Get historical data for context (same quarter, previous years)
+            historical = get_historical_sales(request.year, request.quarter, years_back=5)
 
         # Return result with extended information
         return JSONResponse({
@@ -465,54 +868,444 @@ async def predict(request: PredictionRequest):
         }, status_code=500)
 
 
-@app.post("/api/compare")
-async def compare(request: ComparisonRequest):
-    """Compare predictions from multiple models with scenarios"""
+def predict_periods(model_name: str, years, quarters, scored: dict = None, table=None):
+    """Predictions and scenario bounds for one model over many periods
+
+    Periods covered by the forecast table are looked up in one vectorized
+    slice; the rest are taken from `scored` ({(year, quarter): prediction}
+    from a fused engine) when it covers them, or scored with a single
+    `forecast_periods` call.
+
+    Args:
+        table: Forecast table already fetched for this request (default:
+            the current one)
+
+    Returns:
+        Tuple (predictions, optimistic, pessimistic, info) of float arrays
+        aligned with `years`/`quarters`; NaN marks failed forecasts
+    """
+    info = get_registry_entry(model_name)
+    n = len(years)
+    if table is None:
+        table = current_forecast_table()
+
+    # Table hits first, then one live pass over whatever is left
+    if table is None:
+        covered = np.zeros(n, dtype=bool)
+        predictions, optimistic, pessimistic = np.full((3, n), np.nan)
+    else:
+        covered, predictions, optimistic, pessimistic = table.lookup_many(model_name, years, quarters)
+    live = np.flatnonzero(~covered).tolist()
+
+    if live:
+        periods = [(int(years[i]), int(quarters[i])) for i in live]
+        if scored is not None and all(period in scored for period in periods):
+            values = [scored[period] for period in periods]
+        else:
+            values = forecast_periods(model_name, [years[i] for i in live], [quarters[i] for i in live])
+        for i, value in zip(live, values):
+            predictions[i] = value
+            if not np.isnan(value):
+                optimistic[i], pessimistic[i] = scenario_bounds(float(value), info)
 
-    results = []
+    return predictions, optimistic, pessimistic, info
+
+
+def predict_batch(items: List[PredictionRequest], include_historical: bool = False):
+    """Predict many (model, year, quarter) triples, loading each model once
+
+    Items are grouped by model and each group goes through one
+    `predict_periods` call. Periods the forecast table misses are scored
+    for all tree and linear models together by the fused engines first.
+    Failures are reported per item, including items more than
+    `BATCH_MAX_PERIODS` quarters past the last observation. With
+    `include_historical`, same-quarter history (5 years) is attached to each
+    item from a single index lookup.
+
+    Returns:
+        List of result dicts in the same order as `items`
+    """
+    results = [None] * len(items)
+
+    steps = calculate_forecast_steps_many([item.year for item in items], [item.quarter for item in items])
+    groups = {}
+    for position, item in enumerate(items):
+        if steps[position] > BATCH_MAX_PERIODS:
+            results[position] = _batch_error(
+                item, f"{item.year}Q{item.quarter} is {steps[position]} quarters past the last "
+                      f"observation, the limit is {BATCH_MAX_PERIODS}"
+            )
+        else:
+            groups.setdefault(item.model, []).append(position)
 
-    # Get historical data once (same for all models)
-    historical = get_historical_sales(request.year, request.quarter, years_back=5)
+    # One fused pass over every period any model needs live
+    table = current_forecast_table()
+    live = sorted({
+        (items[p].year, items[p].quarter) for positions in groups.values() for p in positions
+        if table is None or table.lookup(items[p].model, items[p].year, items[p].quarter) is None
+    })
+    scored = {}
+    if live:
+        fused = fused_forecasts(list(groups), [p[0] for p in live], [p[1] for p in live])
+        scored = {name: dict(zip(live, values)) for name, values in fused.items()}
 
-    for model_name in request.models:
+    for model_name, positions in groups.items():
         try:
-            # Load model
-            model, info = load_model(model_name)
-
-            # Make prediction with year/quarter context
-            if info['type'] == 'ml':
-                features = prepare_ml_features(year=request.year, quarter=request.quarter)
-                prediction = float(model.predict(features)[0])
-            elif info['type'] == 'timeseries':
-                prediction = prepare_ts_forecast(
-                    model,
-                    target_year=request.year,
-                    target_quarter=request.quarter,
-                    model_name=model_name
+            with model_scope(model_name), observe_model(model_name, 'batch'):
+                predictions, optimistic, pessimistic, info = predict_periods(
+                    model_name,
+                    [items[p].year for p in positions],
+                    [items[p].quarter for p in positions],
+                    scored=scored.get(model_name),
+                    table=table
                 )
-                if prediction is None:
-                    prediction = 0.0  # Fallback for failed forecasts
-            else:
-                continue
+        except Exception as e:
+            for position in positions:
+                results[position] = _batch_error(items[position], str(e))
+            continue
 
-            # Calculate scenarios for this model
-            scenarios = calculate_scenarios(prediction, info)
+        for k, position in enumerate(positions):
+            results[position] = _batch_result(
+                items[position], info, float(predictions[k]), float(optimistic[k]), float(pessimistic[k])
+            )
+
+    if include_historical:
+        histories = get_historical_sales_many(
+            [item.year for item in items], [item.quarter for item in items], years_back=5
+        )
+        for result, historical in zip(results, histories):
+            result['historical'] = historical
+
+    return results
+
+
+def _batch_result(item: PredictionRequest, info: dict, prediction: float, optimistic: float, pessimistic: float):
+    if np.isnan(prediction):
+        return _batch_error(item, 'Time series prediction failed')
+    return {
+        'success': True,
+        'model': item.model,
+        'year': item.year,
+        'quarter': item.quarter,
+        'prediction': prediction,
+        'prediction_formatted': f"{prediction:,.2f}",
+        'scenarios': format_scenarios(prediction, optimistic, pessimistic, info),
+        'type': info['type']
+    }
+
+
+def _batch_error(item: PredictionRequest, error: str):
+    return {
+        'success': False,
+        'model': item.model,
+        'year': item.year,
+        'quarter': item.quarter,
+        'error': error
+    }
+
+
+@app.post("/api/predict/batch")
+async def predict_batch_endpoint(request: BatchPredictionRequest):
+    """Make predictions for many (model, year, quarter) triples in one call"""
+    if len(request.items) > BATCH_MAX_ITEMS:
+        return JSONResponse({
+            'error': f"Batch has {len(request.items)} items, the limit is {BATCH_MAX_ITEMS}",
+            'success': False
+        }, status_code=400)
+
+    results = await INFERENCE_POOL.run(predict_batch, request.items, request.include_historical)
+    failed = sum(1 for r in results if not r['success'])
+
+    return JSONResponse({
+        'success': True,
+        'results': results,
+        'count': len(results),
+        'failed': failed
+    })
+
+
+def forecast_path(model_name: str, year: int, quarter: int):
+    """Every quarter from the last observation up to the target period
+
+    Raises:
+        ValueError: If the target is not after the last complete observation,
+            or is more than `FORECAST_PATH_MAX_PERIODS` quarters past it
+    """
+    if not 1 <= quarter <= 4:
+        raise ValueError(f"Quarter must be between 1 and 4, got {quarter}")
+
+    data = load_historical_data()
+    last_year = int(data.hist_years[-1])
+    last_quarter = int(data.hist_quarters[-1])
+    if (year, quarter) <= (last_year, last_quarter):
+        raise ValueError(
+            f"Target {year}Q{quarter} is not after the last observation {last_year}Q{last_quarter}"
+        )
+
+    # First forecast period is the quarter right after the last observation
+    first_year, first_quarter = (last_year + 1, 1) if last_quarter == 4 else (last_year, last_quarter + 1)
+    periods = (year - first_year) * 4 + (quarter - first_quarter) + 1
+    if periods > FORECAST_PATH_MAX_PERIODS:
+        raise ValueError(
+            f"Path to {year}Q{quarter} covers {periods} quarters, the limit is {FORECAST_PATH_MAX_PERIODS}"
+        )
+    years, quarters = quarter_range(first_year, first_quarter, year, quarter)
+    predictions, optimistic, pessimistic, info = predict_periods(model_name, years, quarters)
+
+    return years, quarters, predictions, optimistic, pessimistic, info, (last_year, last_quarter)
+
+
+def forecast_path_response(request: PredictionRequest):
+    """Blocking body of /api/forecast/path (runs on the inference pool)"""
+    try:
+        years, quarters, predictions, optimistic, pessimistic, info, last = forecast_path(
+            request.model, request.year, request.quarter
+        )
+    except ValueError as e:
+        return JSONResponse({'error': str(e), 'success': False}, status_code=400)
+    except Exception as e:
+        return JSONResponse({'error': str(e), 'success': False}, status_code=500)
+
+    if np.isnan(predictions).any():
+        return JSONResponse({
+            'error': 'Time series prediction failed',
+            'note': 'This model may require exogenous variables or forecast horizon is too long'
+        }, status_code=400)
+
+    path = []
+    for year, quarter, prediction, high, low in zip(years, quarters, predictions, optimistic, pessimistic):
+        prediction = float(prediction)
+        path.append({
+            'year': int(year),
+            'quarter': int(quarter),
+            'prediction': prediction,
+            'prediction_formatted': f"{prediction:,.2f}",
+            'scenarios': format_scenarios(prediction, high, low, info)
+        })
+
+    return JSONResponse({
+        'success': True,
+        'model': request.model,
+        'type': info['type'],
+        'last_observation': {'year': last[0], 'quarter': last[1]},
+        'path': path,
+        'count': len(path),
+        'metrics': info['metrics']
+    })
+
+
+@app.post("/api/forecast/path")
+async def forecast_path_endpoint(request: PredictionRequest):
+    """Forecast every quarter from the last observation to the target in one call"""
+    return await INFERENCE_POOL.run(forecast_path_response, request)
+
+
+def parse_period(value: str):
+    """Parse a period such as `2025Q1` (also `2025-Q1`, `2025q1`) into (year, quarter)
+
+    Raises:
+        ValueError: If the value is not a year followed by a quarter 1-4
+    """
+    match = re.fullmatch(r'\s*(\d{4})\s*-?\s*[Qq]([1-4])\s*', value)
+    if match is None:
+        raise ValueError(f"Invalid period '{value}', expected e.g. 2025Q1")
+    return int(match.group(1)), int(match.group(2))
 
-            results.append({
-                'model': model_name,
-                'prediction': prediction,
-                'prediction_formatted': f"{prediction:,.2f}",
-                'scenarios': scenarios,
-                'metrics': info['metrics'],
-                'type': info['type']
-            })
 
+def forecast_matrix(model_names: List[str], years, quarters):
+    """Predictions and scenario bounds of every model over every period
+
+    Periods the forecast table misses are scored for the tree and linear
+    models by the fused engines in one pass; every other model goes
+    through one `predict_periods` call (a single batched `predict` or one
+    forecast up to the furthest period).
+
+    Returns:
+        Tuple (predictions, optimistic, pessimistic, errors); the arrays have
+        shape (models, periods) with NaN for failed forecasts and `errors`
+        maps model names to the reason their row is incomplete
+    """
+    shape = (len(model_names), len(years))
+    predictions = np.full(shape, np.nan)
+    optimistic = np.full(shape, np.nan)
+    pessimistic = np.full(shape, np.nan)
+    errors = {}
+
+    # One dataset/table check for the whole matrix
+    table = current_forecast_table()
+    live = table_misses(table, model_names, years, quarters)
+    scored = {}
+    if live:
+        fused = fused_forecasts(model_names, [p[0] for p in live], [p[1] for p in live])
+        scored = {name: dict(zip(live, values)) for name, values in fused.items()}
+
+    for i, name in enumerate(model_names):
+        try:
+            with model_scope(name), observe_model(name, 'matrix'):
+                predictions[i], optimistic[i], pessimistic[i], _ = predict_periods(
+                    name, years, quarters, scored=scored.get(name), table=table
+                )
         except Exception as e:
-            results.append({
-                'model': model_name,
-                'error': str(e),
-                'success': False
-            })
+            errors[name] = str(e)
+            continue
+        if np.isnan(predictions[i]).any():
+            errors[name] = 'Time series prediction failed'
+
+    return predictions, optimistic, pessimistic, errors
+
+
+def forecast_matrix_response(model_names: List[str], start: str, end: str):
+    """Blocking body of /api/forecast/matrix (runs on the inference pool)"""
+    try:
+        first_year, first_quarter = parse_period(start)
+        last_year, last_quarter = parse_period(end)
+    except ValueError as e:
+        return JSONResponse({'error': str(e), 'success': False}, status_code=400)
+
+    years, quarters = quarter_range(first_year, first_quarter, last_year, last_quarter)
+    if len(years) == 0:
+        return JSONResponse({
+            'error': f"'from' ({start}) must not be after 'to' ({end})",
+            'success': False
+        }, status_code=400)
+    if len(years) > FORECAST_MATRIX_MAX_PERIODS:
+        return JSONResponse({
+            'error': f"Range covers {len(years)} quarters, the limit is {FORECAST_MATRIX_MAX_PERIODS}",
+            'success': False
+        }, status_code=400)
+
+    if not model_names:
+        model_names = list(MODEL_REGISTRY['ml_models']) + list(MODEL_REGISTRY['ts_models'])
+    model_names = list(dict.fromkeys(model_names))
+    unknown = [name for name in model_names
+               if name not in MODEL_REGISTRY['ml_models'] and name not in MODEL_REGISTRY['ts_models']]
+    if unknown:
+        return JSONResponse({
+            'error': f"Models not found: {', '.join(unknown)}",
+            'success': False
+        }, status_code=404)
+
+    try:
+        predictions, optimistic, pessimistic, errors = forecast_matrix(model_names, years, quarters)
+    except Exception as e:
+        return JSONResponse({'error': str(e), 'success': False}, status_code=500)
+
+    def rows(matrix):
+        # NaN (failed forecast) becomes null
+        return [[None if np.isnan(v) else float(v) for v in row] for row in matrix]
+
+    return JSONResponse({
+        'success': True,
+        'from': {'year': first_year, 'quarter': first_quarter},
+        'to': {'year': last_year, 'quarter': last_quarter},
+        'models': model_names,
+        'types': [get_registry_entry(name)['type'] for name in model_names],
+        'periods': [f"{year}Q{quarter}" for year, quarter in zip(years, quarters)],
+        'predictions': rows(predictions),
+        'optimistic': rows(optimistic),
+        'pessimistic': rows(pessimistic),
+        'errors': errors
+    })
+
+
+@app.get("/api/forecast/matrix")
+async def forecast_matrix_endpoint(
+    start: str = Query(..., alias="from"),
+    end: str = Query(..., alias="to"),
+    models: Optional[List[str]] = Query(None)
+):
+    """Models × quarters prediction matrix with scenario bounds
+
+    `models` is repeated once per model (`?models=A&models=B`) because model
+    names can contain commas; all models are returned when it is omitted.
+    """
+    return await INFERENCE_POOL.run(forecast_matrix_response, models, start, end)
+
+
+def compare_entry(model_name: str, year: int, quarter: int, features=None, scored: float = None):
+    """Prediction and scenarios for one model in a comparison (None to skip it)"""
+    try:
+        if get_registry_entry(model_name)['type'] not in ('ml', 'timeseries'):
+            return None
+
+        # Make prediction with year/quarter context
+        with model_scope(model_name), observe_model(model_name, 'compare'):
+            prediction, scenarios, info = predict_one(model_name, year, quarter, features=features, scored=scored)
+            if prediction is None:
+                prediction = 0.0  # Fallback for failed forecasts
+                scenarios = calculate_scenarios(prediction, info)
+
+        return {
+            'model': model_name,
+            'prediction': prediction,
+            'prediction_formatted': f"{prediction:,.2f}",
+            'scenarios': scenarios,
+            'metrics': info['metrics'],
+            'type': info['type']
+        }
+
+    except Exception as e:
+        return {
+            'model': model_name,
+            'error': str(e),
+            'success': False
+        }
+
+
+def compare_chunk(model_names: List[str], year: int, quarter: int, features, scored: dict, publish=None):
+    """Run `compare_entry` for a slice of the requested models (one pool job)
+
+    Args:
+        publish: Optional callable `publish(i, entry)` called as soon as the
+            i-th model of the slice is done (used for streaming)
+    """
+    entries = []
+    for i, name in enumerate(model_names):
+        entries.append(compare_entry(name, year, quarter, features, scored.get(name)))
+        if publish is not None:
+            publish(i, entries[-1])
+    return entries
+
+
+def compare_context(model_names: List[str], year: int, quarter: int):
+    """Inputs shared by every model in a comparison
+
+    Returns:
+        Tuple (historical, features, scored); `scored` holds fused-engine
+        predictions for the requested tree/linear models the forecast table misses
+    """
+    # Historical data and ML features are the same for all models
+    historical = get_historical_sales(year, quarter, years_back=5)
+    features = prepare_ml_features(year=year, quarter=quarter)
+
+    live = [name for name in model_names if lookup_forecast(name, year, quarter) is None]
+    fused = fused_forecasts(live, [year], [quarter])
+    scored = {name: float(values[0]) for name, values in fused.items()}
+    return historical, features, scored
+
+
+@app.post("/api/compare")
+async def compare(request: ComparisonRequest):
+    """Compare predictions from multiple models with scenarios"""
+
+    historical, features, scored = await INFERENCE_POOL.run(
+        compare_context, request.models, request.year, request.quarter
+    )
+
+    # Fan the models out across the pool, at most one job per worker
+    n_jobs = max(1, min(INFERENCE_POOL.workers, len(request.models)))
+    chunks = [request.models[i::n_jobs] for i in range(n_jobs)]
+    chunk_results = await asyncio.gather(*[
+        INFERENCE_POOL.run(compare_chunk, chunk, request.year, request.quarter, features, scored)
+        for chunk in chunks
+    ])
+
+    # Reassemble in request order so ties in R² keep their original order
+    by_position = {}
+    for i, entries in enumerate(chunk_results):
+        for j, entry in enumerate(entries):
+            by_position[i + j * n_jobs] = entry
+    results = [by_position[k] for k in sorted(by_position) if by_position[k] is not None]
 
     # Sort by R² score
     results.sort(key=lambda x: x.get('metrics', {}).get('test_r2', -999), reverse=True)
@@ -527,58 +1320,215 @@ async def compare(request: ComparisonRequest):
     })
 
 
-@app.get("/api/stats")
-async def get_statistics():
-    """Get overall statistics"""
+@app.post("/api/compare/stream")
+async def compare_stream(request: ComparisonRequest, http_request: Request,
+                         stream_format: Optional[str] = Query(None, alias="format")):
+    """Stream each model's comparison result as soon as it is ready
 
-    # Calculate statistics from registry
-    ml_count = len(MODEL_REGISTRY['ml_models'])
-    ts_count = len(MODEL_REGISTRY['ts_models'])
+    Frames are newline-delimited JSON (default) or Server-Sent Events
+    (`?format=sse` or `Accept: text/event-stream`): one `context` frame with
+    the historical data, one `result` frame per model in completion order
+    and a final `summary` frame with the R²-sorted model order.
+    """
+    if stream_format is None:
+        accept = http_request.headers.get('accept', '')
+        stream_format = 'sse' if 'text/event-stream' in accept else 'ndjson'
+    if stream_format not in ('ndjson', 'sse'):
+        return JSONResponse({
+            'error': "format must be 'ndjson' or 'sse'",
+            'success': False
+        }, status_code=400)
 
-    # Find best models
-    all_models = []
+    # Resolved before streaming starts, so overload still returns a plain 503
+    context = await INFERENCE_POOL.run(compare_context, request.models, request.year, request.quarter)
 
-    for name, info in MODEL_REGISTRY['ml_models'].items():
-        all_models.append({
-            'name': name,
-            'type': 'ML',
-            'r2': info['metrics'].get('test_r2', -999),
-            'mape': info['metrics'].get('test_mape', 999)
-        })
+    frames = compare_frames(request, *context)
+    if stream_format == 'sse':
+        body = (f"event: {event}\ndata: {stream_json(frame)}\n\n" async for event, frame in frames)
+        media_type = 'text/event-stream'
+    else:
+        body = (stream_json(frame) + "\n" async for _, frame in frames)
+        media_type = 'application/x-ndjson'
+    return StreamingResponse(body, media_type=media_type, headers={'Cache-Control': 'no-cache'})
 
-    for name, info in MODEL_REGISTRY['ts_models'].items():
-        all_models.append({
-            'name': name,
-            'type': 'Time Series',
-            'r2': info['metrics'].get('test_r2', -999),
-            'mape': info['metrics'].get('test_mape', 999)
-        })
 
-    # Sort by R²
-    all_models.sort(key=lambda x: x['r2'], reverse=True)
+async def compare_frames(request: ComparisonRequest, historical, features, scored):
+    """Yield (event, frame) pairs for a streamed comparison"""
+    start = time.perf_counter()
+    models = request.models
+    yield 'context', {
+        'event': 'context',
+        'year': request.year,
+        'quarter': request.quarter,
+        'historical': historical,
+        'models': len(models)
+    }
+
+    # ML models (table hits, fused scores, fast predict) first, forecasts last
+    order = sorted(range(len(models)), key=lambda i: MODEL_REGISTRY['ts_models'].get(models[i]) is not None)
+    n_jobs = max(1, min(INFERENCE_POOL.workers, len(models)))
+    chunks = [order[i::n_jobs] for i in range(n_jobs)]
+
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+
+    def publisher(chunk):
+        return lambda i, entry: loop.call_soon_threadsafe(queue.put_nowait, (chunk[i], entry))
+
+    jobs = [
+        asyncio.ensure_future(INFERENCE_POOL.run(
+            compare_chunk, [models[k] for k in chunk], request.year, request.quarter,
+            features, scored, publisher(chunk)
+        ))
+        for chunk in chunks
+    ]
+
+    async def finish():
+        # Entries published by a job are queued before the job's own result
+        outcomes = await asyncio.gather(*jobs, return_exceptions=True)
+        queue.put_nowait(None)
+        return outcomes
+
+    finished = asyncio.ensure_future(finish())
+    results = {}
+    try:
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+            index, entry = item
+            results[index] = entry
+            if entry is not None:
+                yield 'result', dict(entry, event='result', index=index)
+
+        # Models whose job never ran (pool overloaded or timed out)
+        for chunk, outcome in zip(chunks, finished.result()):
+            if not isinstance(outcome, Exception):
+                continue
+            for index in chunk:
+                if index not in results:
+                    results[index] = {'model': models[index], 'error': str(outcome), 'success': False}
+                    yield 'result', dict(results[index], event='result', index=index)
+    finally:
+        for job in jobs:
+            job.cancel()
+
+    # Same ordering as /api/compare: request order, then stable sort by R²
+    ranked = [results[i] for i in sorted(results) if results[i] is not None]
+    ranked.sort(key=lambda x: x.get('metrics', {}).get('test_r2', -999), reverse=True)
+    yield 'summary', {
+        'event': 'summary',
+        'success': True,
+        'year': request.year,
+        'quarter': request.quarter,
+        'order': [entry['model'] for entry in ranked],
+        'count': len(ranked),
+        'elapsed_ms': round((time.perf_counter() - start) * 1000, 1)
+    }
+
+
+def stream_json(frame: dict) -> str:
+    """Encode a stream frame the way JSONResponse encodes bodies"""
+    return json.dumps(frame, ensure_ascii=False, allow_nan=False, separators=(",", ":"))
 
-    best_overall = all_models[0] if all_models else None
-    best_ml = next((m for m in all_models if m['type'] == 'ML'), None)
-    best_ts = next((m for m in all_models if m['type'] == 'Time Series'), None)
 
+@app.get("/api/timings")
+async def get_timings():
+    """Per-model, per-stage latency histograms of the requests served so far"""
     return JSONResponse({
-        'total_models': ml_count + ts_count,
-        'ml_models': ml_count,
-        'ts_models': ts_count,
-        'best_overall': best_overall,
-        'best_ml': best_ml,
-        'best_ts': best_ts
+        'enabled': REQUEST_TIMING,
+        'buckets_ms': list(BUCKETS_MS) + ['+Inf'],
+        'dropped_series': STAGE_HISTOGRAMS.dropped,
+        'models': STAGE_HISTOGRAMS.snapshot()
     })
 
 
+@app.get("/api/stats")
+async def get_statistics(request: Request):
+    """Get overall statistics"""
+    return registry_view_response(request, 'stats')
+
+
+def registry_view_response(request: Request, name: str):
+    """Serve a precomputed registry view, or 304 if the client's copy is current"""
+    view = REGISTRY_VIEWS[name]
+    headers = {'ETag': view.etag, 'Cache-Control': 'no-cache'}
+    if view.matches(request.headers.get('if-none-match')):
+        return Response(status_code=304, headers=headers)
+    return Response(view.body, media_type='application/json', headers=headers)
+
+
 @app.get("/api/health")
 async def health_check():
-    """Health check endpoint"""
+    """Health check endpoint (503 until the startup warm-up has finished)"""
+    ready = WARMUP.ready
     return JSONResponse({
-        'status': 'healthy',
+        'status': 'healthy' if ready else 'warming_up',
         'models_loaded': MODEL_REGISTRY is not None,
-        'total_models': MODEL_REGISTRY['metadata']['total_models'] if MODEL_REGISTRY else 0
-    })
+        'total_models': MODEL_REGISTRY['metadata']['total_models'] if MODEL_REGISTRY else 0,
+        'dataset_version': DATASET.get().version,
+        'model_cache': MODEL_CACHE.stats(),
+        'forecast_table': FORECAST_TABLE.describe() if FORECAST_TABLE else None,
+        'inference': INFERENCE_POOL.stats(),
+        'ts_forecast_memo': TS_FORECAST_MEMO.stats(),
+        'predict_singleflight': PREDICT_FLIGHTS.stats(),
+        'warmup': WARMUP.stats()
+    }, status_code=200 if ready else 503)
+
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus text-format metrics"""
+    return Response(METRICS.render(), headers={'Content-Type': CONTENT_TYPE})
+
+
+@METRICS.collector
+def component_metrics(prefix: str) -> list:
+    """Counters kept by the cache, inference pool, single-flight and warm-up"""
+    cache = MODEL_CACHE.stats()
+    pool = INFERENCE_POOL.stats()
+    flights = PREDICT_FLIGHTS.stats()
+    memo = TS_FORECAST_MEMO.stats()
+    lines = []
+    for name, kind, documentation, value in (
+        ('model_cache_hits_total', 'counter', 'Model cache lookups served from memory', cache['hits']),
+        ('model_cache_misses_total', 'counter', 'Model cache lookups that loaded from disk', cache['misses']),
+        ('model_cache_evictions_total', 'counter', 'Models evicted from the cache', cache['evictions']),
+        ('model_cache_entries', 'gauge', 'Models held in the cache', cache['entries']),
+        ('model_cache_bytes', 'gauge', 'Estimated size of the cached models', cache['bytes']),
+        ('model_cache_max_bytes', 'gauge', 'Model cache memory budget', cache['max_bytes']),
+        ('inference_pending', 'gauge', 'Inference jobs running or waiting for a worker', pool['pending']),
+        ('inference_workers', 'gauge', 'Inference worker threads', pool['workers']),
+        ('inference_rejected_total', 'counter', 'Jobs rejected because the inference queue was full', pool['rejected']),
+        ('inference_timeouts_total', 'counter', 'Jobs abandoned after the request timeout', pool['timeouts']),
+        ('predict_executions_total', 'counter', '/api/predict computations started', flights['executions']),
+        ('predict_coalesced_total', 'counter', '/api/predict requests that joined an identical in-flight one', flights['coalesced']),
+        ('predict_cache_hits_total', 'counter', '/api/predict requests served from the short-lived cache', flights['cache_hits']),
+        ('predict_in_flight', 'gauge', 'Distinct /api/predict computations in flight', flights['in_flight']),
+        ('ts_forecast_memo_hits_total', 'counter', 'Forecasts sliced from a memoized trajectory', memo['hits']),
+        ('ts_forecast_memo_extensions_total', 'counter', 'Memoized trajectories recomputed for a longer horizon', memo['extensions']),
+        ('ts_forecast_memo_uncached_total', 'counter', 'Forecasts longer than the memo limit computed without memoizing', memo['uncached']),
+        ('warmup_ready', 'gauge', '1 once the startup warm-up has finished', int(WARMUP.ready)),
+    ):
+        lines.extend(metric_lines(prefix + name, kind, documentation, [({}, value)]))
+    return lines
+
+
+@METRICS.collector
+def stage_metrics(prefix: str) -> list:
+    """Per-model, per-stage histograms recorded by request timing"""
+    name = prefix + 'stage_duration_seconds'
+    lines = metric_lines(name, 'histogram', 'Request stage latency by model and stage', [])
+    buckets = [bound / 1000 for bound in BUCKETS_MS]
+    for model, stages in STAGE_HISTOGRAMS.snapshot().items():
+        for stage, histogram in stages.items():
+            cumulative = list(histogram['buckets'].values())
+            counts = [cumulative[0]] + [b - a for a, b in zip(cumulative, cumulative[1:])]
+            lines.extend(histogram_samples(
+                name, {'model': model, 'stage': stage}, buckets, counts,
+                histogram['count'], histogram['sum_ms'] / 1000
+            ))
+    return lines
 
 
 if __name__ == "__main__":
@@ -0,0 +1,219 @@
+"""
+Loan Sales Prediction - Prometheus text-format metrics
+
+A small, dependency-free subset of the Prometheus client: labelled
+counters, gauges and histograms kept in a `MetricsRegistry`, plus
+collectors that read other components' counters (model cache, inference
+pool, ...) when `/metrics` is scraped. `render()` produces the text
+exposition format (version 0.0.4).
+"""
+
+import bisect
+import math
+import threading
+from time import perf_counter
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Latency bucket upper bounds in seconds
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_value(value) -> str:
+    if value == math.inf:
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def format_sample(name: str, labels: dict, value) -> str:
+    """One exposition line: name{label="value",...} value"""
+    if labels:
+        label_text = ','.join(f'{key}="{_escape(val)}"' for key, val in labels.items())
+        return f'{name}{{{label_text}}} {_format_value(value)}'
+    return f'{name} {_format_value(value)}'
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name: str, documentation: str, labels=()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._values = {}  # label values tuple -> value
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(str(labels[label]) for label in self.labels)
+
+    def header(self) -> list:
+        return [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.kind}']
+
+    def render(self) -> list:
+        with self._lock:
+            values = sorted(self._values.items())
+        lines = self.header()
+        for key, value in values:
+            lines.append(format_sample(self.name, dict(zip(self.labels, key)), value))
+        return lines
+
+
+class Counter(_Metric):
+    """Monotonically increasing count"""
+
+    kind = 'counter'
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    """Value that goes up and down"""
+
+    kind = 'gauge'
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    """Observations counted into cumulative `le` buckets, with their count and sum"""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labels=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                # Per-bucket counts (last one is +Inf), then count and sum
+                series = self._values[key] = [0] * (len(self.buckets) + 3)
+            series[bisect.bisect_left(self.buckets, value)] += 1
+            series[-2] += 1
+            series[-1] += value
+
+    def render(self) -> list:
+        with self._lock:
+            values = sorted((key, list(series)) for key, series in self._values.items())
+        lines = self.header()
+        for key, series in values:
+            lines.extend(histogram_samples(
+                self.name, dict(zip(self.labels, key)), self.buckets, series[:-2], series[-2], series[-1]
+            ))
+        return lines
+
+
+def metric_lines(name: str, kind: str, documentation: str, samples) -> list:
+    """Exposition lines of a metric from (labels, value) pairs (for collectors)"""
+    lines = [f'# HELP {name} {documentation}', f'# TYPE {name} {kind}']
+    lines.extend(format_sample(name, labels, value) for labels, value in samples)
+    return lines
+
+
+def histogram_samples(name: str, labels: dict, buckets, counts, count: int, total: float) -> list:
+    """Exposition lines of one histogram series from per-bucket (non-cumulative) counts"""
+    lines, cumulative = [], 0
+    for bound, bucket_count in zip(tuple(buckets) + (math.inf,), counts):
+        cumulative += bucket_count
+        lines.append(format_sample(f'{name}_bucket', {**labels, 'le': bound}, cumulative))
+    lines.append(format_sample(f'{name}_count', labels, count))
+    lines.append(format_sample(f'{name}_sum', labels, float(total)))
+    return lines
+
+
+class MetricsRegistry:
+    """Metrics and scrape-time collectors rendered together by `/metrics`"""
+
+    def __init__(self, prefix: str = ''):
+        self.prefix = prefix
+        self._metrics = []
+        self._collectors = []
+
+    def counter(self, name: str, documentation: str, labels=()) -> Counter:
+        return self._register(Counter(self.prefix + name, documentation, labels))
+
+    def gauge(self, name: str, documentation: str, labels=()) -> Gauge:
+        return self._register(Gauge(self.prefix + name, documentation, labels))
+
+    def histogram(self, name: str, documentation: str, labels=(), buckets=DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(self.prefix + name, documentation, labels, buckets))
+
+    def _register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def collector(self, func):
+        """Register `func(prefix)` returning exposition lines, called on every scrape"""
+        self._collectors.append(func)
+        return func
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collect in self._collectors:
+            lines.extend(collect(self.prefix))
+        return '\n'.join(lines) + '\n'
+
+
+class RequestMetricsMiddleware:
+    """ASGI middleware counting HTTP requests per endpoint
+
+    Requests are labelled with the matched route's path template (so
+    `/api/model/{model_name}` is one series), or `unmatched` when no route
+    handled them.
+    """
+
+    def __init__(self, app, requests: Counter, latency: Histogram, in_flight: Gauge):
+        self.app = app
+        self.requests = requests
+        self.latency = latency
+        self.in_flight = in_flight
+        self._paths = None
+
+    def _route_path(self, scope) -> str:
+        if self._paths is None:
+            # Route table of the application this middleware wraps
+            routes = getattr(scope.get('app'), 'routes', [])
+            self._paths = {getattr(route, 'endpoint', None) or route.app: route.path for route in routes}
+        return self._paths.get(scope.get('endpoint'), 'unmatched')
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            return await self.app(scope, receive, send)
+
+        status = 500
+        start = perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            await send(message)
+
+        self.in_flight.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self.in_flight.dec()
+            # The router records the matched endpoint in the shared scope
+            path = self._route_path(scope)
+            self.requests.inc(method=scope['method'], endpoint=path, status=status)
+            self.latency.observe(perf_counter() - start, endpoint=path)
@@ -0,0 +1,106 @@
+"""
+Loan Sales Prediction - In-process model cache
+"""
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+
+class ModelCache:
+    """Bounded LRU cache of loaded model artifacts
+
+    Entries are keyed by artifact filename and validated against the file's
+    mtime and size, so a retrained artifact is picked up on the next request.
+    Each entry is weighed by its size on disk, which is used as the memory
+    estimate for the budget.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # filename -> (signature, model, size)
+        self._lock = threading.Lock()
+        self._loading = {}  # filename -> lock held while the artifact loads
+
+    @staticmethod
+    def signature(path: Path):
+        """File version used to detect retrained artifacts"""
+        stat = path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def get(self, path: Path, loader):
+        """Return the model stored at `path`, loading it with `loader` on a miss"""
+        key = path.name
+        signature = self.signature(path)
+
+        with self._lock:
+            model = self._lookup(key, signature)
+            if model is not None:
+                self.hits += 1
+                return model
+            load_lock = self._loading.setdefault(key, threading.Lock())
+
+        # Only one thread loads a given artifact; the others wait and reuse it
+        with load_lock:
+            with self._lock:
+                model = self._lookup(key, signature)
+                if model is not None:
+                    self.hits += 1
+                    return model
+                self.misses += 1
+
+            model = loader(path)
+
+            with self._lock:
+                self._store(key, signature, model, signature[1])
+                self._loading.pop(key, None)
+
+        return model
+
+    def _lookup(self, key, signature):
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != signature:
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def _store(self, key, signature, model, size):
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.current_bytes -= old[2]
+
+        # Artifacts larger than the whole budget are served but never cached
+        if size > self.max_bytes:
+            return
+
+        self._entries[key] = (signature, model, size)
+        self.current_bytes += size
+
+        while self.current_bytes > self.max_bytes:
+            _, (_, _, evicted_size) = self._entries.popitem(last=False)
+            self.current_bytes -= evicted_size
+            self.evictions += 1
+
+    def clear(self):
+        """Drop every cached model"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> dict:
+        """Entry count, byte usage against the budget, and hit/miss/eviction counts"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
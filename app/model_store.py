@@ -0,0 +1,96 @@
+"""
+Loan Sales Prediction - Memory-mapped model store
+
+Two layouts keep model payloads in memory-mapped files, so they are backed
+by the OS page cache and shared read-only by every worker process that
+loads the same file instead of each worker holding a private copy:
+
+    arrays   named NumPy arrays + JSON metadata in one file (`save_arrays`),
+             used by the array-backed model formats
+    joblib   uncompressed joblib for other sklearn estimators (`dump_model`)
+
+joblib maps only plain NumPy payloads: objects that copy their arrays into
+native memory when unpickled (sklearn's Cython `Tree`, boosters) still get
+a private copy per process.
+"""
+
+import json
+import os
+import struct
+from pathlib import Path
+
+import numpy as np
+
+ARRAYS_MAGIC = b'LSPARRS1'
+ALIGNMENT = 64
+
+
+def _align(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def save_arrays(path: Path, arrays: dict, meta: dict = None):
+    """Write named arrays and JSON metadata to one memory-mappable file
+
+    Layout: magic, header length (uint64 LE), JSON header, then the raw
+    C-order bytes of every array at a 64-byte aligned offset. The file is
+    written to a temporary name and atomically renamed into place.
+    """
+    path = Path(path)
+    arrays = {name: np.ascontiguousarray(array) for name, array in arrays.items()}
+
+    entries, offset = {}, 0
+    for name, array in arrays.items():
+        offset = _align(offset)
+        entries[name] = {'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': offset}
+        offset += array.nbytes
+
+    header = json.dumps({'meta': meta or {}, 'arrays': entries}).encode('utf-8')
+    data_start = _align(len(ARRAYS_MAGIC) + 8 + len(header))
+
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(ARRAYS_MAGIC)
+        f.write(struct.pack('<Q', len(header)))
+        f.write(header)
+        for name, array in arrays.items():
+            f.write(b'\0' * (data_start + entries[name]['offset'] - f.tell()))
+            f.write(array.tobytes())
+    os.replace(tmp_path, path)
+
+
+def load_arrays(path: Path):
+    """Map a file written by `save_arrays`
+
+    Returns:
+        Tuple (meta, {name: read-only array view of the mapped file})
+    """
+    buffer = np.memmap(path, dtype=np.uint8, mode='r')
+    if bytes(buffer[:len(ARRAYS_MAGIC)]) != ARRAYS_MAGIC:
+        raise ValueError(f"{path} is not an array store file")
+
+    header_start = len(ARRAYS_MAGIC) + 8
+    (header_length,) = struct.unpack('<Q', bytes(buffer[len(ARRAYS_MAGIC):header_start]))
+    header = json.loads(bytes(buffer[header_start:header_start + header_length]).decode('utf-8'))
+    data_start = _align(header_start + header_length)
+
+    arrays = {}
+    for name, entry in header['arrays'].items():
+        dtype = np.dtype(entry['dtype'])
+        start = data_start + entry['offset']
+        count = int(np.prod(entry['shape'], dtype=np.int64))
+        arrays[name] = buffer[start:start + count * dtype.itemsize].view(dtype).reshape(entry['shape'])
+    return header['meta'], arrays
+
+
+def dump_model(model, path: Path):
+    """Write `model` so its arrays can be memory-mapped by `load_model`"""
+    import joblib
+    # Compression would force arrays to be decompressed into private memory
+    joblib.dump(model, str(path), compress=0)
+
+
+def load_model(path: Path):
+    """Load a model written by `dump_model` with its arrays mapped read-only"""
+    import joblib
+    return joblib.load(str(path), mmap_mode='r')
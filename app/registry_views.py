@@ -0,0 +1,146 @@
+"""
+Loan Sales Prediction - Precomputed registry views
+"""
+
+import hashlib
+import json
+
+
+class RegistryView:
+    """A response body serialized once per registry version, with a strong ETag"""
+
+    def __init__(self, content: dict):
+        # Same encoding as JSONResponse.render
+        self.body = json.dumps(
+            content,
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":")
+        ).encode("utf-8")
+        self.etag = '"' + hashlib.sha256(self.body).hexdigest()[:32] + '"'
+
+    def matches(self, if_none_match: str) -> bool:
+        """True if an If-None-Match header value covers this view"""
+        if not if_none_match:
+            return False
+        tags = [tag.strip() for tag in if_none_match.split(',')]
+        # If-None-Match uses weak comparison
+        return '*' in tags or any(tag.removeprefix('W/') == self.etag for tag in tags)
+
+
+def build_registry_views(registry: dict) -> dict:
+    """Every cacheable registry view, keyed by name"""
+    return {
+        'models': RegistryView(build_models_view(registry)),
+        'stats': RegistryView(build_stats_view(registry))
+    }
+
+
+def build_models_view(registry: dict) -> dict:
+    """All available models organized by type (body of /api/models)"""
+    # Organize models by category
+    ml_models = []
+    ts_models = []
+
+    for name, info in registry['ml_models'].items():
+        ml_models.append({
+            'name': name,
+            'type': 'ml',
+            'metrics': info['metrics']
+        })
+
+    for name, info in registry['ts_models'].items():
+        ts_models.append({
+            'name': name,
+            'type': 'timeseries',
+            'metrics': info['metrics']
+        })
+
+    # Sort by test_r2
+    ml_models.sort(key=lambda x: x['metrics'].get('test_r2', -999), reverse=True)
+    ts_models.sort(key=lambda x: x['metrics'].get('test_r2', -999), reverse=True)
+
+    # Categorize models
+    recommended = []
+    advanced_ml = []
+    time_series = []
+    experimental = []
+
+    # Top 5 performers
+    all_models = ml_models + ts_models
+    all_models.sort(key=lambda x: x['metrics'].get('test_r2', -999), reverse=True)
+
+    for model in all_models[:5]:
+        if model['metrics'].get('test_r2', -999) > 0.3:
+            recommended.append(model['name'])
+
+    # Advanced ML (good performance)
+    for model in ml_models:
+        if model['metrics'].get('test_r2', -999) > 0.1 and model['name'] not in recommended:
+            advanced_ml.append(model['name'])
+
+    # Time series
+    for model in ts_models:
+        time_series.append(model['name'])
+
+    # Experimental (poor performance)
+    for model in ml_models:
+        if model['metrics'].get('test_r2', -999) <= 0.0:
+            experimental.append(model['name'])
+
+    return {
+        'categories': {
+            'recommended': recommended,
+            'advanced_ml': advanced_ml,
+            'time_series': time_series,
+            'experimental': experimental
+        },
+        'models': {
+            'ml': ml_models,
+            'ts': ts_models
+        },
+        'total': len(ml_models) + len(ts_models)
+    }
+
+
+def build_stats_view(registry: dict) -> dict:
+    """Overall statistics (body of /api/stats)"""
+    # Calculate statistics from registry
+    ml_count = len(registry['ml_models'])
+    ts_count = len(registry['ts_models'])
+
+    # Find best models
+    all_models = []
+
+    for name, info in registry['ml_models'].items():
+        all_models.append({
+            'name': name,
+            'type': 'ML',
+            'r2': info['metrics'].get('test_r2', -999),
+            'mape': info['metrics'].get('test_mape', 999)
+        })
+
+    for name, info in registry['ts_models'].items():
+        all_models.append({
+            'name': name,
+            'type': 'Time Series',
+            'r2': info['metrics'].get('test_r2', -999),
+            'mape': info['metrics'].get('test_mape', 999)
+        })
+
+    # Sort by R²
+    all_models.sort(key=lambda x: x['r2'], reverse=True)
+
+    best_overall = all_models[0] if all_models else None
+    best_ml = next((m for m in all_models if m['type'] == 'ML'), None)
+    best_ts = next((m for m in all_models if m['type'] == 'Time Series'), None)
+
+    return {
+        'total_models': ml_count + ts_count,
+        'ml_models': ml_count,
+        'ts_models': ts_count,
+        'best_overall': best_overall,
+        'best_ml': best_ml,
+        'best_ts': best_ts
+    }
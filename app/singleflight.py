@@ -0,0 +1,87 @@
+"""
+Loan Sales Prediction - Request coalescing with a short-lived result cache
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+
+
+class SingleFlight:
+    """Shares one in-flight computation between concurrent identical calls
+
+    The first caller for a key starts the computation as its own task; every
+    caller that arrives while it runs awaits the same task instead of
+    starting another one. Because the work is not tied to the first caller,
+    a client that disconnects does not cancel it for the others. Results
+    accepted by `cacheable` are then served for `ttl` seconds without
+    recomputing. Exceptions reach every waiter and are never cached.
+
+    Not thread-safe: use it from the event loop only.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 1024, cacheable=None):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.cacheable = cacheable or (lambda result: True)
+        self.executions = 0
+        self.coalesced = 0
+        self.cache_hits = 0
+        self._in_flight = {}  # key -> asyncio.Task
+        self._results = OrderedDict()  # key -> (expires_at, result), oldest first
+
+    async def run(self, key, func):
+        """Result of `await func()` for `key`, shared with concurrent callers"""
+        cached = self._results.get(key)
+        if cached is not None:
+            if cached[0] > time.monotonic():
+                self.cache_hits += 1
+                return cached[1]
+            del self._results[key]
+
+        task = self._in_flight.get(key)
+        if task is None:
+            self.executions += 1
+            task = asyncio.ensure_future(self._execute(key, func))
+            # Retrieve the exception even if every waiter went away
+            task.add_done_callback(lambda done: done.cancelled() or done.exception())
+            self._in_flight[key] = task
+        else:
+            self.coalesced += 1
+
+        return await asyncio.shield(task)
+
+    async def _execute(self, key, func):
+        try:
+            result = await func()
+            if self.ttl > 0 and self.cacheable(result):
+                self._store(key, result)
+            return result
+        finally:
+            self._in_flight.pop(key, None)
+
+    def _store(self, key, result):
+        now = time.monotonic()
+        self._results.pop(key, None)
+        self._results[key] = (now + self.ttl, result)
+
+        # Entries share one TTL, so the oldest ones expire first
+        while self._results:
+            oldest_key, (expires_at, _) = next(iter(self._results.items()))
+            if expires_at > now and len(self._results) <= self.max_entries:
+                break
+            del self._results[oldest_key]
+
+    def clear(self):
+        self._results.clear()
+
+    def stats(self) -> dict:
+        """Cache TTL, in-flight and cached keys, and execution/coalesced/cache-hit counts"""
+        return {
+            'ttl_seconds': self.ttl,
+            'executions': self.executions,
+            'coalesced': self.coalesced,
+            'cache_hits': self.cache_hits,
+            'in_flight': len(self._in_flight),
+            'cached': len(self._results)
+        }
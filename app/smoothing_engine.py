@@ -0,0 +1,108 @@
+"""
+Loan Sales Prediction - Closed-form Holt-Winters forecasting
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+from app import model_store
+
+
+class HoltWintersForecaster:
+    """Holt-Winters forecasts from the final level, trend and seasonal components
+
+    The forecast h quarters ahead is a closed-form expression
+
+        trend(h)  = l + phi_h b      (additive trend)
+                    l * b ** phi_h   (multiplicative trend)
+        y[h]      = trend(h) + s[(h - 1) % m]   (or * for multiplicative seasonality)
+
+    with phi_h = h, or phi + ... + phi^h for a damped trend, so any set of
+    horizons is evaluated at once without the training data or optimizer.
+    """
+
+    def __init__(self, trend: str, seasonal: str, level: float, slope: float = 0.0,
+                 damping: float = None, season=None):
+        self.trend = trend
+        self.seasonal = seasonal
+        self.level = float(level)
+        self.slope = float(slope)
+        self.damping = None if damping is None else float(damping)
+        self.season = np.asarray([] if season is None else season, dtype=np.float64)
+
+    @classmethod
+    def from_results(cls, results):
+        """Extract the final components from fitted statsmodels ExponentialSmoothing results
+
+        Raises:
+            ValueError: If the model uses a Box-Cox transform, bias removal or
+                a damped multiplicative trend
+        """
+        model = results.model
+        params = results.params
+        if params.get('use_boxcox') or params.get('remove_bias'):
+            raise ValueError("Box-Cox transforms and bias removal are not supported")
+        if model.trend == 'mul' and model.damped_trend:
+            # statsmodels re-runs the filter from initial_trend = b0 / phi to
+            # forecast, which does not reproduce its own fitted components here
+            raise ValueError("Damped multiplicative trends are not supported")
+
+        damping = float(params['damping_trend']) if model.damped_trend else None
+        slope = float(np.asarray(results.trend)[-1]) if model.trend else 0.0
+
+        season = None
+        if model.seasonal:
+            m = model.seasonal_periods
+            fitted = np.asarray(results.season, dtype=np.float64)
+            if len(fitted) <= m:
+                raise ValueError("Need more than one seasonal cycle of observations")
+            # statsmodels forecasts with s[n-m], ..., s[n-2], then s[n-m-1]
+            # (the last seasonal update is not used); reproduce it exactly
+            season = np.concatenate([fitted[-m:-1], fitted[-m - 1:-m]])
+
+        return cls(model.trend, model.seasonal, np.asarray(results.level)[-1], slope, damping, season)
+
+    def predict_horizons(self, horizons) -> np.ndarray:
+        """Forecasts for the given horizons (1 = first quarter after the data)"""
+        horizons = np.asarray(horizons, dtype=np.int64).reshape(-1)
+        if self.damping is None:
+            phi_h = horizons.astype(np.float64)
+        else:
+            # phi + phi^2 + ... + phi^h, accumulated like statsmodels does
+            powers = np.cumsum(self.damping ** np.arange(1, horizons.max(initial=0) + 1))
+            phi_h = powers[horizons - 1]
+
+        if self.trend == 'add':
+            values = self.level + self.slope * phi_h
+        elif self.trend == 'mul':
+            values = self.level * self.slope ** phi_h
+        else:
+            values = np.full(len(horizons), self.level)
+
+        if self.seasonal == 'add':
+            values = values + self.season[(horizons - 1) % len(self.season)]
+        elif self.seasonal == 'mul':
+            values = values * self.season[(horizons - 1) % len(self.season)]
+        return values
+
+    def forecast(self, steps: int = 1) -> np.ndarray:
+        """Forecasts for the next `steps` quarters (same call as the statsmodels results)"""
+        return self.predict_horizons(np.arange(1, steps + 1))
+
+    def save(self, path: Path):
+        """Write the components with `model_store.save_arrays`"""
+        meta = {
+            'trend': self.trend,
+            'seasonal': self.seasonal,
+            'level': self.level,
+            'slope': self.slope,
+            'damping': self.damping
+        }
+        model_store.save_arrays(path, {'season': self.season}, meta)
+
+    @classmethod
+    def load(cls, path: Path):
+        meta, arrays = model_store.load_arrays(path)
+        return cls(meta['trend'], meta['seasonal'], meta['level'], meta['slope'],
+                   meta['damping'], np.array(arrays['season']))
@@ -18,7 +18,8 @@ document.addEventListener('DOMContentLoaded', async () => {
 // Load models from API
 async function loadModels() {
     try {
-        const response = await fetch('/api/models');
+        // Revalidate with the server's ETag; unchanged registries come back as 304
+        const response = await fetch('/api/models', { cache: 'no-cache' });
         const data = await response.json();
 
         modelsData = data;
@@ -152,7 +153,7 @@ function createModelCard(model, rank) {
 // Load statistics
 async function loadStatistics() {
     try {
-        const response = await fetch('/api/stats');
+        const response = await fetch('/api/stats', { cache: 'no-cache' });
         const data = await response.json();
 
         document.getElementById('total-models').textContent = data.total_models;
@@ -398,11 +399,19 @@ async function runComparison() {
     // Show loading
     showLoading();
 
+    const body = JSON.stringify({ models: selectedModels, year, quarter });
+
+    try {
+        if (await streamComparison(body)) return;
+    } catch (error) {
+        console.warn('⚠️ Streaming comparison failed, retrying without streaming:', error);
+    }
+
     try {
         const response = await fetch('/api/compare', {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify({ models: selectedModels, year, quarter })
+            body
         });
 
         const data = await response.json();
@@ -418,6 +427,57 @@ async function runComparison() {
     }
 }
 
+// Render comparison rows as the server streams them (NDJSON frames).
+// Returns false if streaming is unavailable so the caller can fall back.
+async function streamComparison(body) {
+    const response = await fetch('/api/compare/stream', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json', 'Accept': 'application/x-ndjson' },
+        body
+    });
+
+    if (!response.ok || !response.body) {
+        return false;
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let data = null;
+
+    const handleFrame = (frame) => {
+        if (frame.event === 'context') {
+            data = { year: frame.year, quarter: frame.quarter, historical: frame.historical, results: [] };
+            showComparisonResults(data);
+        } else if (frame.event === 'result' && data) {
+            const { event, index, ...result } = frame;
+            data.results.push(result);
+            // Provisional ranking until the summary arrives
+            data.results.sort((a, b) => (b.metrics?.test_r2 ?? -999) - (a.metrics?.test_r2 ?? -999));
+            renderComparisonRows(data.results);
+        } else if (frame.event === 'summary' && data) {
+            const byModel = new Map(data.results.map(result => [result.model, result]));
+            data.results = frame.order.map(model => byModel.get(model)).filter(Boolean);
+            renderComparisonRows(data.results);
+        }
+    };
+
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+
+        buffer += decoder.decode(value, { stream: true });
+        const lines = buffer.split('\n');
+        buffer = lines.pop();
+        lines.filter(line => line.trim()).forEach(line => handleFrame(JSON.parse(line)));
+    }
+    if (buffer.trim()) {
+        handleFrame(JSON.parse(buffer));
+    }
+
+    return data !== null;
+}
+
 // Show comparison results
 function showComparisonResults(data) {
     const resultsSection = document.getElementById('results-section');
@@ -441,10 +501,18 @@ function showComparisonResults(data) {
     displayComparisonHistorical(data.historical, data.year, data.quarter);
 
     // Populate table
+    renderComparisonRows(data.results);
+
+    // Scroll to results
+    resultsSection.scrollIntoView({ behavior: 'smooth' });
+}
+
+// Fill the comparison table, ranked in the given order
+function renderComparisonRows(results) {
     const tbody = document.getElementById('comparison-table-body');
     tbody.innerHTML = '';
 
-    data.results.forEach((result, index) => {
+    results.forEach((result, index) => {
         const row = document.createElement('tr');
 
         const rankClass = index === 0 ? 'rank-1' : index === 1 ? 'rank-2' : index === 2 ? 'rank-3' : 'rank-other';
@@ -477,9 +545,6 @@ function showComparisonResults(data) {
 
         tbody.appendChild(row);
     });
-
-    // Scroll to results
-    resultsSection.scrollIntoView({ behavior: 'smooth' });
 }
 
 // Display historical data in comparison view
@@ -0,0 +1,182 @@
+"""
+Loan Sales Prediction - Per-request stage timing
+
+Code marks the stages of a request with `timed('stage')` blocks. While a
+request is served by `ServerTimingMiddleware` they are recorded on that
+request's `RequestTiming` (found through a context variable, so stages run
+on inference threads count as long as the context is copied there), sent
+back in a `Server-Timing` header and added to per-model, per-stage
+histograms. Outside a timed request `timed` returns a shared no-op, so
+disabled timing costs one context variable lookup per stage.
+"""
+
+import bisect
+import contextvars
+import threading
+from time import perf_counter
+
+# Histogram bucket upper bounds in milliseconds
+BUCKETS_MS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+_REQUEST = contextvars.ContextVar('request_timing', default=None)
+_MODEL = contextvars.ContextVar('timing_model', default=None)
+
+
+class RequestTiming:
+    """Stage durations recorded while serving one request"""
+
+    __slots__ = ('stages',)
+
+    def __init__(self):
+        self.stages = []  # (stage, model, seconds); list.append is thread-safe
+
+    def header(self, total: float) -> str:
+        """`Server-Timing` value: each stage's duration summed over its calls, plus the total"""
+        durations = {}
+        for stage, _, seconds in self.stages:
+            durations[stage] = durations.get(stage, 0.0) + seconds
+        metrics = [f"{stage};dur={seconds * 1000:.3f}" for stage, seconds in durations.items()]
+        metrics.append(f"total;dur={total * 1000:.3f}")
+        return ", ".join(metrics)
+
+
+class _Stage:
+    __slots__ = ('timing', 'name', 'model', 'start')
+
+    def __init__(self, timing: RequestTiming, name: str, model: str):
+        self.timing = timing
+        self.name = name
+        self.model = model
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.timing.stages.append((self.name, self.model, perf_counter() - self.start))
+
+
+class _NoStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+_NO_STAGE = _NoStage()
+
+
+def timed(stage: str, model: str = None):
+    """Context manager recording `stage` for the current request (no-op outside one)
+
+    Args:
+        model: Model the stage belongs to; defaults to the enclosing `model_scope`
+    """
+    timing = _REQUEST.get()
+    if timing is None:
+        return _NO_STAGE
+    return _Stage(timing, stage, model or _MODEL.get())
+
+
+class model_scope:
+    """Attribute the stages recorded inside the block to `model`"""
+
+    __slots__ = ('model', 'token')
+
+    def __init__(self, model: str):
+        self.model = model
+
+    def __enter__(self):
+        self.token = _MODEL.set(self.model)
+        return self
+
+    def __exit__(self, *exc):
+        _MODEL.reset(self.token)
+
+
+class StageHistograms:
+    """Latency histograms per (model, stage), fed by finished requests
+
+    Stages recorded without a model are grouped under '-'. At most
+    `max_series` (model, stage) pairs are kept, so unknown model names in
+    requests cannot grow it without bound.
+    """
+
+    def __init__(self, max_series: int = 1000):
+        self.max_series = max_series
+        self.dropped = 0
+        self._series = {}  # (model, stage) -> [bucket counts..., +Inf count, count, sum seconds]
+        self._lock = threading.Lock()
+
+    def record(self, timing: RequestTiming):
+        with self._lock:
+            for stage, model, seconds in timing.stages:
+                key = (model or '-', stage)
+                series = self._series.get(key)
+                if series is None:
+                    if len(self._series) >= self.max_series:
+                        self.dropped += 1
+                        continue
+                    series = self._series[key] = [0] * (len(BUCKETS_MS) + 3)
+                series[bisect.bisect_left(BUCKETS_MS, seconds * 1000)] += 1
+                series[-2] += 1
+                series[-1] += seconds
+
+    def snapshot(self) -> dict:
+        """{model: {stage: {count, sum_ms, buckets: {upper bound ms: cumulative count}}}}"""
+        with self._lock:
+            series = {key: list(values) for key, values in self._series.items()}
+
+        result = {}
+        for (model, stage), values in sorted(series.items()):
+            cumulative, buckets = 0, {}
+            for bound, count in zip(BUCKETS_MS + ('+Inf',), values[:len(BUCKETS_MS) + 1]):
+                cumulative += count
+                buckets[str(bound)] = cumulative
+            result.setdefault(model, {})[stage] = {
+                'count': values[-2],
+                'sum_ms': round(values[-1] * 1000, 3),
+                'buckets': buckets
+            }
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+            self.dropped = 0
+
+
+class ServerTimingMiddleware:
+    """ASGI middleware timing every HTTP request
+
+    Adds a `Server-Timing` header to the response start message (a new
+    message; the response object itself is left untouched) and records
+    the request's stages into `histograms` once it finishes.
+    """
+
+    def __init__(self, app, histograms: StageHistograms):
+        self.app = app
+        self.histograms = histograms
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            return await self.app(scope, receive, send)
+
+        timing = RequestTiming()
+        token = _REQUEST.set(timing)
+        start = perf_counter()
+
+        async def send_with_timing(message):
+            if message['type'] == 'http.response.start':
+                value = timing.header(perf_counter() - start).encode('latin-1')
+                message = {**message, 'headers': [*message.get('headers', []), (b'server-timing', value)]}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _REQUEST.reset(token)
+            self.histograms.record(timing)
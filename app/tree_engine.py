@@ -0,0 +1,402 @@
+"""
+Loan Sales Prediction - Array-backed tree ensemble inference
+
+Decision Tree, Random Forest, Gradient Boosting, AdaBoost, XGBoost,
+LightGBM and CatBoost models are flattened into one node-array layout:
+
+    feature    split column per node (+ n_features for float32-input models)
+    threshold  go left when x <= threshold
+    left/right child node per node (leaves point to themselves)
+    value      leaf value per node
+    roots      root node per tree
+    weights    per-tree weight (AdaBoost weighted median)
+
+Every library's split rule is rewritten as `x <= threshold` on the inputs
+the library actually compares: sklearn, XGBoost and CatBoost cast features
+to float32 first, so those models read a float32-rounded copy of the rows.
+Trees are walked for every row and every tree at once, one vectorized step
+per depth level, and leaf values are reduced per model. Missing (NaN)
+feature values are not supported; PCA feature rows are always complete.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from app import model_store
+
+
+class TreeEnsemble:
+    """One or more tree models over the same features, scored in one pass
+
+    Args:
+        arrays: Node and tree arrays (see module docstring)
+        models: Per-model dicts with `name`, `trees` ([start, stop) tree
+            range), `aggregate` ('sum' or 'median'), `scale`, `bias` and
+            `float32_sum` (accumulate trees in float32, like XGBoost)
+        n_features: Number of input columns
+    """
+
+    def __init__(self, arrays: dict, models: list, n_features: int):
+        self.feature = arrays['feature']
+        self.threshold = arrays['threshold']
+        self.left = arrays['left']
+        self.right = arrays['right']
+        self.value = arrays['value']
+        self.roots = arrays['roots']
+        self.weights = arrays['weights']
+        self.models = models
+        self.n_features = n_features
+        self.depth = _max_depth(self.left, self.right, self.roots)
+
+    @property
+    def names(self) -> list:
+        return [model['name'] for model in self.models]
+
+    def leaf_values(self, X) -> np.ndarray:
+        """Leaf value reached by every row in every tree, shape (n_rows, n_trees)"""
+        X = np.asarray(X, dtype=np.float64).reshape(-1, self.n_features)
+        inputs = np.hstack([X, X.astype(np.float32).astype(np.float64)]).ravel()
+        row_offsets = (np.arange(len(X)) * 2 * self.n_features)[:, None]
+
+        node = np.broadcast_to(self.roots, (len(X), len(self.roots)))
+        for _ in range(self.depth):
+            go_left = inputs[row_offsets + self.feature[node]] <= self.threshold[node]
+            node = np.where(go_left, self.left[node], self.right[node])
+        return self.value[node]
+
+    def predict_all(self, X) -> np.ndarray:
+        """Predictions of every model for every row, shape (n_models, n_rows)"""
+        values = self.leaf_values(X)
+        predictions = np.empty((len(self.models), len(values)))
+
+        for i, model in enumerate(self.models):
+            start, stop = model['trees']
+            trees = values[:, start:stop]
+            if model['aggregate'] == 'median':
+                predictions[i] = _weighted_median(trees, self.weights[start:stop])
+            elif model['float32_sum']:
+                predictions[i] = _float32_sum(trees, model['bias'])
+            else:
+                predictions[i] = model['scale'] * trees.sum(axis=1) + model['bias']
+
+        return predictions
+
+    def predict(self, X) -> np.ndarray:
+        """Predictions of the first (for a single-model artifact, the only) model"""
+        return self.predict_all(X)[0]
+
+    def save(self, path: Path):
+        model_store.save_arrays(path, {
+            'feature': self.feature,
+            'threshold': self.threshold,
+            'left': self.left,
+            'right': self.right,
+            'value': self.value,
+            'roots': self.roots,
+            'weights': self.weights
+        }, {'models': self.models, 'n_features': self.n_features})
+
+    @classmethod
+    def load(cls, path: Path):
+        """Memory-map a tree ensemble written by `save`"""
+        meta, arrays = model_store.load_arrays(path)
+        return cls(arrays, meta['models'], meta['n_features'])
+
+    @classmethod
+    def concat(cls, ensembles: list, names: list = None):
+        """Fuse several ensembles (e.g. one per registry model) into one
+
+        Args:
+            names: Optional model names replacing those of the single-model
+                ensembles, in order
+        """
+        if not ensembles:
+            raise ValueError("No tree ensembles to fuse")
+        n_features = ensembles[0].n_features
+        if any(ensemble.n_features != n_features for ensemble in ensembles):
+            raise ValueError("Tree ensembles use different feature counts")
+
+        arrays = {key: [] for key in ('feature', 'threshold', 'left', 'right', 'value', 'roots', 'weights')}
+        models, node_offset, tree_offset = [], 0, 0
+        for ensemble in ensembles:
+            arrays['feature'].append(ensemble.feature)
+            arrays['threshold'].append(ensemble.threshold)
+            arrays['left'].append(ensemble.left + node_offset)
+            arrays['right'].append(ensemble.right + node_offset)
+            arrays['value'].append(ensemble.value)
+            arrays['roots'].append(ensemble.roots + node_offset)
+            arrays['weights'].append(ensemble.weights)
+            for model in ensemble.models:
+                start, stop = model['trees']
+                models.append(dict(model, trees=[start + tree_offset, stop + tree_offset]))
+            node_offset += len(ensemble.feature)
+            tree_offset += len(ensemble.roots)
+
+        if names is not None:
+            models = [dict(model, name=name) for model, name in zip(models, names)]
+        return cls({key: np.concatenate(parts) for key, parts in arrays.items()}, models, n_features)
+
+
+def _max_depth(left, right, roots) -> int:
+    """Longest root-to-leaf path over all trees"""
+    depth, frontier = 0, np.asarray(roots)
+    while True:
+        frontier = frontier[left[frontier] != frontier]
+        if not len(frontier):
+            return depth
+        frontier = np.concatenate([left[frontier], right[frontier]])
+        depth += 1
+
+
+def _float32_sum(values, bias):
+    """Sequential float32 sum of the tree values starting from `bias` (XGBoost)"""
+    start = np.full((len(values), 1), bias, dtype=np.float32)
+    return np.cumsum(np.hstack([start, values.astype(np.float32)]), axis=1, dtype=np.float32)[:, -1]
+
+
+def _weighted_median(values, weights):
+    """Weighted median per row, as AdaBoostRegressor computes it"""
+    rows = np.arange(len(values))
+    sorted_idx = np.argsort(values, axis=1)
+    weight_cdf = np.cumsum(weights[sorted_idx], axis=1)
+    median_or_above = weight_cdf >= 0.5 * weight_cdf[:, -1][:, np.newaxis]
+    median_idx = median_or_above.argmax(axis=1)
+    return values[rows, sorted_idx[rows, median_idx]]
+
+
+class _TreeBuilder:
+    """Collects trees in the flattened node layout"""
+
+    def __init__(self, n_features: int):
+        self.n_features = n_features
+        self.parts = {key: [] for key in ('feature', 'threshold', 'left', 'right', 'value')}
+        self.roots, self.weights, self.n_nodes = [], [], 0
+
+    def add(self, feature, threshold, left, right, value, float32_inputs: bool, weight: float = 1.0):
+        """Add one tree; leaves have left == -1, children are local node indices"""
+        feature = np.asarray(feature, dtype=np.int64)
+        left = np.asarray(left, dtype=np.int64)
+        right = np.asarray(right, dtype=np.int64)
+        local = np.arange(len(left))
+        leaf = left < 0
+
+        self.parts['feature'].append(np.where(leaf, 0, feature + (self.n_features if float32_inputs else 0)))
+        self.parts['threshold'].append(np.where(leaf, np.inf, np.asarray(threshold, dtype=np.float64)))
+        self.parts['left'].append(np.where(leaf, local, left) + self.n_nodes)
+        self.parts['right'].append(np.where(leaf, local, right) + self.n_nodes)
+        self.parts['value'].append(np.where(leaf, np.asarray(value, dtype=np.float64), 0.0))
+        self.roots.append(self.n_nodes)
+        self.weights.append(weight)
+        self.n_nodes += len(left)
+
+    def build(self, name: str, aggregate: str = 'sum', scale: float = 1.0, bias: float = 0.0,
+              float32_sum: bool = False) -> TreeEnsemble:
+        arrays = {key: np.concatenate(parts) for key, parts in self.parts.items()}
+        arrays['feature'] = arrays['feature'].astype(np.int32)
+        arrays['left'] = arrays['left'].astype(np.int32)
+        arrays['right'] = arrays['right'].astype(np.int32)
+        arrays['roots'] = np.asarray(self.roots, dtype=np.int32)
+        arrays['weights'] = np.asarray(self.weights, dtype=np.float64)
+        model = {
+            'name': name,
+            'trees': [0, len(self.roots)],
+            'aggregate': aggregate,
+            'scale': float(scale),
+            'bias': float(bias),
+            'float32_sum': float32_sum
+        }
+        return TreeEnsemble(arrays, [model], self.n_features)
+
+
+def _model_key(model) -> str:
+    return f"{type(model).__module__.split('.')[0]}.{type(model).__name__}"
+
+
+def supports(model) -> bool:
+    """Whether `flatten` can export this model"""
+    return _model_key(model) in _EXPORTERS
+
+
+def flatten(model, name: str = '') -> TreeEnsemble:
+    """Export a trained tree model to a single-model TreeEnsemble
+
+    Raises:
+        ValueError: The model type or one of its settings is not supported
+    """
+    exporter = _EXPORTERS.get(_model_key(model))
+    if exporter is None:
+        raise ValueError(f"{type(model).__name__} is not a supported tree model")
+    return exporter(model, name)
+
+
+def _add_sklearn_tree(builder, estimator, scale: float = 1.0, weight: float = 1.0):
+    tree = estimator.tree_
+    if tree.n_outputs != 1:
+        raise ValueError("Multi-output trees are not supported")
+    # sklearn compares float32(x) <= float64 threshold
+    builder.add(tree.feature, tree.threshold, tree.children_left, tree.children_right,
+                tree.value[:, 0, 0] * scale, float32_inputs=True, weight=weight)
+
+
+def _flatten_decision_tree(model, name):
+    builder = _TreeBuilder(model.n_features_in_)
+    _add_sklearn_tree(builder, model)
+    return builder.build(name)
+
+
+def _flatten_forest(model, name):
+    builder = _TreeBuilder(model.n_features_in_)
+    for estimator in model.estimators_:
+        _add_sklearn_tree(builder, estimator)
+    return builder.build(name, scale=1.0 / len(model.estimators_))
+
+
+def _flatten_gradient_boosting(model, name):
+    if model.init_ == 'zero':
+        bias = 0.0
+    elif type(model.init_).__name__ == 'DummyRegressor':
+        bias = float(np.ravel(model.init_.constant_)[0])
+    else:
+        raise ValueError("Gradient boosting with a non-constant init estimator is not supported")
+
+    builder = _TreeBuilder(model.n_features_in_)
+    for estimator in model.estimators_[:, 0]:
+        _add_sklearn_tree(builder, estimator)
+    return builder.build(name, scale=model.learning_rate, bias=bias)
+
+
+def _flatten_adaboost(model, name):
+    builder = _TreeBuilder(model.n_features_in_)
+    for estimator, weight in zip(model.estimators_, model.estimator_weights_):
+        if type(estimator).__name__ != 'DecisionTreeRegressor':
+            raise ValueError("AdaBoost with non-tree base estimators is not supported")
+        _add_sklearn_tree(builder, estimator, weight=weight)
+    return builder.build(name, aggregate='median')
+
+
+def _flatten_xgboost(model, name):
+    booster = model.get_booster()
+    learner = json.loads(booster.save_raw('json'))['learner']
+    gbm = learner['gradient_booster']
+    if gbm['name'] != 'gbtree' or learner['objective']['name'] != 'reg:squarederror':
+        raise ValueError("Only gbtree boosters with reg:squarederror are supported")
+    if getattr(model, 'best_iteration', None) is not None and model.best_iteration + 1 < len(gbm['model']['trees']):
+        raise ValueError("XGBoost models trained with early stopping are not supported")
+
+    builder = _TreeBuilder(int(learner['learner_model_param']['num_feature']))
+    for tree in gbm['model']['trees']:
+        conditions = np.asarray(tree['split_conditions'], dtype=np.float32)
+        # XGBoost goes left when float32(x) < split; the largest float32 below
+        # the split turns that into x <= threshold
+        thresholds = np.nextafter(conditions, np.float32(-np.inf)).astype(np.float64)
+        builder.add(tree['split_indices'], thresholds, tree['left_children'], tree['right_children'],
+                    conditions.astype(np.float64), float32_inputs=True)
+    # A scalar string up to XGBoost 2.x, a one-element vector ('[8.4E7]') from 3.0
+    base_score = learner['learner_model_param']['base_score'].strip('[]').split(',')
+    if len(base_score) != 1:
+        raise ValueError("Multi-output XGBoost models are not supported")
+    base_score = float(np.float32(base_score[0]))
+    return builder.build(name, bias=base_score, float32_sum=True)
+
+
+def _flatten_lightgbm(model, name):
+    booster = model.booster_ if hasattr(model, 'booster_') else model
+    dump = booster.dump_model()
+    if dump['num_tree_per_iteration'] != 1 or dump.get('average_output'):
+        raise ValueError("Only single-output, non-averaged LightGBM models are supported")
+
+    builder = _TreeBuilder(dump['max_feature_idx'] + 1)
+    for info in dump['tree_info']:
+        feature, threshold, left, right, value = [], [], [], [], []
+
+        def visit(node):
+            index = len(feature)
+            feature.append(0)
+            threshold.append(0.0)
+            left.append(-1)
+            right.append(-1)
+            value.append(0.0)
+            if 'leaf_value' in node:
+                value[index] = node['leaf_value']
+                return index
+            if node['decision_type'] != '<=':
+                raise ValueError("Categorical LightGBM splits are not supported")
+            feature[index] = node['split_feature']
+            threshold[index] = node['threshold']
+            left[index] = visit(node['left_child'])
+            right[index] = visit(node['right_child'])
+            return index
+
+        visit(info['tree_structure'])
+        # LightGBM compares the float64 feature value
+        builder.add(feature, threshold, left, right, value, float32_inputs=False)
+    return builder.build(name)
+
+
+def _flatten_catboost(model, name):
+    handle, path = tempfile.mkstemp(suffix='.json')
+    os.close(handle)
+    try:
+        model.save_model(path, format='json')
+        with open(path, 'r', encoding='utf-8') as f:
+            dump = json.load(f)
+    finally:
+        os.unlink(path)
+
+    if dump['features_info'].get('categorical_features'):
+        raise ValueError("CatBoost models with categorical features are not supported")
+    columns = {
+        feature['feature_index']: feature['flat_feature_index']
+        for feature in dump['features_info']['float_features']
+    }
+    scale, (bias,) = dump['scale_and_bias'][0], dump['scale_and_bias'][1]
+
+    builder = _TreeBuilder(max(columns.values()) + 1)
+    for tree in dump['oblivious_trees']:
+        splits = tree['splits']
+        depth = len(splits)
+        leaf_values = np.asarray(tree['leaf_values'], dtype=np.float64)
+        if len(leaf_values) != 2 ** depth:
+            raise ValueError("Multi-dimensional CatBoost models are not supported")
+
+        # Oblivious tree expanded to a full binary tree: level k tests split k
+        # and going right sets bit k of the leaf index
+        n_internal = 2 ** depth - 1
+        feature = np.zeros(n_internal + 2 ** depth, dtype=np.int64)
+        threshold = np.zeros(len(feature))
+        left = np.full(len(feature), -1, dtype=np.int64)
+        right = np.full(len(feature), -1, dtype=np.int64)
+        value = np.zeros(len(feature))
+        for node in range(n_internal):
+            level = int(np.log2(node + 1))
+            split = splits[level]
+            if split['split_type'] != 'FloatFeature':
+                raise ValueError("Only float CatBoost splits are supported")
+            feature[node] = columns[split['float_feature_index']]
+            # CatBoost sets the bit when float32(x) > border
+            threshold[node] = float(np.float32(split['border']))
+            left[node], right[node] = 2 * node + 1, 2 * node + 2
+        for leaf in range(2 ** depth):
+            # Heap position -> bits taken on the way down (root bit is bit 0)
+            path = leaf
+            index = sum(((path >> (depth - 1 - level)) & 1) << level for level in range(depth))
+            value[n_internal + leaf] = leaf_values[index]
+        builder.add(feature, threshold, left, right, value, float32_inputs=True)
+    return builder.build(name, scale=scale, bias=bias)
+
+
+_EXPORTERS = {
+    'sklearn.DecisionTreeRegressor': _flatten_decision_tree,
+    'sklearn.RandomForestRegressor': _flatten_forest,
+    'sklearn.ExtraTreesRegressor': _flatten_forest,
+    'sklearn.GradientBoostingRegressor': _flatten_gradient_boosting,
+    'sklearn.AdaBoostRegressor': _flatten_adaboost,
+    'xgboost.XGBRegressor': _flatten_xgboost,
+    'lightgbm.LGBMRegressor': _flatten_lightgbm,
+    'lightgbm.Booster': _flatten_lightgbm,
+    'catboost.CatBoostRegressor': _flatten_catboost
+}
@@ -0,0 +1,98 @@
+"""
+Loan Sales Prediction - Startup model warm-up
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ModelWarmup:
+    """Loads and test-scores every registered model before serving traffic
+
+    Models are warmed in parallel on a dedicated thread pool, one job per
+    model, and the load and scoring times of each are recorded. The
+    instance reports ready once every job has finished; a model that fails
+    to load or score is recorded as failed but does not block readiness
+    (requests for it fail exactly as they would without warm-up).
+    """
+
+    def __init__(self, enabled: bool, workers: int):
+        self.enabled = enabled
+        self.workers = workers
+        self.status = 'pending' if enabled else 'disabled'
+        self.models = {}  # model name -> {'load_ms', 'score_ms'} or {'error'}
+        self.started_at = None
+        self.duration_ms = None
+        self._done = threading.Event()
+        if not enabled:
+            self._done.set()
+
+    @property
+    def ready(self) -> bool:
+        return self._done.is_set()
+
+    def start(self, model_names, load, score, on_done=None):
+        """Warm `model_names` in a background thread
+
+        Args:
+            load: Callable `load(name) -> model`
+            score: Callable `score(name, model)` running one test prediction
+            on_done: Optional callable run after the last model finished
+        """
+        if not self.enabled:
+            if on_done is not None:
+                on_done()
+            return
+
+        def run():
+            try:
+                self.run(model_names, load, score)
+            finally:
+                if on_done is not None:
+                    on_done()
+
+        threading.Thread(target=run, name="model-warmup", daemon=True).start()
+
+    def run(self, model_names, load, score):
+        """Warm every model and block until all of them finished"""
+        self.status = 'running'
+        self.started_at = time.time()
+        start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="warmup") as executor:
+            for name in model_names:
+                executor.submit(self._warm, name, load, score)
+
+        self.duration_ms = round((time.perf_counter() - start) * 1000, 1)
+        self.status = 'ready'
+        self._done.set()
+
+        failed = [name for name, result in self.models.items() if 'error' in result]
+        print(f"✅ Warm-up finished: {len(self.models) - len(failed)}/{len(self.models)} models in {self.duration_ms:.0f} ms")
+        for name in failed:
+            print(f"⚠️  Warm-up failed for {name}: {self.models[name]['error']}")
+
+    def _warm(self, name, load, score):
+        try:
+            start = time.perf_counter()
+            model = load(name)
+            loaded = time.perf_counter()
+            score(name, model)
+            scored = time.perf_counter()
+            self.models[name] = {
+                'load_ms': round((loaded - start) * 1000, 2),
+                'score_ms': round((scored - loaded) * 1000, 2)
+            }
+        except Exception as e:
+            self.models[name] = {'error': str(e)}
+
+    def stats(self) -> dict:
+        """Warm-up progress and per-model timings for the health endpoint"""
+        return {
+            'status': self.status,
+            'duration_ms': self.duration_ms,
+            'warmed': sum(1 for result in self.models.values() if 'error' not in result),
+            'failed': sorted(name for name, result in self.models.items() if 'error' in result),
+            'models': dict(self.models)
+        }
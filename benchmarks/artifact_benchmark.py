@@ -0,0 +1,107 @@
+"""
+Loan Sales Prediction - Model artifact load benchmark
+
+Compares every registry model's legacy pickle with its native artifact
+(see app/artifacts.py):
+
+    size   bytes on disk
+    cold   load in a fresh interpreter, including the library imports
+    warm   median load time in an interpreter that already imported them
+
+Usage:
+    python benchmarks/artifact_benchmark.py [--repeats 20] [--cold-runs 3]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+MODELS_DIR = PROJECT_ROOT / 'notebooks' / 'prediction' / 'models'
+
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.artifacts import load_artifact
+
+COLD_LOAD = """
+import sys, time
+start = time.perf_counter()
+sys.path.insert(0, {root!r})
+from app.artifacts import load_artifact
+load_artifact({path!r}, {fmt!r})
+print(time.perf_counter() - start)
+"""
+
+
+def cold_load(path: Path, fmt: str, runs: int) -> float:
+    """Median seconds to import and load the artifact in a new interpreter"""
+    code = COLD_LOAD.format(root=str(PROJECT_ROOT), path=str(path), fmt=fmt)
+    times = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, '-c', code], capture_output=True, text=True, check=True
+        )
+        times.append(float(result.stdout.strip().splitlines()[-1]))
+    return statistics.median(times)
+
+
+def warm_load(path: Path, fmt: str, repeats: int) -> float:
+    """Median seconds to load the artifact with its libraries already imported"""
+    load_artifact(path, fmt)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        load_artifact(path, fmt)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1].strip())
+    parser.add_argument('--repeats', type=int, default=20, help='warm loads per artifact')
+    parser.add_argument('--cold-runs', type=int, default=3, help='fresh interpreters per artifact')
+    args = parser.parse_args()
+
+    with open(MODELS_DIR / 'model_registry.json', 'r', encoding='utf-8') as f:
+        registry = json.load(f)
+
+    print(f"{'Model':28} {'Format':12} {'Size':>16} {'Cold (ms)':>19} {'Warm (ms)':>19}")
+    print(f"{'':28} {'':12} {'pickle → native':>16} {'pickle → native':>19} {'pickle → native':>19}")
+    print("-" * 98)
+
+    totals = {'pickle_size': 0, 'native_size': 0, 'pickle_cold': 0.0, 'native_cold': 0.0}
+    for group in ('ml_models', 'ts_models'):
+        for name, info in registry[group].items():
+            if info.get('format', 'pickle') == 'pickle':
+                continue
+
+            pickle_path = MODELS_DIR / info['filename']
+            native_path = MODELS_DIR / info['artifact']
+            fmt = info['format']
+
+            sizes = (pickle_path.stat().st_size, native_path.stat().st_size)
+            cold = (cold_load(pickle_path, 'pickle', args.cold_runs),
+                    cold_load(native_path, fmt, args.cold_runs))
+            warm = (warm_load(pickle_path, 'pickle', args.repeats),
+                    warm_load(native_path, fmt, args.repeats))
+
+            totals['pickle_size'] += sizes[0]
+            totals['native_size'] += sizes[1]
+            totals['pickle_cold'] += cold[0]
+            totals['native_cold'] += cold[1]
+
+            print(f"{name:28} {fmt:12} {sizes[0]:>7} → {sizes[1]:<6} "
+                  f"{cold[0] * 1e3:>8.1f} → {cold[1] * 1e3:<8.1f} "
+                  f"{warm[0] * 1e3:>8.2f} → {warm[1] * 1e3:<8.2f}")
+
+    print("-" * 98)
+    print(f"{'Total':28} {'':12} {totals['pickle_size']:>7} → {totals['native_size']:<6} "
+          f"{totals['pickle_cold'] * 1e3:>8.1f} → {totals['native_cold'] * 1e3:<8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Loan Sales Prediction - Import time report
+
+Runs each scenario in a fresh interpreter under `python -X importtime`
+and reports the total import time plus the most expensive top-level
+packages:
+
+    app.main         what the server imports before it can bind its port
+    app.main + X     first use of a model family (one artifact loaded)
+    eager            app.main plus every ML/statsmodels library up front,
+                     which is what serving cost when pandas and all model
+                     libraries were imported together
+
+Usage:
+    python benchmarks/import_time.py [--top 5] [--runs 3]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+MODELS_DIR = PROJECT_ROOT / 'notebooks' / 'prediction' / 'models'
+
+HEAVY_PACKAGES = ('pandas', 'sklearn', 'scipy', 'xgboost', 'lightgbm', 'catboost', 'statsmodels')
+
+SCENARIO = """
+import sys
+sys.path.insert(0, {root!r})
+import app.main
+{extra}
+"""
+
+
+def family_models():
+    """One registry model per artifact format, as {format: (path, format)}"""
+    with open(MODELS_DIR / 'model_registry.json', 'r', encoding='utf-8') as f:
+        registry = json.load(f)
+
+    families = {}
+    for group in ('ml_models', 'ts_models'):
+        for info in registry[group].values():
+            fmt = info.get('format', 'pickle')
+            families.setdefault(fmt, MODELS_DIR / info.get('artifact', info['filename']))
+    return families
+
+
+def parse_importtime(stderr: str):
+    """Parse -X importtime output
+
+    Returns:
+        Tuple (top-level module -> cumulative µs, set of every imported root package)
+    """
+    modules, packages = {}, set()
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        packages.add(name.strip().split('.')[0])
+        # Nested imports are indented; only top-level entries add up to the total
+        if not name.startswith('  ') and name.strip():
+            modules[name.strip()] = modules.get(name.strip(), 0) + int(cumulative)
+    return modules, packages
+
+
+def run_scenario(extra: str, runs: int):
+    """Median total import time (ms), top-level times and packages of the median run"""
+    code = SCENARIO.format(root=str(PROJECT_ROOT), extra=extra)
+    results = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', code],
+            capture_output=True, text=True, check=True, cwd=PROJECT_ROOT
+        )
+        modules, packages = parse_importtime(result.stderr)
+        results.append((sum(modules.values()) / 1000, modules, packages))
+    results.sort(key=lambda item: item[0])
+    return results[len(results) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1].strip())
+    parser.add_argument('--top', type=int, default=5, help='packages listed per scenario')
+    parser.add_argument('--runs', type=int, default=3, help='interpreters per scenario (median)')
+    args = parser.parse_args()
+
+    scenarios = [('app.main', '')]
+    for fmt, path in family_models().items():
+        scenarios.append((
+            f"app.main + {fmt}",
+            f"from app.artifacts import load_artifact\nload_artifact({str(path)!r}, {fmt!r})"
+        ))
+    scenarios.append(('eager (all libraries)', '\n'.join(f"import {name}" for name in HEAVY_PACKAGES)))
+
+    print(f"{'Scenario':28} {'Import (ms)':>12}  Heavy packages / top imports")
+    print("-" * 98)
+    for label, extra in scenarios:
+        total_ms, modules, packages = run_scenario(extra, args.runs)
+        heavy = [name for name in HEAVY_PACKAGES if name in packages]
+        top = sorted(modules.items(), key=lambda item: item[1], reverse=True)[:args.top]
+        print(f"{label:28} {total_ms:>12.1f}  [{', '.join(heavy) or '-'}]")
+        print(f"{'':28} {'':>12}  " + ', '.join(f"{name} {us / 1000:.0f}" for name, us in top))
+
+
+if __name__ == "__main__":
+    main()
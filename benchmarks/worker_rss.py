@@ -0,0 +1,157 @@
+"""
+Loan Sales Prediction - Per-worker memory benchmark
+
+Starts N worker processes, like gunicorn workers without --preload. Each
+worker imports every model library and loads all registry models. The
+benchmark then reads each worker's memory from /proc (Linux only):
+
+    RSS     resident pages, shared ones counted in full by every worker
+    PSS     shared pages split between the processes mapping them
+    USS     pages private to the worker
+    models  RSS growth while loading the models (after library imports)
+    mapped  bytes of model arrays served from memory-mapped files
+
+This is done twice: once loading every model from its legacy pickle and
+once from the artifact recorded in model_registry.json, which includes the
+memory-mapped joblib store.
+
+Usage:
+    python benchmarks/worker_rss.py [--workers 4]
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+WORKER = r"""
+import json, re, sys
+from pathlib import Path
+import numpy as np
+sys.path.insert(0, {root!r})
+from app.artifacts import load_artifact
+
+def rss_kb():
+    return int(re.search(r'VmRSS:\s+(\d+)', Path('/proc/self/status').read_text()).group(1))
+
+def mapped_arrays(model):
+    mapped, total, seen, pending = 0, 0, set(), [model]
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if isinstance(obj, np.ndarray):
+            if obj.dtype == object:
+                pending.extend(obj.ravel())
+                continue
+            total += obj.nbytes
+            if isinstance(obj, np.memmap) or isinstance(obj.base, np.memmap):
+                mapped += obj.nbytes
+        elif isinstance(obj, (list, tuple)):
+            pending.extend(obj)
+        elif isinstance(obj, dict):
+            pending.extend(obj.values())
+        elif hasattr(obj, '__dict__'):
+            pending.extend(vars(obj).values())
+    return mapped, total
+
+import sklearn.ensemble, sklearn.neighbors, sklearn.svm, sklearn.tree, sklearn.linear_model
+import xgboost, lightgbm, catboost
+import statsmodels.tsa.arima.model, statsmodels.tsa.holtwinters
+
+models_dir = Path({root!r}) / 'notebooks' / 'prediction' / 'models'
+registry = json.loads((models_dir / 'model_registry.json').read_text(encoding='utf-8'))
+
+before = rss_kb()
+models = []
+for group in ('ml_models', 'ts_models'):
+    for info in registry[group].values():
+        if {mode!r} == 'pickle':
+            models.append(load_artifact(models_dir / info['filename'], 'pickle'))
+        else:
+            models.append(load_artifact(models_dir / info.get('artifact', info['filename']), info.get('format', 'pickle')))
+
+mapped, total = map(sum, zip(*(mapped_arrays(model) for model in models)))
+print(rss_kb() - before, mapped, total, flush=True)
+sys.stdin.read()
+"""
+
+
+def smaps_rollup(pid: int) -> dict:
+    """Memory counters (kB) from /proc/<pid>/smaps_rollup"""
+    counters = {}
+    for line in Path(f'/proc/{pid}/smaps_rollup').read_text().splitlines()[1:]:
+        key, value = line.split(':', 1)
+        counters[key] = int(value.split()[0])
+    return counters
+
+
+def read_loaded(proc, stderr) -> tuple:
+    """The worker's (models kB, mapped bytes, array bytes) line
+
+    Raises:
+        RuntimeError: With the worker's stderr, if it exited before reporting
+    """
+    line = proc.stdout.readline()
+    if not line or proc.poll() is not None:
+        proc.wait()
+        stderr.seek(0)
+        raise RuntimeError(
+            f"Worker {proc.pid} exited with status {proc.returncode} before loading "
+            f"every model:\n{stderr.read().strip()}"
+        )
+    return tuple(map(int, line.split()))
+
+
+def measure(mode: str, workers: int) -> dict:
+    """Start `workers` processes loading every model in `mode` and read their memory"""
+    code = WORKER.format(root=str(PROJECT_ROOT), mode=mode)
+    # stderr goes to files so warnings cannot fill a pipe and block a worker
+    stderrs = [tempfile.TemporaryFile('w+') for _ in range(workers)]
+    procs = [
+        subprocess.Popen([sys.executable, '-c', code], stdin=subprocess.PIPE,
+                         stdout=subprocess.PIPE, stderr=stderr, text=True)
+        for stderr in stderrs
+    ]
+    try:
+        loaded = [read_loaded(proc, stderr) for proc, stderr in zip(procs, stderrs)]
+        memory = [smaps_rollup(proc.pid) for proc in procs]
+    finally:
+        for proc, stderr in zip(procs, stderrs):
+            proc.stdin.close()
+            proc.wait()
+            stderr.close()
+
+    return {
+        'rss': sum(m['Rss'] for m in memory) / workers,
+        'pss': sum(m['Pss'] for m in memory) / workers,
+        'uss': sum(m['Private_Clean'] + m['Private_Dirty'] for m in memory) / workers,
+        'models': sum(item[0] for item in loaded) / workers,
+        'mapped': loaded[0][1],
+        'arrays': loaded[0][2],
+        'total_pss': sum(m['Pss'] for m in memory)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1].strip())
+    parser.add_argument('--workers', type=int, default=4, help='worker processes per mode')
+    args = parser.parse_args()
+
+    print(f"{args.workers} workers, all 18 models loaded in each (MB per worker unless noted)\n")
+    print(f"{'Artifacts':10} {'RSS':>8} {'PSS':>8} {'USS':>8} {'models':>8} {'mapped / arrays (KB)':>22} {'PSS total':>10}")
+    print("-" * 80)
+    for mode in ('pickle', 'registry'):
+        result = measure(mode, args.workers)
+        print(f"{mode:10} {result['rss'] / 1024:>8.1f} {result['pss'] / 1024:>8.1f} "
+              f"{result['uss'] / 1024:>8.1f} {result['models'] / 1024:>8.1f} "
+              f"{result['mapped'] / 1024:>10.1f} / {result['arrays'] / 1024:<9.1f} "
+              f"{result['total_pss'] / 1024:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,464 @@
+#!/usr/bin/env python3
+"""
+Loan Sales Prediction - Concurrent load test
+
+Runs `--concurrency` virtual users against a running server for
+`--duration` seconds. Each user keeps one HTTP/1.1 keep-alive connection
+and sends requests back to back (closed loop), drawn from a weighted mix:
+
+    predict   POST /api/predict (models in round-robin order, random quarter)
+    compare   POST /api/compare (2-5 random models)
+    batch     POST /api/predict/batch (10 random items)
+    matrix    GET  /api/forecast/matrix (2 random models, 4-12 quarters)
+    models    GET  /api/models
+    stats     GET  /api/stats
+    health    GET  /api/health
+
+A request fails on a transport error, a timeout, a non-2xx status or a
+JSON body with `"success": false`. The report gives throughput, latency
+percentiles and error rates per request type and per model (predict
+requests), and the run is written as JSON so runs can be compared.
+
+Usage:
+    python load_test.py [--url http://localhost:8000] [--concurrency 16] [--duration 30]
+                        [--mix predict=70,compare=10,models=10,stats=10]
+                        [--output results.json] [--baseline previous.json]
+    python load_test.py --diff previous.json results.json
+
+The exit code is 1 when the error rate exceeds --max-error-rate (default 0),
+so a short run (e.g. --duration 5) also checks that every model answers.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import ssl
+import sys
+from datetime import datetime, timezone
+from urllib.parse import urlencode, urlsplit
+
+DEFAULT_MIX = 'predict=70,compare=10,models=10,stats=10'
+KINDS = ('predict', 'compare', 'batch', 'matrix', 'models', 'stats', 'health')
+
+# Used when /api/models cannot be read
+FALLBACK_MODELS = [
+    "Ridge (α=1.0)", "Ridge (α=10.0)", "Lasso (α=1.0)", "ElasticNet", "Decision Tree",
+    "Random Forest", "Gradient Boosting", "AdaBoost", "XGBoost", "LightGBM", "CatBoost",
+    "K-Nearest Neighbors", "Support Vector Regression",
+    "ARIMA(1,1,1)", "ARIMA(2,1,2)", "SARIMA(1,1,1)(1,1,1,4)", "SARIMAX(1,1,1)(1,1,1,4)", "Holt-Winters"
+]
+
+
+class HTTPError(Exception):
+    """Malformed or unexpected HTTP response"""
+
+
+class Connection:
+    """Minimal HTTP/1.1 client over one keep-alive asyncio connection"""
+
+    def __init__(self, url: str):
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https'):
+            raise ValueError(f"Unsupported URL scheme: {url}")
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == 'https' else 80)
+        self.ssl = ssl.create_default_context() if parts.scheme == 'https' else None
+        self.base_path = parts.path.rstrip('/')
+        self.host_header = parts.netloc.encode('ascii')
+        self.reader = None
+        self.writer = None
+
+    async def request(self, method: str, path: str, body=None):
+        """Send one request; returns (status, body bytes)"""
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+
+        payload = b'' if body is None else json.dumps(body).encode('utf-8')
+        head = [
+            f"{method} {self.base_path}{path} HTTP/1.1".encode('ascii'),
+            b"Host: " + self.host_header,
+            b"Accept: application/json",
+            b"Connection: keep-alive"
+        ]
+        if body is not None:
+            head += [b"Content-Type: application/json", f"Content-Length: {len(payload)}".encode('ascii')]
+        self.writer.write(b"\r\n".join(head) + b"\r\n\r\n" + payload)
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise HTTPError("Connection closed by server")
+        try:
+            status = int(status_line.split()[1])
+        except (IndexError, ValueError):
+            raise HTTPError(f"Bad status line: {status_line[:60]!r}")
+
+        headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            data = await self._read_chunked()
+        elif 'content-length' in headers:
+            data = await self.reader.readexactly(int(headers['content-length']))
+        else:
+            data = await self.reader.read()
+            headers['connection'] = 'close'
+
+        if headers.get('connection', '').lower() == 'close':
+            self.close()
+        return status, data
+
+    async def _read_chunked(self) -> bytes:
+        chunks = []
+        while True:
+            size = int((await self.reader.readline()).split(b';')[0], 16)
+            if size == 0:
+                # Skip trailers up to the blank line
+                while (await self.reader.readline()) not in (b'\r\n', b'\n', b''):
+                    pass
+                return b''.join(chunks)
+            chunks.append(await self.reader.readexactly(size))
+            await self.reader.readexactly(2)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+class Workload:
+    """Builds randomized requests for each kind in the mix"""
+
+    def __init__(self, models: list, years: tuple, seed: int = None):
+        self.models = models
+        self.years = years
+        self.random = random.Random(seed)
+        self._next_model = 0
+
+    def period(self):
+        return self.random.randint(*self.years), self.random.randint(1, 4)
+
+    def build(self, kind: str):
+        """Returns (method, path, body, model or None)"""
+        if kind == 'predict':
+            # Round-robin so even short runs cover every model
+            model = self.models[self._next_model % len(self.models)]
+            self._next_model += 1
+            year, quarter = self.period()
+            return 'POST', '/api/predict', {'model': model, 'year': year, 'quarter': quarter}, model
+        if kind == 'compare':
+            year, quarter = self.period()
+            models = self.random.sample(self.models, min(len(self.models), self.random.randint(2, 5)))
+            return 'POST', '/api/compare', {'models': models, 'year': year, 'quarter': quarter}, None
+        if kind == 'batch':
+            items = []
+            for _ in range(10):
+                year, quarter = self.period()
+                items.append({'model': self.random.choice(self.models), 'year': year, 'quarter': quarter})
+            return 'POST', '/api/predict/batch', {'items': items}, None
+        if kind == 'matrix':
+            year, quarter = self.period()
+            span = self.random.randint(4, 12)
+            last = year * 4 + quarter - 1 + span - 1
+            query = [('from', f"{year}Q{quarter}"), ('to', f"{last // 4}Q{last % 4 + 1}")]
+            query += [('models', name) for name in self.random.sample(self.models, min(2, len(self.models)))]
+            return 'GET', '/api/forecast/matrix?' + urlencode(query), None, None
+        return 'GET', {'models': '/api/models', 'stats': '/api/stats', 'health': '/api/health'}[kind], None, None
+
+
+class Results:
+    """Latencies and errors per request kind and per model"""
+
+    def __init__(self):
+        self.kinds = {}   # kind -> {'latencies': [...], 'errors': {reason: count}}
+        self.models = {}  # model -> same
+
+    def add(self, kind: str, model: str, latency: float, error: str = None):
+        for group, key in ((self.kinds, kind), (self.models, model)):
+            if key is None:
+                continue
+            entry = group.setdefault(key, {'latencies': [], 'errors': {}})
+            entry['latencies'].append(latency)
+            if error is not None:
+                entry['errors'][error] = entry['errors'].get(error, 0) + 1
+
+    def total(self) -> dict:
+        merged = {'latencies': [], 'errors': {}}
+        for entry in self.kinds.values():
+            merged['latencies'].extend(entry['latencies'])
+            for reason, count in entry['errors'].items():
+                merged['errors'][reason] = merged['errors'].get(reason, 0) + count
+        return merged
+
+
+def percentile(sorted_values: list, pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def summarize(entry: dict, elapsed: float) -> dict:
+    """Throughput, latency percentiles (ms) and error rate of one group"""
+    latencies = sorted(entry['latencies'])
+    count = len(latencies)
+    errors = sum(entry['errors'].values())
+    return {
+        'requests': count,
+        'errors': errors,
+        'error_rate': errors / count if count else 0.0,
+        'throughput_rps': count / elapsed if elapsed else 0.0,
+        'mean_ms': sum(latencies) / count * 1000 if count else 0.0,
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p95_ms': percentile(latencies, 95) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+        'max_ms': latencies[-1] * 1000 if latencies else 0.0,
+        'error_reasons': dict(sorted(entry['errors'].items(), key=lambda item: -item[1]))
+    }
+
+
+def parse_mix(text: str) -> dict:
+    """'predict=70,compare=10' -> {'predict': 70.0, 'compare': 10.0}"""
+    mix = {}
+    for part in text.split(','):
+        kind, _, weight = part.partition('=')
+        kind = kind.strip()
+        if kind not in KINDS:
+            raise argparse.ArgumentTypeError(f"Unknown request kind '{kind}' (choose from {', '.join(KINDS)})")
+        try:
+            mix[kind] = float(weight or 1)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"Bad weight in '{part}'")
+    if not any(weight > 0 for weight in mix.values()):
+        raise argparse.ArgumentTypeError("The mix needs at least one positive weight")
+    return mix
+
+
+def parse_years(text: str) -> tuple:
+    first, _, last = text.partition('-')
+    try:
+        return int(first), int(last or first)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected a year range like 2025-2030, got '{text}'")
+
+
+async def fetch_models(url: str, timeout: float) -> list:
+    """Model names from /api/models (falls back to the built-in list)"""
+    connection = Connection(url)
+    try:
+        status, body = await asyncio.wait_for(connection.request('GET', '/api/models'), timeout)
+        if status != 200:
+            raise ValueError(f"HTTP {status}")
+        models = json.loads(body).get('models', {})
+        names = [model['name'] for group in ('ml', 'ts') for model in models.get(group, [])]
+        if not names:
+            raise ValueError("no models listed")
+        return names
+    except Exception as e:
+        print(f"⚠️  Could not read /api/models ({e}); using the built-in model list")
+    finally:
+        connection.close()
+    return list(FALLBACK_MODELS)
+
+
+def classify(status: int, body: bytes) -> str:
+    """Error reason for a response, or None if it succeeded"""
+    if not 200 <= status < 300:
+        return f"HTTP {status}"
+    if body[:1] == b'{':
+        try:
+            if json.loads(body).get('success') is False:
+                return 'success=false'
+        except ValueError:
+            return 'invalid JSON'
+    return None
+
+
+async def virtual_user(url, workload, kinds, weights, args, results, measure_from, deadline):
+    connection = Connection(url)
+    loop = asyncio.get_running_loop()
+    try:
+        while loop.time() < deadline:
+            kind = workload.random.choices(kinds, weights)[0]
+            method, path, body, model = workload.build(kind)
+            start = loop.time()
+            broken = False
+            try:
+                status, data = await asyncio.wait_for(connection.request(method, path, body), args.timeout)
+                error = classify(status, data)
+            except asyncio.TimeoutError:
+                error, broken = 'timeout', True
+            except (OSError, asyncio.IncompleteReadError, HTTPError) as e:
+                error, broken = type(e).__name__, True
+            if start >= measure_from:
+                results.add(kind, model, loop.time() - start, error)
+            if broken:
+                # The connection state is unknown: reconnect, after a short
+                # pause so a down server is not hammered
+                connection.close()
+                await asyncio.sleep(0.05)
+    finally:
+        connection.close()
+
+
+async def report_progress(results: Results, started: float, deadline: float, interval: float = 5.0):
+    loop = asyncio.get_running_loop()
+    while loop.time() + interval < deadline:
+        await asyncio.sleep(interval)
+        total = results.total()
+        elapsed = loop.time() - started
+        print(f"   ⏱  {elapsed:5.0f}s  {len(total['latencies']):>7} requests  "
+              f"{len(total['latencies']) / elapsed:8.1f} req/s  {sum(total['errors'].values())} errors")
+
+
+async def run(args) -> dict:
+    models = args.models or await fetch_models(args.url, args.timeout)
+    workload = Workload(models, args.years, args.seed)
+    kinds = list(args.mix)
+    weights = [args.mix[kind] for kind in kinds]
+    results = Results()
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    measure_from = started + args.warmup
+    deadline = measure_from + args.duration
+
+    print(f"🚀 {args.concurrency} users → {args.url} for {args.duration:g}s "
+          f"(+{args.warmup:g}s warm-up), mix {args.mix}, {len(models)} models")
+    progress = asyncio.ensure_future(report_progress(results, started, deadline))
+    await asyncio.gather(*[
+        virtual_user(args.url, workload, kinds, weights, args, results, measure_from, deadline)
+        for _ in range(args.concurrency)
+    ])
+    progress.cancel()
+    elapsed = loop.time() - measure_from
+
+    return {
+        'started_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'config': {
+            'url': args.url,
+            'concurrency': args.concurrency,
+            'duration_s': args.duration,
+            'warmup_s': args.warmup,
+            'mix': args.mix,
+            'years': list(args.years),
+            'timeout_s': args.timeout,
+            'seed': args.seed,
+            'models': models
+        },
+        'elapsed_s': elapsed,
+        'total': summarize(results.total(), elapsed),
+        'kinds': {kind: summarize(entry, elapsed) for kind, entry in sorted(results.kinds.items())},
+        'models': {model: summarize(entry, elapsed) for model, entry in sorted(results.models.items())}
+    }
+
+
+def print_table(title: str, rows: dict):
+    print(f"\n{title}")
+    print(f"{'':35} {'requests':>9} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8} {'errors':>7}")
+    print("-" * 100)
+    for name, stats in rows.items():
+        print(f"{name[:35]:35} {stats['requests']:>9} {stats['throughput_rps']:>8.1f} {stats['p50_ms']:>8.1f} "
+              f"{stats['p95_ms']:>8.1f} {stats['p99_ms']:>8.1f} {stats['max_ms']:>8.1f} "
+              f"{stats['error_rate'] * 100:>6.1f}%")
+
+
+def print_report(result: dict):
+    print("\n" + "=" * 100)
+    print("LOAD TEST RESULTS")
+    print("=" * 100)
+    print_table("By request type", {**result['kinds'], 'TOTAL': result['total']})
+    if result['models']:
+        print_table("By model (predict requests)", result['models'])
+
+    failing = {name: stats['error_reasons'] for name, stats in {**result['kinds'], **result['models']}.items()
+               if stats['errors']}
+    if failing:
+        print("\n❌ Errors")
+        for name, reasons in failing.items():
+            print(f"   {name}: " + ", ".join(f"{reason} ×{count}" for reason, count in reasons.items()))
+
+
+def print_comparison(before: dict, after: dict):
+    """Side-by-side throughput, latency and error rate of two saved runs"""
+    print("\n" + "=" * 100)
+    print(f"COMPARISON  {before.get('started_at', '?')}  →  {after.get('started_at', '?')}")
+    print("=" * 100)
+    metrics = (('throughput_rps', 'req/s'), ('p50_ms', 'p50 ms'), ('p95_ms', 'p95 ms'),
+               ('p99_ms', 'p99 ms'), ('error_rate', 'errors'))
+    groups = [('TOTAL', before['total'], after['total'])]
+    groups += [(kind, before['kinds'][kind], after['kinds'][kind])
+               for kind in after['kinds'] if kind in before['kinds']]
+    groups += [(model, before['models'][model], after['models'][model])
+               for model in after['models'] if model in before['models']]
+
+    print(f"{'':35} {'metric':>8} {'before':>10} {'after':>10} {'change':>9}")
+    print("-" * 76)
+    for name, old, new in groups:
+        for key, label in metrics:
+            if key == 'error_rate':
+                change = f"{(new[key] - old[key]) * 100:+.1f}pp"
+                old_text, new_text = f"{old[key] * 100:.1f}%", f"{new[key] * 100:.1f}%"
+            else:
+                change = f"{(new[key] / old[key] - 1) * 100:+.1f}%" if old[key] else 'n/a'
+                old_text, new_text = f"{old[key]:.1f}", f"{new[key]:.1f}"
+            print(f"{name[:35] if key == 'throughput_rps' else '':35} {label:>8} {old_text:>10} {new_text:>10} {change:>9}")
+
+
+def load_result(path: str) -> dict:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1].strip())
+    parser.add_argument('--url', default='http://localhost:8000', help='server base URL')
+    parser.add_argument('--concurrency', type=int, default=16, help='virtual users (open connections)')
+    parser.add_argument('--duration', type=float, default=30, help='measured seconds')
+    parser.add_argument('--warmup', type=float, default=2, help='seconds of load before measuring')
+    parser.add_argument('--mix', type=parse_mix, default=parse_mix(DEFAULT_MIX),
+                        help=f'weighted request kinds, e.g. {DEFAULT_MIX} (kinds: {", ".join(KINDS)})')
+    parser.add_argument('--models', nargs='+', help='models to request (default: all from /api/models)')
+    parser.add_argument('--years', type=parse_years, default=(2025, 2030), help='target year range, e.g. 2025-2030')
+    parser.add_argument('--timeout', type=float, default=30, help='per-request timeout in seconds')
+    parser.add_argument('--seed', type=int, help='random seed for a reproducible request sequence')
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    parser.add_argument('--baseline', help='compare the results with a previous JSON results file')
+    parser.add_argument('--max-error-rate', type=float, default=0.0,
+                        help='exit with status 1 above this error rate (0-1)')
+    parser.add_argument('--diff', nargs=2, metavar=('BEFORE', 'AFTER'), help='compare two results files and exit')
+    args = parser.parse_args()
+
+    if args.diff:
+        print_comparison(load_result(args.diff[0]), load_result(args.diff[1]))
+        return 0
+
+    result = asyncio.run(run(args))
+    print_report(result)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 Results written to {args.output}")
+    if args.baseline:
+        print_comparison(load_result(args.baseline), result)
+
+    if result['total']['requests'] == 0:
+        print("\n❌ No requests completed")
+        return 1
+    if result['total']['error_rate'] > args.max_error_rate:
+        print(f"\n❌ Error rate {result['total']['error_rate'] * 100:.2f}% exceeds {args.max_error_rate * 100:.2f}%")
+        return 1
+    print("\n✅ Load test passed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
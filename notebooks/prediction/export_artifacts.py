@@ -0,0 +1,133 @@
+"""
+Loan Sales Prediction - Export native model artifacts
+
+Converts the pickled models listed in model_registry.json to their native
+artifact formats (see app/artifacts.py), checks that every exported model
+reproduces the pickled model's predictions, and records the artifact and
+its format in the registry. Each model gets the first candidate format that
+passes the check (e.g. flattened tree arrays, then the library's own
+format); models without one stay pickled.
+
+Usage:
+    python notebooks/prediction/export_artifacts.py
+"""
+
+import json
+import pickle
+import sys
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+warnings.filterwarnings('ignore')
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.artifacts import candidate_formats, load_artifact, save_artifact
+
+MODELS_DIR = Path(__file__).resolve().parent / 'models'
+DATA_DIR = PROJECT_ROOT / 'notebooks' / 'data'
+
+PARITY_RTOL = 1e-9
+PARITY_STEPS = 24
+
+
+def parity_inputs():
+    """PCA rows for the ML checks, including rows well outside the training range"""
+    df_pca = pd.read_csv(DATA_DIR / 'pca_features.csv')
+    X = df_pca[['PC1', 'PC2', 'PC3', 'PC4', 'PC5', 'PC6']].values
+    # Include rows well outside the training range (extrapolated quarters)
+    X = np.vstack([X, X * 1.5, X - 2.0])
+    return X
+
+
+def model_output(model, info, X, exog=None):
+    """Predictions used to compare an exported artifact with its pickle"""
+    if info['type'] == 'ml':
+        return np.asarray(model.predict(X), dtype=np.float64)
+    if exog is not None:
+        return np.asarray(model.forecast(steps=PARITY_STEPS, exog=exog), dtype=np.float64)
+    return np.asarray(model.forecast(steps=PARITY_STEPS), dtype=np.float64)
+
+
+def export_checked(model, name, info, output_dir, X):
+    """Write the first candidate format that reproduces `model`'s predictions
+
+    Returns:
+        Tuple (artifact, format), or None when only the pickle is usable
+    """
+    # Time trend continuing the training index, for models fitted with exog
+    exog = None
+    if info['type'] == 'timeseries' and model.model.exog is not None:
+        n_obs = len(model.model.endog)
+        exog = np.arange(n_obs, n_obs + PARITY_STEPS).reshape(-1, 1)
+
+    expected = model_output(model, info, X, exog)
+    stem = Path(info['filename']).stem
+
+    for fmt in candidate_formats(model):
+        if fmt == 'pickle':
+            return None
+        try:
+            artifact, fmt = save_artifact(model, output_dir, stem, fmt)
+        except ValueError as e:
+            print(f"   ➖ {name}: no {fmt} artifact ({str(e)})")
+            continue
+
+        actual = model_output(load_artifact(Path(output_dir) / artifact, fmt), info, X, exog)
+        if np.allclose(actual, expected, rtol=PARITY_RTOL, atol=0):
+            return artifact, fmt
+
+        (Path(output_dir) / artifact).unlink()
+        worst = np.max(np.abs(actual - expected) / np.maximum(np.abs(expected), 1e-12))
+        print(f"   ❌ {name}: {fmt} artifact differs from pickle (max rel err {worst:.2e})")
+
+    return None
+
+
+def export_model(name, info, X):
+    """Export one registry model; returns (artifact, format) or None to keep the pickle"""
+    with open(MODELS_DIR / info['filename'], 'rb') as f:
+        model = pickle.load(f)
+    return export_checked(model, name, info, MODELS_DIR, X)
+
+
+def main():
+    """Export every registry model and update model_registry.json"""
+    print("\n" + "="*80)
+    print("📦 EXPORTING NATIVE MODEL ARTIFACTS")
+    print("="*80 + "\n")
+
+    registry_path = MODELS_DIR / 'model_registry.json'
+    with open(registry_path, 'r', encoding='utf-8') as f:
+        registry = json.load(f)
+
+    X = parity_inputs()
+
+    for group in ('ml_models', 'ts_models'):
+        for name, info in registry[group].items():
+            previous = info.get('artifact')
+            exported = export_model(name, info, X)
+            if exported is None:
+                info.pop('artifact', None)
+                info['format'] = 'pickle'
+                print(f"   ➖ {name:35} {'pickle':<11} {info['filename']}")
+            else:
+                info['artifact'], info['format'] = exported
+                print(f"   ✅ {name:35} {info['format']:<11} {info['artifact']}")
+
+            # Remove the artifact this model was served from before, if replaced
+            if previous and previous != info.get('artifact') and (MODELS_DIR / previous).exists():
+                (MODELS_DIR / previous).unlink()
+
+    with open(registry_path, 'w', encoding='utf-8') as f:
+        json.dump(registry, f, indent=2, ensure_ascii=False)
+
+    print(f"\n✅ Model registry updated: {registry_path}")
+
+
+if __name__ == "__main__":
+    main()
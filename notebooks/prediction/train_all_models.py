@@ -16,9 +16,14 @@ import numpy as np
 from pathlib import Path
 import pickle
 import json
+import sys
 import warnings
 warnings.filterwarnings('ignore')
 
+# Artifact formats are shared with the web app
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from export_artifacts import export_checked, parity_inputs
+
 # ML Models
 from sklearn.model_selection import train_test_split, cross_val_score
 from sklearn.preprocessing import StandardScaler
@@ -395,6 +400,9 @@ def save_all_models(ml_models, ts_models, ml_results, ts_results, output_dir='mo
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
+    # Rows used to check every exported artifact against the trained model
+    X_parity = parity_inputs()
+
     model_registry = {
         'ml_models': {},
         'ts_models': {},
@@ -419,8 +427,16 @@ def save_all_models(ml_models, ts_models, ml_results, ts_results, output_dir='mo
         model_registry['ml_models'][name] = {
             'filename': filename,
             'type': 'ml',
-            'metrics': ml_results.get(name, {})
+            'metrics': ml_results.get(name, {}),
+            'format': 'pickle'
         }
+
+        # Format served by the web app (tree arrays, boosters, coefficients)
+        exported = export_checked(model, name, model_registry['ml_models'][name], output_path, X_parity)
+        if exported is not None:
+            artifact, fmt = exported
+            model_registry['ml_models'][name].update({'artifact': artifact, 'format': fmt})
+            filename = f"{filename} + {artifact}"
         print(f"   ✅ {name} → {filename}")
 
     # Save time series models
@@ -436,8 +452,16 @@ def save_all_models(ml_models, ts_models, ml_results, ts_results, output_dir='mo
         model_registry['ts_models'][name] = {
             'filename': filename,
             'type': 'timeseries',
-            'metrics': ts_results.get(name, {})
+            'metrics': ts_results.get(name, {}),
+            'format': 'pickle'
         }
+
+        # Params + state instead of the full statsmodels results object
+        exported = export_checked(model, name, model_registry['ts_models'][name], output_path, X_parity)
+        if exported is not None:
+            artifact, fmt = exported
+            model_registry['ts_models'][name].update({'artifact': artifact, 'format': fmt})
+            filename = f"{filename} + {artifact}"
         print(f"   ✅ {name} → {filename}")
 
     # Save model registry
@@ -0,0 +1,33 @@
+"""
+Loan Sales Prediction - Shared test fixtures
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.dataset import PCA_COLUMNS, TARGET, read_columns
+
+DATA_DIR = PROJECT_ROOT / 'notebooks' / 'data'
+
+# Same tolerance export_artifacts.py requires of an exported artifact
+PARITY_RTOL = 1e-9
+
+
+@pytest.fixture(scope='session')
+def sales():
+    """Complete quarterly sales observations, as the time series models are trained on"""
+    values = read_columns(DATA_DIR / 'ml_ready_data.csv', ['Year', 'Quarter', TARGET])[:, 2]
+    return values[~np.isnan(values)]
+
+
+@pytest.fixture(scope='session')
+def pca_rows():
+    """PCA feature rows plus rows well outside the training range"""
+    X = read_columns(DATA_DIR / 'pca_features.csv', PCA_COLUMNS)
+    return np.vstack([X, X * 1.5, X - 2.0])
@@ -0,0 +1,175 @@
+"""
+Dataset snapshot lookups against the original per-request pandas logic
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.dataset import PCA_COLUMNS, TARGET, DatasetSnapshot
+from conftest import DATA_DIR
+
+
+def baseline_features(df_orig, df_pca, year, quarter):
+    """prepare_ml_features(year, quarter) as it read the CSVs on every request"""
+    matching_rows = df_orig[(df_orig['Year'] == year) & (df_orig['Quarter'] == quarter)]
+    if not matching_rows.empty:
+        idx = matching_rows.index[0]
+        if idx < len(df_pca):
+            return df_pca[PCA_COLUMNS].iloc[idx].values
+
+    last_year = int(df_orig['Year'].iloc[-2])
+    last_quarter = int(df_orig['Quarter'].iloc[-2])
+    quarters_ahead = (year - last_year) * 4 + (quarter - last_quarter)
+
+    if quarters_ahead > 0:
+        lookback = min(8, len(df_pca))
+        recent_features = df_pca[PCA_COLUMNS].iloc[-lookback:].values
+        trends = [np.polyfit(np.arange(len(recent_features)), recent_features[:, i], 1)[0] for i in range(6)]
+        extrapolated = df_pca[PCA_COLUMNS].iloc[-2].values + np.array(trends) * quarters_ahead
+
+        quarter_mask = df_orig['Quarter'] == quarter
+        if quarter_mask.sum() > 0:
+            valid_indices = [i for i in df_orig[quarter_mask].index if i < len(df_pca)]
+            if len(valid_indices) >= 2:
+                quarter_features = df_pca.iloc[valid_indices][PCA_COLUMNS].values
+                seasonal_adjustment = quarter_features.mean(axis=0) - df_pca[PCA_COLUMNS].mean().values
+                extrapolated += seasonal_adjustment * 0.5
+        return extrapolated
+
+    return df_pca[PCA_COLUMNS].iloc[-2].values
+
+
+def baseline_history(df_orig, year, quarter, years_back):
+    """get_historical_sales(year, quarter, years_back) as it read the CSV on every request"""
+    df = df_orig[['Year', 'Quarter', TARGET]].dropna()
+    historical = []
+    for i in range(1, years_back + 1):
+        row = df[(df['Year'] == year - i) & (df['Quarter'] == quarter)]
+        if not row.empty:
+            historical.append((int(year - i), float(row[TARGET].iloc[0])))
+    return historical
+
+
+def write_dataset(directory, periods, sales, n_pca, seed=0):
+    """ml_ready_data.csv / pca_features.csv with the given rows and `n_pca` PCA rows"""
+    rng = np.random.default_rng(seed)
+    years, quarters = zip(*periods)
+    pd.DataFrame({'Year': years, 'Quarter': quarters, TARGET: sales}).to_csv(
+        directory / 'ml_ready_data.csv', index=False
+    )
+    pd.DataFrame(rng.normal(size=(n_pca, 6)), columns=PCA_COLUMNS).to_csv(
+        directory / 'pca_features.csv', index=False
+    )
+    return directory
+
+
+@pytest.fixture(params=['shipped', 'synthetic'])
+def data_dir(request, tmp_path):
+    """The shipped CSVs, and a small dataset with a duplicated period, a gap
+    and ml_ready rows past the last PCA row"""
+    if request.param == 'shipped':
+        return DATA_DIR
+    periods = [(2021, 1), (2021, 2), (2021, 3), (2021, 3), (2021, 4), (2022, 1), (2022, 3), (2022, 4), (2023, 1)]
+    sales = [10.0, 20.0, 30.0, 31.0, np.nan, 50.0, 60.0, 70.0, np.nan]
+    return write_dataset(tmp_path, periods, sales, n_pca=7)
+
+
+@pytest.fixture
+def frames(data_dir):
+    # The snapshot parses values like float(); pandas' default parser can
+    # differ from it in the last bit
+    return tuple(
+        pd.read_csv(data_dir / name, float_precision='round_trip')
+        for name in ('ml_ready_data.csv', 'pca_features.csv')
+    )
+
+
+@pytest.fixture
+def snapshot(data_dir):
+    return DatasetSnapshot.from_files(data_dir / 'ml_ready_data.csv', data_dir / 'pca_features.csv', 'test')
+
+
+def period_grid():
+    """Every quarter from before the data to well past it, plus invalid quarters"""
+    years, quarters = np.meshgrid(np.arange(2018, 2031), np.arange(-1, 7), indexing='ij')
+    return years.ravel(), quarters.ravel()
+
+
+def test_feature_rows_match_baseline(frames, snapshot):
+    df_orig, df_pca = frames
+    years, quarters = period_grid()
+
+    rows = snapshot.features.rows(years, quarters)
+
+    expected = [baseline_features(df_orig, df_pca, int(y), int(q)) for y, q in zip(years, quarters)]
+    np.testing.assert_allclose(rows, expected, rtol=1e-12, atol=1e-12)
+
+
+def test_feature_rows_past_the_last_pca_row_are_extrapolated(frames, snapshot):
+    df_orig, df_pca = frames
+    # ml_ready rows without a PCA row of their own
+    tail = df_orig.iloc[len(df_pca):]
+    assert len(tail)
+
+    rows = snapshot.features.rows(tail['Year'], tail['Quarter'])
+
+    expected = [baseline_features(df_orig, df_pca, int(y), int(q)) for y, q in zip(tail['Year'], tail['Quarter'])]
+    np.testing.assert_allclose(rows, expected, rtol=1e-12, atol=1e-12)
+
+
+def test_feature_rows_for_duplicate_periods(snapshot):
+    years, quarters = [2021, 2030, 2021, 2030], [3, 2, 3, 2]
+
+    rows = snapshot.features.rows(years, quarters)
+
+    np.testing.assert_array_equal(rows[0], rows[2])
+    np.testing.assert_array_equal(rows[1], rows[3])
+
+
+def test_feature_rows_for_an_empty_grid(snapshot):
+    assert snapshot.features.rows([], []).shape == (0, 6)
+
+
+def history_records(same_quarter, year, years_back):
+    return [(int(year - i), float(sales)) for i, sales in enumerate(same_quarter, start=1) if not np.isnan(sales)]
+
+
+def test_same_quarter_history_matches_baseline(frames, snapshot):
+    df_orig, _ = frames
+    years, quarters = period_grid()
+
+    sales = snapshot.history.same_quarter(years, quarters, years_back=5)
+
+    assert sales.shape == (len(years), 5)
+    for row, year, quarter in zip(sales, years, quarters):
+        assert history_records(row, year, 5) == baseline_history(df_orig, int(year), int(quarter), 5)
+
+
+def test_lookup_for_invalid_quarters_and_outside_the_grid(snapshot):
+    sales = snapshot.history.lookup([2021, 2021, 2021, 1990, 2100], [0, 5, -3, 1, 1])
+
+    assert np.isnan(sales).all()
+
+
+def test_lookup_for_duplicate_periods(frames, snapshot):
+    df_orig, _ = frames
+    years, quarters = [2022, 2021, 2022, 2021], [1, 3, 1, 3]
+
+    sales = snapshot.history.lookup(years, quarters)
+
+    np.testing.assert_array_equal(sales[:2], sales[2:])
+    expected = [baseline_history(df_orig, y + 1, q, 1) for y, q in zip(years[:2], quarters[:2])]
+    assert [[(y, float(s))] for y, s in zip(years[:2], sales[:2])] == expected
+
+
+def test_history_for_an_empty_grid(snapshot):
+    assert snapshot.history.lookup([], []).shape == (0,)
+    assert snapshot.history.same_quarter([], [], years_back=5).shape == (0, 5)
+
+
+def test_index_without_complete_observations(tmp_path):
+    data_dir = write_dataset(tmp_path, [(2021, 1), (2021, 2)], [np.nan, np.nan], n_pca=2)
+    snapshot = DatasetSnapshot.from_files(data_dir / 'ml_ready_data.csv', data_dir / 'pca_features.csv', 'test')
+
+    assert np.isnan(snapshot.history.same_quarter([2022, 2023], [1, 2], years_back=3)).all()
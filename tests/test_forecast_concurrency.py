@@ -0,0 +1,74 @@
+"""
+Concurrent forecasts from one shared statsmodels results object
+"""
+
+import asyncio
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+from statsmodels.tsa.arima.model import ARIMA
+from statsmodels.tsa.statespace.sarimax import SARIMAX
+
+import app.main as main
+from app.inference import InferencePool
+
+THREADS = 8
+CALLS = 480
+
+
+@pytest.fixture(scope='module')
+def series():
+    """Sales with a quarterly PeriodIndex, as train_all_models.py fits the time series models"""
+    data = main.load_historical_data()
+    index = pd.PeriodIndex.from_fields(year=data.hist_years, quarter=data.hist_quarters, freq='Q')
+    return pd.Series(data.hist_sales, index=index)
+
+
+def fit(name, series):
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        if name == 'ARIMA(1,1,1)':
+            return ARIMA(series, order=(1, 1, 1)).fit()
+        exog = np.arange(len(series)).reshape(-1, 1)
+        return SARIMAX(series, exog=exog, order=(1, 1, 1), seasonal_order=(1, 1, 1, 4)).fit(disp=False)
+
+
+@pytest.mark.parametrize('name', ['ARIMA(1,1,1)', 'SARIMAX(1,1,1)(1,1,1,4)'])
+def test_shared_results_object_forecasts_consistently(series, name):
+    # A statsmodels results object, as served from the pickle/statespace formats
+    model = fit(name, series)
+    # Alternating horizons resize statsmodels' internal arrays between calls
+    steps = [12 if i % 2 else 20 for i in range(CALLS)]
+    expected = {n: main._forecast_ts(model, n, name) for n in set(steps)}
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            results = list(executor.map(lambda n: main._forecast_ts(model, n, name), steps))
+
+    for n, result in zip(steps, results):
+        np.testing.assert_array_equal(result, expected[n])
+
+
+def test_inference_pool_forecasts_consistently(series):
+    name = 'SARIMAX(1,1,1)(1,1,1,4)'
+    model = fit(name, series)
+    steps = [12 if i % 2 else 20 for i in range(CALLS)]
+    expected = {n: main._forecast_ts(model, n, name) for n in set(steps)}
+    pool = InferencePool(workers=main.INFERENCE_WORKERS, queue_limit=CALLS, timeout=60)
+
+    async def run_all():
+        return await asyncio.gather(*(pool.run(main._forecast_ts, model, n, name) for n in steps))
+
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            results = asyncio.run(run_all())
+    finally:
+        pool.shutdown()
+
+    for n, trajectory in zip(steps, results):
+        np.testing.assert_array_equal(trajectory, expected[n])
@@ -0,0 +1,39 @@
+"""
+Vectorized forecast table lookups against the scalar lookup
+"""
+
+import numpy as np
+
+from app.dataset import quarter_range
+from app.forecast_table import ForecastTable
+
+
+def make_table():
+    predictions = np.arange(2 * 8, dtype=np.float64).reshape(2, 8)
+    predictions[1, 3] = np.nan  # failed forecast
+    return ForecastTable(['A', 'B'], 2025, 3, predictions, predictions * 1.1, predictions * 0.9, 'v1')
+
+
+def test_lookup_many_matches_lookup():
+    table = make_table()
+    years, quarters = quarter_range(2024, 4, 2027, 3)
+
+    for name in ('A', 'B'):
+        covered, predictions, optimistic, pessimistic = table.lookup_many(name, years, quarters)
+        for i, (year, quarter) in enumerate(zip(years, quarters)):
+            expected = table.lookup(name, int(year), int(quarter))
+            assert covered[i] == (expected is not None)
+            if expected is not None:
+                np.testing.assert_array_equal([predictions[i], optimistic[i], pessimistic[i]], expected)
+            else:
+                assert np.isnan([predictions[i], optimistic[i], pessimistic[i]]).all()
+
+
+def test_lookup_many_unknown_model_and_invalid_quarters():
+    table = make_table()
+
+    covered, predictions, _, _ = table.lookup_many('C', [2026], [1])
+    assert not covered.any() and np.isnan(predictions).all()
+
+    covered, _, _, _ = table.lookup_many('A', [2026, 2026], [0, 5])
+    assert not covered.any()
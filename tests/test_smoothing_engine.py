@@ -0,0 +1,124 @@
+"""
+Closed-form Holt-Winters forecasts against statsmodels ExponentialSmoothing
+"""
+
+import json
+import pickle
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
+from app.artifacts import load_artifact
+from app.smoothing_engine import HoltWintersForecaster
+from conftest import PARITY_RTOL, PROJECT_ROOT
+
+QUARTERS_AHEAD = 40
+MODELS_DIR = PROJECT_ROOT / 'notebooks' / 'prediction' / 'models'
+
+# (trend, damped, seasonal) combinations the forecaster supports
+SUPPORTED = [
+    (trend, damped, seasonal)
+    for trend in ('add', 'mul', None)
+    for damped in (False, True)
+    for seasonal in ('add', 'mul', None)
+    if not (damped and trend != 'add')
+]
+
+
+def smooth(series, trend, damped, seasonal, **kwargs):
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        return ExponentialSmoothing(
+            series, trend=trend, damped_trend=damped, seasonal=seasonal,
+            seasonal_periods=4 if seasonal else None, **kwargs
+        ).fit()
+
+
+@pytest.mark.parametrize(
+    'trend, damped, seasonal', SUPPORTED,
+    ids=[f"{t}{'-damped' if d else ''}/{s}" for t, d, s in SUPPORTED]
+)
+def test_closed_form_matches_statsmodels(sales, trend, damped, seasonal):
+    fitted = smooth(sales, trend, damped, seasonal)
+
+    forecast = HoltWintersForecaster.from_results(fitted).forecast(QUARTERS_AHEAD)
+
+    np.testing.assert_allclose(forecast, fitted.forecast(QUARTERS_AHEAD), rtol=PARITY_RTOL, atol=0)
+
+
+def test_season_uses_statsmodels_forecast_order(sales):
+    # statsmodels does not forecast with the last m fitted seasonal terms;
+    # the first season it uses is s[n-m], the last is s[n-m-1]
+    fitted = smooth(sales, None, False, 'add')
+    season = np.asarray(fitted.season)
+    level = np.asarray(fitted.level)[-1]
+
+    forecaster = HoltWintersForecaster.from_results(fitted)
+
+    np.testing.assert_array_equal(forecaster.season, np.r_[season[-4:-1], season[-5]])
+    np.testing.assert_allclose(fitted.forecast(4) - level, forecaster.season, rtol=PARITY_RTOL)
+
+
+def test_any_horizons_at_once(sales):
+    forecaster = HoltWintersForecaster.from_results(smooth(sales, 'add', True, 'mul'))
+    horizons = np.array([7, 1, QUARTERS_AHEAD, 4, 5, 7])
+
+    np.testing.assert_array_equal(
+        forecaster.predict_horizons(horizons), forecaster.forecast(QUARTERS_AHEAD)[horizons - 1]
+    )
+    assert forecaster.predict_horizons([]).shape == (0,)
+
+
+def test_shared_instance_forecasts_from_many_threads(sales):
+    # The server forecasts from one cached instance on every inference worker
+    forecaster = HoltWintersForecaster.from_results(smooth(sales, 'add', True, 'add'))
+    horizons = [QUARTERS_AHEAD if i % 2 else 9 for i in range(400)]
+    expected = {h: forecaster.forecast(h) for h in set(horizons)}
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        forecasts = list(executor.map(forecaster.forecast, horizons))
+
+    for h, forecast in zip(horizons, forecasts):
+        np.testing.assert_array_equal(forecast, expected[h])
+
+
+def test_hwforecast_artifact_round_trip(sales, tmp_path):
+    fitted = smooth(sales, 'add', True, 'mul')
+    HoltWintersForecaster.from_results(fitted).save(tmp_path / 'model.hw')
+
+    loaded = load_artifact(tmp_path / 'model.hw', 'hwforecast')
+
+    np.testing.assert_allclose(loaded.forecast(QUARTERS_AHEAD), fitted.forecast(QUARTERS_AHEAD), rtol=PARITY_RTOL, atol=0)
+
+
+def test_shipped_artifact_matches_its_pickle():
+    info = json.loads((MODELS_DIR / 'model_registry.json').read_text(encoding='utf-8'))['ts_models']['Holt-Winters']
+    try:
+        with open(MODELS_DIR / info['filename'], 'rb') as f:
+            pickled = pickle.load(f)
+    except Exception as e:
+        pytest.skip(f"pickle cannot be loaded here: {e}")
+
+    artifact = load_artifact(MODELS_DIR / info['artifact'], info['format'])
+
+    np.testing.assert_allclose(
+        artifact.forecast(QUARTERS_AHEAD), np.asarray(pickled.forecast(QUARTERS_AHEAD)), rtol=PARITY_RTOL, atol=0
+    )
+
+
+@pytest.mark.parametrize('seasonal', ['add', 'mul', None])
+def test_damped_multiplicative_trend_is_rejected(sales, seasonal):
+    fitted = smooth(sales, 'mul', True, seasonal)
+
+    with pytest.raises(ValueError, match="Damped multiplicative"):
+        HoltWintersForecaster.from_results(fitted)
+
+
+def test_box_cox_is_rejected(sales):
+    fitted = smooth(sales, 'add', False, 'add', use_boxcox=True)
+
+    with pytest.raises(ValueError, match="Box-Cox"):
+        HoltWintersForecaster.from_results(fitted)
@@ -0,0 +1,117 @@
+"""
+Flattened tree ensembles against the libraries' own predictions
+"""
+
+import numpy as np
+import pytest
+from sklearn.ensemble import AdaBoostRegressor, GradientBoostingRegressor, RandomForestRegressor
+from sklearn.tree import DecisionTreeRegressor
+
+from app import tree_engine
+from app.dataset import PCA_COLUMNS, TARGET, read_columns
+from app.tree_engine import TreeEnsemble
+from conftest import DATA_DIR, PARITY_RTOL
+
+
+def xgboost_model():
+    xgboost = pytest.importorskip('xgboost')
+    return xgboost.XGBRegressor(n_estimators=100, max_depth=3, learning_rate=0.1, random_state=42, verbosity=0)
+
+
+def lightgbm_model():
+    lightgbm = pytest.importorskip('lightgbm')
+    # min_child_samples is lowered so the ~20 training rows actually split
+    return lightgbm.LGBMRegressor(
+        n_estimators=100, max_depth=3, learning_rate=0.1, min_child_samples=2, random_state=42, verbosity=-1
+    )
+
+
+def catboost_model():
+    catboost = pytest.importorskip('catboost')
+    return catboost.CatBoostRegressor(iterations=100, depth=3, learning_rate=0.1, random_state=42, verbose=0,
+                                      allow_writing_files=False)
+
+
+# Same settings as train_all_models.py
+MODELS = {
+    'Decision Tree': lambda: DecisionTreeRegressor(max_depth=5, random_state=42),
+    'Random Forest': lambda: RandomForestRegressor(n_estimators=100, max_depth=5, min_samples_split=3, random_state=42),
+    'Gradient Boosting': lambda: GradientBoostingRegressor(n_estimators=100, max_depth=3, learning_rate=0.1, random_state=42),
+    'AdaBoost': lambda: AdaBoostRegressor(n_estimators=100, learning_rate=0.1, random_state=42),
+    'XGBoost': xgboost_model,
+    'LightGBM': lightgbm_model,
+    'CatBoost': catboost_model,
+}
+
+
+@pytest.fixture(scope='module')
+def training_set():
+    """PCA features and sales of the quarters with published sales"""
+    data = read_columns(DATA_DIR / 'pca_features.csv', PCA_COLUMNS + [TARGET])
+    data = data[~np.isnan(data).any(axis=1)]
+    return data[:, :-1], data[:, -1]
+
+
+@pytest.fixture(scope='module')
+def fitted(training_set):
+    """Trained models by name, built lazily so a missing library only skips its own tests"""
+    cache = {}
+
+    def get(name):
+        if name not in cache:
+            cache[name] = MODELS[name]().fit(*training_set)
+        return cache[name]
+    return get
+
+
+@pytest.mark.parametrize('name', list(MODELS))
+def test_flatten_matches_library(fitted, pca_rows, name):
+    model = fitted(name)
+    assert tree_engine.supports(model)
+
+    ensemble = tree_engine.flatten(model, name)
+
+    np.testing.assert_allclose(ensemble.predict(pca_rows), model.predict(pca_rows), rtol=PARITY_RTOL, atol=0)
+
+
+def test_float32_boundary_rows_follow_the_library(fitted, pca_rows):
+    # Rows sitting exactly on (and next to) split thresholds exercise the
+    # float32 comparison rules
+    model = fitted('Decision Tree')
+    tree = model.tree_
+    splits = tree.feature >= 0
+    rows = np.repeat(pca_rows[:1], splits.sum() * 3, axis=0)
+    for k, (feature, threshold) in enumerate(zip(tree.feature[splits], tree.threshold[splits])):
+        rows[3 * k:3 * k + 3, feature] = [threshold, np.nextafter(threshold, np.inf), np.nextafter(threshold, -np.inf)]
+
+    ensemble = tree_engine.flatten(model)
+
+    np.testing.assert_array_equal(ensemble.predict(rows), model.predict(rows))
+
+
+def test_save_load_round_trip(fitted, pca_rows, tmp_path):
+    model = fitted('Random Forest')
+    path = tmp_path / 'model.tree'
+    tree_engine.flatten(model, 'Random Forest').save(path)
+
+    loaded = TreeEnsemble.load(path)
+
+    np.testing.assert_array_equal(loaded.predict(pca_rows), tree_engine.flatten(model).predict(pca_rows))
+
+
+def test_concat_matches_single_models(fitted, pca_rows):
+    names = ['Decision Tree', 'Random Forest', 'Gradient Boosting', 'AdaBoost']
+    singles = [tree_engine.flatten(fitted(name), name) for name in names]
+
+    fused = TreeEnsemble.concat(singles)
+
+    assert fused.names == names
+    np.testing.assert_array_equal(fused.predict_all(pca_rows), [single.predict(pca_rows) for single in singles])
+
+
+def test_unsupported_model_is_rejected():
+    from sklearn.linear_model import Ridge
+
+    assert not tree_engine.supports(Ridge())
+    with pytest.raises(ValueError, match="not a supported tree model"):
+        tree_engine.flatten(Ridge())